@@ -0,0 +1,47 @@
+import argparse
+import json
+import time
+from src.shop import shop_json
+from src.shop.shop_app import ShopApp
+from src.shop.shop_server import ShopServer
+
+
+def best_of(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoders on large collection payloads")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--items-per-order', type=int, default=10)
+    arguments = parser.parse_args()
+    decoders = {'text+json': lambda content: json.loads(content.decode('utf-8')), **shop_json.decoders}
+    print('default backend: ' + shop_json.backend)
+    print('{:>8} {:<22} {:<10} {:>11} {:>9}'.format('size', 'scenario', 'decoder', 'ms', 'speedup'))
+    for size in arguments.sizes:
+        shop_server = ShopServer()
+        shop_server.store.seed(max(1, size // 10), 100, 10, arguments.items_per_order)
+        content = json.dumps(shop_server.store.page('orders')).encode('utf-8')
+        baseline = None
+        for name, loads in decoders.items():
+            elapsed = best_of(lambda: loads(content), arguments.repeat)
+            baseline = baseline or elapsed
+            print('{:>8} {:<22} {:<10} {:>11.3f} {:>8.2f}x'.format(size, 'decode orders', name, elapsed * 1000, baseline / elapsed))
+        shop_server.start()
+        baseline = None
+        for name, loads in decoders.items():
+            with ShopApp(shop_server.api_url, json_loads=loads) as shop_app:
+                elapsed = best_of(lambda: list(shop_app.iter_orders(size + 1)), arguments.repeat)
+            baseline = baseline or elapsed
+            print('{:>8} {:<22} {:<10} {:>11.3f} {:>8.2f}x'.format(size, 'fetch orders', name, elapsed * 1000, baseline / elapsed))
+        shop_server.stop()
+
+
+if __name__ == '__main__':
+    main()
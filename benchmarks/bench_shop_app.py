@@ -0,0 +1,104 @@
+import argparse
+from contextlib import ExitStack
+import itertools
+import time
+from src.shop.shop_app import ShopApp
+from src.shop.shop_server import ShopServer
+
+
+def percentile(timings, fraction):
+    return timings[min(len(timings) - 1, int(len(timings) * fraction))]
+
+
+def measure(function, arguments):
+    timings = []
+    start = time.perf_counter()
+    for argument in arguments:
+        call_start = time.perf_counter()
+        function(*argument)
+        timings.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    timings.sort()
+    return {
+        'calls': len(timings),
+        'throughput': len(timings) / elapsed,
+        'p50': percentile(timings, 0.50),
+        'p95': percentile(timings, 0.95),
+        'p99': percentile(timings, 0.99)
+    }
+
+
+def fresh_apps(stack, api_url, count):
+    shop_apps = []
+    for _ in range(count):
+        shop_app = stack.enter_context(ShopApp(api_url))
+        shop_app.download_client(0)
+        shop_apps.append((shop_app,))
+    return shop_apps
+
+
+def scenarios(shop_app, size, repeat, stack):
+    counter = itertools.count()
+
+    def ids(count):
+        return [(i * 7919 % size,) for i in range(count)]
+
+    collection_repeat = max(5, repeat // 10)
+    api_url = shop_app.shop_database.api_url
+    ids_clients = [(shop_app.register_client('Name', 'Surname', 'removed_' + str(next(counter)) + '@example.com'),) for _ in range(repeat)]
+    ids_items = [(shop_app.add_item('Removed', 1.99),) for _ in range(repeat)]
+    ids_orders = [(shop_app.make_order(0, [0]),) for _ in range(repeat)]
+    return [
+        ('register_client', shop_app.register_client, [('Name', 'Surname', 'new_' + str(next(counter)) + '@example.com') for _ in range(repeat)]),
+        ('register_clients', shop_app.register_clients, [
+            ([('Name', 'Surname', 'batch_' + str(next(counter)) + '@example.com') for _ in range(100)],)
+            for _ in range(max(1, repeat // 10))
+        ]),
+        ('download_client', shop_app.download_client, ids(repeat)),
+        ('download_all_clients', lambda fresh_app: fresh_app.download_all_clients(), fresh_apps(stack, api_url, collection_repeat)),
+        ('download_all_clients_304', shop_app.download_all_clients, [()] * collection_repeat),
+        ('iter_clients', lambda: list(shop_app.iter_clients()), [()] * collection_repeat),
+        ('modify_client', shop_app.modify_client, [(i, 'Renamed') for (i,) in ids(repeat)]),
+        ('remove_client', shop_app.remove_client, ids_clients),
+        ('add_item', shop_app.add_item, [('New', 9.99)] * repeat),
+        ('add_items', shop_app.add_items, [([('New', 9.99)] * 100,)] * max(1, repeat // 10)),
+        ('download_item', shop_app.download_item, ids(repeat)),
+        ('download_all_items', lambda fresh_app: fresh_app.download_all_items(), fresh_apps(stack, api_url, collection_repeat)),
+        ('download_all_items_304', shop_app.download_all_items, [()] * collection_repeat),
+        ('iter_items', lambda: list(shop_app.iter_items()), [()] * collection_repeat),
+        ('modify_item', shop_app.modify_item, [(i, None, 4.99) for (i,) in ids(repeat)]),
+        ('remove_item', shop_app.remove_item, ids_items),
+        ('make_order', shop_app.make_order, [(i, [i, i]) for (i,) in ids(repeat)]),
+        ('make_orders', shop_app.make_orders, [([(i, [i, i]) for (i,) in ids(100)],)] * max(1, repeat // 10)),
+        ('download_order', shop_app.download_order, ids(repeat)),
+        ('download_all_orders', lambda fresh_app: fresh_app.download_all_orders(), fresh_apps(stack, api_url, collection_repeat)),
+        ('download_all_orders_304', shop_app.download_all_orders, [()] * collection_repeat),
+        ('iter_orders', lambda: list(shop_app.iter_orders()), [()] * collection_repeat),
+        ('modify_order', shop_app.modify_order, [(i, None, [0, 1]) for (i,) in ids(repeat)]),
+        ('remove_order', shop_app.remove_order, ids_orders),
+        ('get_client_orders', shop_app.get_client_orders, ids(repeat)),
+        ('get_order_total', shop_app.get_order_total, ids(repeat))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ShopApp against the embedded reference backend")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--items-per-order', type=int, default=10)
+    arguments = parser.parse_args()
+    print('{:>8} {:<24} {:>7} {:>11} {:>9} {:>9} {:>9}'.format('size', 'method', 'calls', 'calls/s', 'p50 ms', 'p95 ms', 'p99 ms'))
+    for size in arguments.sizes:
+        shop_server = ShopServer()
+        shop_server.store.seed(size, size, 2, arguments.items_per_order)
+        with shop_server, ShopApp(shop_server.api_url) as shop_app, ExitStack() as stack:
+            for name, function, calls in scenarios(shop_app, size, arguments.repeat, stack):
+                result = measure(function, calls)
+                print('{:>8} {:<24} {:>7} {:>11.1f} {:>9.3f} {:>9.3f} {:>9.3f}'.format(
+                    size, name, result['calls'], result['throughput'],
+                    result['p50'] * 1000, result['p95'] * 1000, result['p99'] * 1000
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+_item_catalog = None
+
+
+class SalesReport:
+    def __init__(self):
+        self.orders = 0
+        self.revenue_cents = 0
+        self.orders_by_client = Counter()
+        self.spend_by_client = Counter()
+        self.quantity_by_item = Counter()
+        self.revenue_by_item = Counter()
+
+    def add(self, order, item_catalog):
+        ids_items = order['ids_items']
+        prices_cents = item_catalog.prices_cents(ids_items)
+        total_cents = sum(prices_cents)
+        self.orders += 1
+        self.revenue_cents += total_cents
+        self.orders_by_client[order['id_client']] += 1
+        self.spend_by_client[order['id_client']] += total_cents
+        self.quantity_by_item.update(ids_items)
+        for id_item, cents in zip(ids_items, prices_cents):
+            self.revenue_by_item[id_item] += cents
+
+    def merge(self, other):
+        self.orders += other.orders
+        self.revenue_cents += other.revenue_cents
+        self.orders_by_client.update(other.orders_by_client)
+        self.spend_by_client.update(other.spend_by_client)
+        self.quantity_by_item.update(other.quantity_by_item)
+        self.revenue_by_item.update(other.revenue_by_item)
+        return self
+
+    def revenue(self):
+        return self.revenue_cents / 100
+
+    def average_order_value(self):
+        return 0.0 if self.orders == 0 else self.revenue_cents / self.orders / 100
+
+    def spend_per_client(self):
+        return {id_client: cents / 100 for id_client, cents in self.spend_by_client.items()}
+
+    def orders_per_client(self):
+        return dict(self.orders_by_client)
+
+    def revenue_per_item(self):
+        return {id_item: cents / 100 for id_item, cents in self.revenue_by_item.items()}
+
+    def top_clients(self, count=10):
+        return [(id_client, cents / 100) for id_client, cents in self.spend_by_client.most_common(count)]
+
+    def top_selling_items(self, count=10):
+        return self.quantity_by_item.most_common(count)
+
+    def top_grossing_items(self, count=10):
+        return [(id_item, cents / 100) for id_item, cents in self.revenue_by_item.most_common(count)]
+
+
+def _init_worker(item_catalog):
+    global _item_catalog
+    _item_catalog = item_catalog
+
+
+def _report_chunk(orders):
+    report = SalesReport()
+    for order in orders:
+        report.add(order, _item_catalog)
+    return report
+
+
+def _chunks(orders, chunk_size):
+    orders = iter(orders)
+    chunk = list(islice(orders, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(orders, chunk_size))
+
+
+def sales_report(shop_app, processes=None, chunk_size=10000, page_size=1000):
+    item_catalog = shop_app.download_catalog(page_size)
+    orders = shop_app.iter_orders(page_size)
+    report = SalesReport()
+    if processes is None:
+        for order in orders:
+            report.add(order, item_catalog)
+        return report
+    with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(item_catalog,)) as executor:
+        pending = set()
+        for chunk in _chunks(orders, chunk_size):
+            pending.add(executor.submit(_report_chunk, chunk))
+            if len(pending) >= processes * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.merge(future.result())
+        for future in pending:
+            report.merge(future.result())
+    return report
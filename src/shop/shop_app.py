@@ -1,14 +1,79 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import gzip
+import json
+import threading
+from .shop_catalog import ItemCatalog
 from .shop_database import ShopDatabase
+from .shop_write_buffer import WriteBuffer
+from . import shop_validation
+
+
+def detect_format(name, file_format=None):
+    if file_format:
+        return file_format
+    stem = name[:-3] if name.endswith('.gz') else name
+    return 'csv' if stem.endswith('.csv') else 'ndjson'
 
 
 class ShopApp:
-    def __init__(self, api_url):
-        self.shop_database = ShopDatabase(api_url)
+    export_fields = {
+        'clients': ['id', 'name_first', 'name_last', 'email'],
+        'items': ['id', 'name', 'value'],
+        'orders': ['id', 'id_client', 'ids_items']
+    }
+
+    def __init__(self, api_url, pool_size=10, max_concurrency=10, write_behind=None, on_write_error=None, **options):
+        self.shop_database = ShopDatabase(api_url, pool_size, **options)
+        self.max_concurrency = max_concurrency
+        self.write_buffer = None if write_behind is None else WriteBuffer(self.shop_database, write_behind, on_write_error)
+        self.__executor = None
+        self.__executor_lock = threading.Lock()
+        self.__orders = None
+        self.__orders_by_client = None
+        self.__orders_lock = threading.RLock()
+        if self.write_buffer is not None:
+            self.write_buffer.hooks_failure.append(self.__write_failed)
+
+    def flush(self):
+        return [] if self.write_buffer is None else self.write_buffer.flush()
+
+    def close(self):
+        self.flush()
+        with self.__executor_lock:
+            if self.__executor is not None:
+                self.__executor.shutdown()
+                self.__executor = None
+        self.shop_database.close()
+
+    def __map_concurrent(self, function, arguments):
+        if len(arguments) < 2 or self.max_concurrency < 2:
+            return list(map(function, arguments))
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+            executor = self.__executor
+        return list(executor.map(function, arguments))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def __ids_errors(results):
+        return [(None, result) if isinstance(result, Exception) else (result['id'], None) for result in results]
 
     def register_client(self, name_first, name_last, email):
         client = self.shop_database.client_post(name_first, name_last, email)
         return client['id']
 
+    def register_clients(self, clients):
+        results = self.shop_database.client_post_many(clients, self.max_concurrency)
+        return self.__ids_errors(results)
+
     def download_client(self, id_client):
         client = self.shop_database.client_get(id_client)
         return client
@@ -17,18 +82,30 @@ class ShopApp:
         clients = self.shop_database.client_get()
         return clients
 
+    def iter_clients(self, page_size=100):
+        return self.shop_database.client_iter(page_size)
+
     def remove_client(self, id_client):
+        if self.write_buffer is not None:
+            self.write_buffer.discard('client', id_client)
         self.shop_database.client_delete(id_client)
         return True
 
     def modify_client(self, id_client, name_first=None, name_last=None, email=None):
-        self.shop_database.client_put_patch(id_client, name_first, name_last, email)
+        if self.write_buffer is None:
+            self.shop_database.client_put_patch(id_client, name_first, name_last, email)
+        else:
+            self.write_buffer.put('client', id_client, {'name_first': name_first, 'name_last': name_last, 'email': email})
         return True
 
     def add_item(self, name, value):
         item = self.shop_database.item_post(name, value)
         return item['id']
 
+    def add_items(self, items):
+        results = self.shop_database.item_post_many(items, self.max_concurrency)
+        return self.__ids_errors(results)
+
     def download_item(self, id_item):
         item = self.shop_database.item_get(id_item)
         return item
@@ -37,18 +114,38 @@ class ShopApp:
         items = self.shop_database.item_get()
         return items
 
+    def iter_items(self, page_size=100):
+        return self.shop_database.item_iter(page_size)
+
+    def download_catalog(self, page_size=1000):
+        return ItemCatalog.from_database(self.shop_database, page_size)
+
     def remove_item(self, id_item):
+        if self.write_buffer is not None:
+            self.write_buffer.discard('item', id_item)
         self.shop_database.item_delete(id_item)
         return True
 
     def modify_item(self, id_item, name=None, value=None):
-        self.shop_database.item_put_patch(id_item, name, value)
+        if self.write_buffer is None:
+            self.shop_database.item_put_patch(id_item, name, value)
+        else:
+            self.write_buffer.put('item', id_item, {'name': name, 'value': value})
         return True
 
     def make_order(self, id_client, ids_items):
         order = self.shop_database.order_post(id_client, ids_items)
+        self.__index_order({**order, 'id_client': id_client, 'ids_items': list(ids_items)})
         return order['id']
 
+    def make_orders(self, orders):
+        results = self.shop_database.order_post_many(orders, self.max_concurrency)
+        for order, result in zip(orders, results):
+            if not isinstance(result, Exception):
+                id_client, ids_items = (order['id_client'], order['ids_items']) if isinstance(order, dict) else order
+                self.__index_order({**result, 'id_client': id_client, 'ids_items': list(ids_items)})
+        return self.__ids_errors(results)
+
     def download_order(self, id_order):
         order = self.shop_database.order_get(id_order)
         return order
@@ -57,22 +154,141 @@ class ShopApp:
         orders = self.shop_database.order_get()
         return orders
 
+    def iter_orders(self, page_size=100):
+        return self.shop_database.order_iter(page_size)
+
     def remove_order(self, id_order):
+        if self.write_buffer is not None:
+            self.write_buffer.discard('order', id_order)
         self.shop_database.order_delete(id_order)
+        self.__unindex_order(id_order)
         return True
 
     def modify_order(self, id_order, id_client=None, ids_items=None):
-        self.shop_database.order_put_patch(id_order, id_client, ids_items)
+        if self.write_buffer is None:
+            self.shop_database.order_put_patch(id_order, id_client, ids_items)
+        else:
+            self.write_buffer.put('order', id_order, {'id_client': id_client, 'ids_items': ids_items})
+        with self.__orders_lock:
+            if self.__orders is not None:
+                if id_order in self.__orders:
+                    order = self.__unindex_order(id_order)
+                    self.__index_order({
+                        **order,
+                        **({} if id_client is None else {'id_client': id_client}),
+                        **({} if ids_items is None else {'ids_items': list(ids_items)})
+                    })
+                else:
+                    self.__orders = self.__orders_by_client = None
         return True
 
-    def get_client_orders(self, id_client):
+    def __write_failed(self, kind, id_entity, fields, error):
+        if kind == 'order':
+            with self.__orders_lock:
+                self.__orders = self.__orders_by_client = None
+
+    def __index_order(self, order):
+        with self.__orders_lock:
+            if self.__orders is not None:
+                self.__orders[order['id']] = order
+                self.__orders_by_client.setdefault(order['id_client'], {})[order['id']] = order
+
+    def __unindex_order(self, id_order):
+        with self.__orders_lock:
+            if self.__orders is not None and id_order in self.__orders:
+                order = self.__orders.pop(id_order)
+                orders_client = self.__orders_by_client[order['id_client']]
+                del orders_client[id_order]
+                if not orders_client:
+                    del self.__orders_by_client[order['id_client']]
+                return order
+
+    def refresh_orders_index(self):
         orders = self.download_all_orders()
-        return list(filter(lambda order: order['id_client'] == id_client, orders))
+        with self.__orders_lock:
+            self.__orders = {}
+            self.__orders_by_client = {}
+            for order in orders:
+                self.__index_order(order)
+
+    def get_client_orders(self, id_client):
+        with self.__orders_lock:
+            if self.__orders is None:
+                self.refresh_orders_index()
+            return list(self.__orders_by_client.get(id_client, {}).values())
 
     def get_order_total(self, id_order):
         order = self.download_order(id_order)
+        quantities = Counter(order['ids_items'])
+        ids_items = list(quantities)
+        items = self.__map_concurrent(self.download_item, ids_items)
         total = 0
-        for id_item in order['ids_items']:
-            item = self.download_item(id_item)
-            total += item['value']
+        for id_item, item in zip(ids_items, items):
+            total += item['value'] * quantities[id_item]
         return total
+
+    def get_orders_totals(self, ids_orders=None):
+        if ids_orders is not None:
+            for id_order in ids_orders:
+                shop_validation.check_id('order', id_order)
+            ids_wanted = set(ids_orders)
+        item_catalog = self.download_catalog()
+        totals = {}
+        for order in self.iter_orders(1000):
+            if ids_orders is None or order['id'] in ids_wanted:
+                totals[order['id']] = item_catalog.total_cents(order['ids_items']) / 100
+        if ids_orders is None:
+            return totals
+        elif len(totals) < len(ids_wanted):
+            raise LookupError("Order with such ID doesn't exist")
+        else:
+            return {id_order: totals[id_order] for id_order in ids_orders}
+
+    def __export_rows(self, kind, totals, page_size):
+        rows = {'clients': self.iter_clients, 'items': self.iter_items, 'orders': self.iter_orders}[kind](page_size)
+        if not totals:
+            return rows
+        item_catalog = self.download_catalog(page_size)
+
+        def with_total(order):
+            try:
+                return {**order, 'total': item_catalog.total_cents(order['ids_items']) / 100}
+            except LookupError:
+                return {**order, 'total': None}
+        return map(with_total, rows)
+
+    def export(self, kind, path, file_format=None, compress=None, totals=False, page_size=1000):
+        if kind not in self.export_fields:
+            raise ValueError("Kind must be 'clients', 'items' or 'orders'")
+        elif totals and kind != 'orders':
+            raise ValueError("Totals can only be exported for orders")
+        name = path if isinstance(path, str) else getattr(path, 'name', '')
+        name = name if isinstance(name, str) else ''
+        compress = name.endswith('.gz') if compress is None else compress
+        file_format = detect_format(name, file_format)
+        if file_format not in ('csv', 'ndjson'):
+            raise ValueError("Format must be 'csv' or 'ndjson'")
+        rows = self.__export_rows(kind, totals, page_size)
+        if hasattr(path, 'write'):
+            file = gzip.open(path, 'wt', encoding='utf-8', newline='') if compress else path
+        else:
+            file = (gzip.open if compress else open)(path, 'wt', encoding='utf-8', newline='')
+        count = 0
+        try:
+            if file_format == 'csv':
+                writer = csv.writer(file)
+                fields = self.export_fields[kind] + (['total'] if totals else [])
+                writer.writerow(fields)
+                for row in rows:
+                    if kind == 'orders':
+                        row = {**row, 'ids_items': ';'.join(map(str, row['ids_items']))}
+                    writer.writerow([row.get(field) for field in fields])
+                    count += 1
+            else:
+                for row in rows:
+                    file.write(json.dumps(row, ensure_ascii=False) + '\n')
+                    count += 1
+        finally:
+            if file is not path:
+                file.close()
+        return count
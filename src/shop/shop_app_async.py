@@ -0,0 +1,101 @@
+import asyncio
+from collections import Counter
+from .shop_database_async import AsyncShopDatabase
+
+
+class AsyncShopApp:
+    def __init__(self, api_url, pool_size=100, max_concurrency=100):
+        self.shop_database = AsyncShopDatabase(api_url, pool_size)
+        self.max_concurrency = max_concurrency
+
+    async def close(self):
+        await self.shop_database.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def __gather_concurrent(self, function, arguments):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call(argument):
+            async with semaphore:
+                return await function(argument)
+
+        return await asyncio.gather(*map(call, arguments))
+
+    async def register_client(self, name_first, name_last, email):
+        client = await self.shop_database.client_post(name_first, name_last, email)
+        return client['id']
+
+    async def download_client(self, id_client):
+        client = await self.shop_database.client_get(id_client)
+        return client
+
+    async def download_all_clients(self):
+        clients = await self.shop_database.client_get()
+        return clients
+
+    async def remove_client(self, id_client):
+        await self.shop_database.client_delete(id_client)
+        return True
+
+    async def modify_client(self, id_client, name_first=None, name_last=None, email=None):
+        await self.shop_database.client_put_patch(id_client, name_first, name_last, email)
+        return True
+
+    async def add_item(self, name, value):
+        item = await self.shop_database.item_post(name, value)
+        return item['id']
+
+    async def download_item(self, id_item):
+        item = await self.shop_database.item_get(id_item)
+        return item
+
+    async def download_all_items(self):
+        items = await self.shop_database.item_get()
+        return items
+
+    async def remove_item(self, id_item):
+        await self.shop_database.item_delete(id_item)
+        return True
+
+    async def modify_item(self, id_item, name=None, value=None):
+        await self.shop_database.item_put_patch(id_item, name, value)
+        return True
+
+    async def make_order(self, id_client, ids_items):
+        order = await self.shop_database.order_post(id_client, ids_items)
+        return order['id']
+
+    async def download_order(self, id_order):
+        order = await self.shop_database.order_get(id_order)
+        return order
+
+    async def download_all_orders(self):
+        orders = await self.shop_database.order_get()
+        return orders
+
+    async def remove_order(self, id_order):
+        await self.shop_database.order_delete(id_order)
+        return True
+
+    async def modify_order(self, id_order, id_client=None, ids_items=None):
+        await self.shop_database.order_put_patch(id_order, id_client, ids_items)
+        return True
+
+    async def get_client_orders(self, id_client):
+        orders = await self.download_all_orders()
+        return list(filter(lambda order: order['id_client'] == id_client, orders))
+
+    async def get_order_total(self, id_order):
+        order = await self.download_order(id_order)
+        quantities = Counter(order['ids_items'])
+        ids_items = list(quantities)
+        items = await self.__gather_concurrent(self.download_item, ids_items)
+        total = 0
+        for id_item, item in zip(ids_items, items):
+            total += item['value'] * quantities[id_item]
+        return total
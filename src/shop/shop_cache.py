@@ -0,0 +1,69 @@
+from collections import OrderedDict
+import threading
+import time
+
+STALE = object()
+
+
+class ShopCache:
+    def __init__(self, ttl, max_size=1024, clock=time.monotonic):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("Cache size must be a positive integer")
+        self.ttl = ttl if isinstance(ttl, dict) else {endpoint: ttl for endpoint in ['clients', 'items', 'orders']}
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, endpoint, id_entity=None):
+        key = endpoint, id_entity
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            elif entry[0] <= self.clock():
+                del self.__entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            else:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+
+    def set(self, endpoint, id_entity, value):
+        ttl = self.ttl.get(endpoint)
+        if not ttl:
+            return
+        key = endpoint, id_entity
+        with self.__lock:
+            self.__entries[key] = self.clock() + ttl, value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint, id_entity=None):
+        with self.__lock:
+            self.__entries.pop((endpoint, None), None)
+            if id_entity is not None:
+                self.__entries.pop((endpoint, id_entity), None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self):
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self.__entries)
+            }
@@ -0,0 +1,127 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from . import shop_json
+from .shop_cache import STALE
+
+_COLLECTION = -1
+
+
+class SQLiteCache:
+    def __init__(self, path, ttl, max_size=100000, max_stale=None, clock=time.time):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("Cache size must be a positive integer")
+        self.path = path
+        self.ttl = ttl if isinstance(ttl, dict) else {endpoint: ttl for endpoint in ['clients', 'items', 'orders']}
+        self.max_size = max_size
+        self.max_stale = max_stale
+        self.clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.__lock = threading.Lock()
+        self.__connect()
+
+    def __connect(self):
+        self.__pid = os.getpid()
+        self.__connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute('PRAGMA synchronous=NORMAL')
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'endpoint TEXT NOT NULL, id INTEGER NOT NULL, stored_at REAL NOT NULL, expires_at REAL NOT NULL, '
+            'value BLOB NOT NULL, PRIMARY KEY (endpoint, id))'
+        )
+        self.__connection.execute('CREATE INDEX IF NOT EXISTS entries_stored_at ON entries (stored_at)')
+        self.__size = self.__count()
+
+    def __execute(self, sql, parameters=()):
+        if self.__pid != os.getpid():
+            self.__connect()
+        return self.__connection.execute(sql, parameters)
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __count(self):
+        return self.__execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def get(self, endpoint, id_entity=None):
+        key = endpoint, _COLLECTION if id_entity is None else id_entity
+        with self.__lock:
+            row = self.__execute(
+                'SELECT expires_at, value FROM entries WHERE endpoint = ? AND id = ?', key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            now = self.clock()
+            if row[0] > now:
+                self.hits += 1
+                return True, shop_json.loads(row[1])
+            elif self.max_stale is None or row[0] + self.max_stale > now:
+                self.stale_hits += 1
+                return STALE, shop_json.loads(row[1])
+            else:
+                self.__execute('DELETE FROM entries WHERE endpoint = ? AND id = ?', key)
+                self.__size -= 1
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+
+    def set(self, endpoint, id_entity, value):
+        ttl = self.ttl.get(endpoint)
+        if not ttl:
+            return
+        now = self.clock()
+        content = json.dumps(value, separators=(',', ':')).encode('utf-8')
+        with self.__lock:
+            self.__execute(
+                'INSERT OR REPLACE INTO entries (endpoint, id, stored_at, expires_at, value) VALUES (?, ?, ?, ?, ?)',
+                (endpoint, _COLLECTION if id_entity is None else id_entity, now, now + ttl, content)
+            )
+            self.__size += 1
+            if self.__size > self.max_size:
+                self.__size = self.__count()
+                excess = self.__size - self.max_size
+                if excess > 0:
+                    self.__execute(
+                        'DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY stored_at LIMIT ?)',
+                        (excess,)
+                    )
+                    self.__size -= excess
+                    self.evictions += excess
+
+    def invalidate(self, endpoint, id_entity=None):
+        with self.__lock:
+            self.__size -= self.__execute(
+                'DELETE FROM entries WHERE endpoint = ? AND id IN (?, ?)',
+                (endpoint, _COLLECTION, _COLLECTION if id_entity is None else id_entity)
+            ).rowcount
+
+    def clear(self):
+        with self.__lock:
+            self.__execute('DELETE FROM entries')
+            self.__size = 0
+
+    def stats(self):
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': self.__count()
+            }
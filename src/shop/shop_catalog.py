@@ -0,0 +1,77 @@
+from array import array
+from itertools import compress
+import sys
+
+
+class ItemCatalog:
+    def __init__(self, items=()):
+        self.ids = array('q')
+        self.cents = array('q')
+        self.names = []
+        self.__rows = {}
+        for item in items:
+            self.add(item)
+
+    @classmethod
+    def from_database(cls, shop_database, page_size=1000):
+        return cls(shop_database.item_iter(page_size))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, id_item):
+        return id_item in self.__rows
+
+    def add(self, item):
+        cents = int(round(item['value'] * 100))
+        name = sys.intern(item['name'])
+        row = self.__rows.get(item['id'])
+        if row is None:
+            self.__rows[item['id']] = len(self.ids)
+            self.ids.append(item['id'])
+            self.cents.append(cents)
+            self.names.append(name)
+        else:
+            self.cents[row] = cents
+            self.names[row] = name
+
+    def row(self, id_item):
+        try:
+            return self.__rows[id_item]
+        except KeyError:
+            raise LookupError("Item with such ID doesn't exist")
+
+    def rows(self, ids_items):
+        try:
+            return array('q', map(self.__rows.__getitem__, ids_items))
+        except KeyError:
+            raise LookupError("Item with such ID doesn't exist")
+
+    def item(self, id_item):
+        row = self.row(id_item)
+        return {'id': self.ids[row], 'name': self.names[row], 'value': self.cents[row] / 100}
+
+    def price(self, id_item):
+        return self.cents[self.row(id_item)] / 100
+
+    def prices_cents(self, ids_items):
+        return array('q', map(self.cents.__getitem__, self.rows(ids_items)))
+
+    def total_cents(self, ids_items=None):
+        if ids_items is None:
+            return sum(self.cents)
+        return sum(map(self.cents.__getitem__, self.rows(ids_items)))
+
+    def total(self, ids_items=None):
+        return self.total_cents(ids_items) / 100
+
+    def select(self, min_cents=None, max_cents=None):
+        if min_cents is None and max_cents is None:
+            return array('q', self.ids)
+        elif max_cents is None:
+            mask = map(min_cents.__le__, self.cents)
+        elif min_cents is None:
+            mask = map(max_cents.__ge__, self.cents)
+        else:
+            mask = (min_cents <= cents <= max_cents for cents in self.cents)
+        return array('q', compress(self.ids, mask))
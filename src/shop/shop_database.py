@@ -1,209 +1,403 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
 import requests
-import re
+from requests.adapters import HTTPAdapter
+import time
+from . import shop_json
+from . import shop_validation
+from .shop_cache import STALE
+from .shop_metrics import ShopMetrics
+from .shop_limits import LimitExceeded
+from .shop_resilience import CircuitOpenError
 
 
 class ShopDatabase:
-    def __init__(self, api_url):
-        if not isinstance(api_url, str):
-            raise TypeError("Api URL must be a string")
-        elif not re.match(r"(https?://(?:www\.|(?!www))[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]\.[^\s]{2,}|www\.[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]\.[^\s]{2,}|https?://(?:www\.|(?!www))[a-zA-Z0-9]+\.[^\s]{2,}|www\.[a-zA-Z0-9]+\.[^\s]{2,})", api_url):
-            raise ValueError("Api URL must be a valid url")
-        else:
-            self.api_url = api_url
-            self.request = requests.request
+    def __init__(self, api_url, pool_size=10, cache=None, retry=None, circuit_breaker=None, limits=None, json_loads=None):
+        shop_validation.check_api_url(api_url)
+        self.api_url = api_url
+        self.cache = cache
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.limits = {} if limits is None else limits
+        self.json_loads = shop_json.loads if json_loads is None else json_loads
+        self.metrics = ShopMetrics()
+        self.hooks_pre_request = []
+        self.hooks_post_request = []
+        self.__generations = {}
+        self.__generations_lock = threading.Lock()
+        self.__validators = {}
+        self.__validators_lock = threading.Lock()
+        self.__flights = {}
+        self.__flights_lock = threading.Lock()
+        self.__revalidations = ThreadPoolExecutor(max_workers=pool_size)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.request = self.session.request
 
-    @staticmethod
-    def __email_invalid(email):
-        return not re.match(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)", email)
+    def close(self):
+        self.__revalidations.shutdown()
+        self.session.close()
 
-    @staticmethod
-    def __entity_get(request, api_url, endpoint, word, id_entity):
-        if id_entity is not None and not isinstance(id_entity, int):
-            raise TypeError(word.capitalize() + " ID must be an integer")
-        else:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __send(self, endpoint, method, url, **kwargs):
+        attempts = 1 if self.retry is None else self.retry.attempts(method)
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
             try:
-                response = request('get', api_url + '/' + endpoint + '/' + ('' if id_entity is None else str(id_entity)))
-                if response.status_code == 404:
-                    raise LookupError(word.capitalize() + " with such ID doesn't exist")
+                response = self.__attempt(endpoint, method, url, **kwargs)
+            except (CircuitOpenError, LimitExceeded):
+                raise
+            except requests.RequestException:
+                if last:
+                    raise
+            else:
+                if last or response.status_code not in self.retry.status_codes:
+                    return response
+            self.retry.wait(attempt)
+
+    def __attempt(self, endpoint, method, url, **kwargs):
+        limiter = self.limits.get(endpoint)
+        if limiter is None:
+            return self.__attempt_unlimited(endpoint, method, url, **kwargs)
+        with limiter:
+            return self.__attempt_unlimited(endpoint, method, url, **kwargs)
+
+    def __attempt_unlimited(self, endpoint, method, url, **kwargs):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before()
+        for hook in self.hooks_pre_request:
+            hook(endpoint, method, url, kwargs)
+        response = None
+        start = time.perf_counter()
+        try:
+            response = self.request(method, url, **kwargs)
+            return response
+        finally:
+            duration = time.perf_counter() - start
+            if response is None:
+                self.metrics.record(endpoint, method, duration)
+            else:
+                self.metrics.record(endpoint, method, duration, len(response.content), response.status_code)
+            if self.circuit_breaker is not None:
+                if response is None or response.status_code >= 500:
+                    self.circuit_breaker.failure()
                 else:
-                    return response.json()
+                    self.circuit_breaker.success()
+            for hook in self.hooks_post_request:
+                hook(endpoint, method, url, response, duration)
+
+    def __decode(self, response):
+        try:
+            return self.json_loads(response.content)
+        except ValueError as error:
+            raise requests.exceptions.InvalidJSONError(str(error), response=response)
+
+    def __invalidate(self, endpoint, id_entity=None):
+        with self.__generations_lock:
+            for key in [(endpoint, None)] + ([] if id_entity is None else [(endpoint, id_entity)]):
+                self.__generations[key] = self.__generations.get(key, 0) + 1
+            if self.cache is not None:
+                self.cache.invalidate(endpoint, id_entity)
+            url = self.api_url + '/' + endpoint + '/'
+            with self.__validators_lock:
+                self.__validators.pop(url, None)
+        with self.__flights_lock:
+            self.__flights.pop(url, None)
+            if id_entity is not None:
+                self.__flights.pop(url + str(id_entity), None)
+
+    def __cache_set(self, endpoint, id_entity, entity, generation):
+        with self.__generations_lock:
+            if self.__generations.get((endpoint, id_entity), 0) == generation:
+                self.cache.set(endpoint, id_entity, entity)
+
+    def __entity_get(self, endpoint, word, id_entity):
+        if id_entity is not None:
+            shop_validation.check_id(word, id_entity)
+        url = self.api_url + '/' + endpoint + '/' + ('' if id_entity is None else str(id_entity))
+        if self.cache is not None:
+            found, entity = self.cache.get(endpoint, id_entity)
+            if found is STALE:
+                self.__revalidate(endpoint, word, id_entity, url)
+                return entity
+            elif found:
+                return entity
+        with self.__flights_lock:
+            flight = self.__flights.get(url)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[url] = Future()
+        if not leader:
+            return flight.result()
+        return self.__entity_fly(endpoint, word, id_entity, url, flight)
+
+    def __entity_fly(self, endpoint, word, id_entity, url, flight):
+        try:
+            entity = self.__entity_fetch(endpoint, word, id_entity, url)
+            flight.set_result(entity)
+            return entity
+        except BaseException as error:
+            flight.set_exception(error)
+            raise
+        finally:
+            with self.__flights_lock:
+                if self.__flights.get(url) is flight:
+                    del self.__flights[url]
+
+    def __revalidate(self, endpoint, word, id_entity, url):
+        with self.__flights_lock:
+            if url in self.__flights:
+                return
+            flight = self.__flights[url] = Future()
+        try:
+            self.__revalidations.submit(self.__revalidate_flight, endpoint, word, id_entity, url, flight)
+        except RuntimeError:
+            with self.__flights_lock:
+                if self.__flights.get(url) is flight:
+                    del self.__flights[url]
+            flight.cancel()
+
+    def __revalidate_flight(self, endpoint, word, id_entity, url, flight):
+        try:
+            self.__entity_fly(endpoint, word, id_entity, url, flight)
+        except LookupError:
+            self.__invalidate(endpoint, id_entity)
+        except ConnectionError:
+            pass
+
+    def __entity_fetch(self, endpoint, word, id_entity, url):
+        with self.__generations_lock:
+            generation = self.__generations.get((endpoint, id_entity), 0)
+        with self.__validators_lock:
+            validators = self.__validators.get(url)
+        try:
+            if validators is None:
+                response = self.__send(endpoint, 'get', url)
+            else:
+                response = self.__send(endpoint, 'get', url, headers={
+                    **({} if validators[0] is None else {'If-None-Match': validators[0]}),
+                    **({} if validators[1] is None else {'If-Modified-Since': validators[1]})
+                })
+            if response.status_code == 404:
+                raise LookupError(word.capitalize() + " with such ID doesn't exist")
+            elif response.status_code == 304 and validators is not None:
+                entity = list(validators[2])
+            else:
+                entity = self.__decode(response)
+                if id_entity is None:
+                    self.__remember_validators(endpoint, url, response, entity, generation)
+            if self.cache is not None:
+                self.__cache_set(endpoint, id_entity, entity, generation)
+            return entity
+        except requests.RequestException:
+            suffix = id_entity is None and 's' or ''
+            raise ConnectionError("Can't get " + word + suffix + " from database")
+
+    def __remember_validators(self, endpoint, url, response, collection, generation):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self.__generations_lock, self.__validators_lock:
+            if etag is None and last_modified is None:
+                self.__validators.pop(url, None)
+            elif self.__generations.get((endpoint, None), 0) == generation:
+                self.__validators[url] = etag, last_modified, list(collection)
+
+    def __entity_iter(self, endpoint, word, page_size):
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError("Page size must be a positive integer")
+        return self.__entity_pages(endpoint, word, page_size)
+
+    def __entity_pages(self, endpoint, word, page_size):
+        offset = 0
+        id_last = None
+        while True:
+            try:
+                response = self.__send(endpoint, 'get', self.api_url + '/' + endpoint + '/', params={
+                    'offset': offset,
+                    'limit': page_size
+                })
+                page = self.__decode(response)
             except requests.RequestException:
-                suffix = id_entity is None and 's' or ''
-                raise ConnectionError("Can't get " + word + suffix + " from database")
+                raise ConnectionError("Can't get " + word + "s from database")
+            if len(page) == 0 or (id_last is not None and page[0]['id'] <= id_last):
+                return
+            yield from page
+            if len(page) != page_size:
+                return
+            offset += page_size
+            id_last = page[-1]['id']
 
     @staticmethod
-    def __entity_delete(request, api_url, endpoint, word, id_entity):
-        if not isinstance(id_entity, int):
-            raise TypeError(word.capitalize() + " ID must be an integer")
-        else:
+    def __entity_post_many(post, validate, rows, max_concurrency):
+        results = [None] * len(rows)
+        for index, error in validate(rows):
+            results[index] = error
+        indexes = [index for index, result in enumerate(results) if result is None]
+
+        def post_row(index):
+            row = rows[index]
             try:
-                response = request('delete', api_url + '/' + endpoint + '/' + str(id_entity))
-                if response.status_code == 404:
-                    raise LookupError(word.capitalize() + " with such ID doesn't exist")
-                else:
-                    return response.json()
-            except requests.RequestException:
-                raise ConnectionError("Can't delete " + word + " from database")
+                return post(**row) if isinstance(row, dict) else post(*row)
+            except (LookupError, ValueError, ConnectionError) as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for index, result in zip(indexes, executor.map(post_row, indexes)):
+                results[index] = result
+        return results
+
+    def __entity_delete(self, endpoint, word, id_entity):
+        shop_validation.check_id(word, id_entity)
+        try:
+            response = self.__send(endpoint, 'delete', self.api_url + '/' + endpoint + '/' + str(id_entity))
+            if response.status_code == 404:
+                raise LookupError(word.capitalize() + " with such ID doesn't exist")
+            else:
+                return self.__decode(response)
+        except requests.RequestException:
+            raise ConnectionError("Can't delete " + word + " from database")
+        finally:
+            self.__invalidate(endpoint, id_entity)
 
     def client_get(self, id_client=None):
-        return self.__entity_get(self.request, self.api_url, 'clients', 'client', id_client)
+        return self.__entity_get('clients', 'client', id_client)
+
+    def client_iter(self, page_size=100):
+        return self.__entity_iter('clients', 'client', page_size)
 
     def client_post(self, name_first, name_last, email):
-        if not isinstance(name_first, str) or not isinstance(name_last, str) or not isinstance(email, str):
-            raise TypeError("Names and email must be strings")
-        elif name_first == '' or name_last == '':
-            raise ValueError("Both names must be non-empty")
-        elif self.__email_invalid(email):
-            raise ValueError("Email must be valid")
-        else:
-            try:
-                response = self.request('post', self.api_url + '/clients/', data={
-                    'name_first': name_first,
-                    'name_last': name_last,
-                    'email': email
-                })
-                if response.status_code == 409:
-                    raise ValueError("Can't post this client (email must be unique)")
-                else:
-                    return response.json()
-            except requests.RequestException:
-                raise ConnectionError("Can't post client to database")
+        shop_validation.check_client(name_first, name_last, email)
+        try:
+            response = self.__send('clients', 'post', self.api_url + '/clients/', data={
+                'name_first': name_first,
+                'name_last': name_last,
+                'email': email
+            })
+            if response.status_code == 409:
+                raise ValueError("Can't post this client (email must be unique)")
+            else:
+                return self.__decode(response)
+        except requests.RequestException:
+            raise ConnectionError("Can't post client to database")
+        finally:
+            self.__invalidate('clients')
+
+    def client_post_many(self, clients, max_concurrency=10):
+        return self.__entity_post_many(self.client_post, shop_validation.validate_clients, clients, max_concurrency)
 
     def client_delete(self, id_client):
-        return self.__entity_delete(self.request, self.api_url, 'clients', 'client', id_client)
+        return self.__entity_delete('clients', 'client', id_client)
 
     def client_put_patch(self, id_client, name_first=None, name_last=None, email=None):
-        if name_first == name_last == email is None:
-            raise AttributeError("Patch must have at least one attribute")
-        elif not isinstance(id_client, int):
-            raise TypeError("Client ID must be an integer")
-        elif (name_first is not None and not isinstance(name_first, str)) or (name_last is not None and not isinstance(name_last, str)) or (email is not None and not isinstance(email, str)):
-            raise TypeError("Names and email must be strings")
-        elif name_first == '' or name_last == '':
-            raise ValueError("Both names must be non-empty")
-        elif email is not None and self.__email_invalid(email):
-            raise ValueError("Email must be valid")
-        else:
-            method = 'patch' if None in [name_first, name_last, email] else 'put'
-            try:
-                response = self.request(method, self.api_url + '/clients/' + str(id_client), data={
-                    **({} if name_first is None else {'name_first': name_first}),
-                    **({} if name_last is None else {'name_last': name_last}),
-                    **({} if email is None else {'email': email})
-                })
-                if response.status_code == 404:
-                    raise LookupError("Client with such ID doesn't exist")
-                elif response.status_code == 409:
-                    raise ValueError("Can't " + method + " this client (email must be unique)")
-                else:
-                    return response.json()
-            except requests.RequestException:
-                raise ConnectionError("Can't " + method + " client in database")
+        shop_validation.check_client_patch(id_client, name_first, name_last, email)
+        method = 'patch' if None in [name_first, name_last, email] else 'put'
+        try:
+            response = self.__send('clients', method, self.api_url + '/clients/' + str(id_client), data={
+                **({} if name_first is None else {'name_first': name_first}),
+                **({} if name_last is None else {'name_last': name_last}),
+                **({} if email is None else {'email': email})
+            })
+            if response.status_code == 404:
+                raise LookupError("Client with such ID doesn't exist")
+            elif response.status_code == 409:
+                raise ValueError("Can't " + method + " this client (email must be unique)")
+            else:
+                return self.__decode(response)
+        except requests.RequestException:
+            raise ConnectionError("Can't " + method + " client in database")
+        finally:
+            self.__invalidate('clients', id_client)
 
     def item_get(self, id_item=None):
-        return self.__entity_get(self.request, self.api_url, 'items', 'item', id_item)
+        return self.__entity_get('items', 'item', id_item)
+
+    def item_iter(self, page_size=100):
+        return self.__entity_iter('items', 'item', page_size)
 
     def item_post(self, name, value):
-        if not isinstance(name, str):
-            raise TypeError("Name must be a string")
-        elif not isinstance(value, float):
-            raise TypeError("Value must be a float")
-        elif name == '':
-            raise ValueError("Name must not be empty")
-        elif len(str(value).split('.')[1]) > 2:
-            raise ValueError("Value must have no more than 2 decimal places")
-        else:
-            try:
-                response = self.request('post', self.api_url + '/items/', data={
-                    'name': name,
-                    'value': value
-                })
-                return response.json()
-            except requests.RequestException:
-                raise ConnectionError("Can't post item to database")
+        shop_validation.check_item(name, value)
+        try:
+            response = self.__send('items', 'post', self.api_url + '/items/', data={
+                'name': name,
+                'value': value
+            })
+            return self.__decode(response)
+        except requests.RequestException:
+            raise ConnectionError("Can't post item to database")
+        finally:
+            self.__invalidate('items')
+
+    def item_post_many(self, items, max_concurrency=10):
+        return self.__entity_post_many(self.item_post, shop_validation.validate_items, items, max_concurrency)
 
     def item_delete(self, id_item):
-        return self.__entity_delete(self.request, self.api_url, 'items', 'item', id_item)
+        return self.__entity_delete('items', 'item', id_item)
 
     def item_put_patch(self, id_item, name=None, value=None):
-        if name == value is None:
-            raise AttributeError("Patch must have at least one attribute")
-        elif not isinstance(id_item, int):
-            raise TypeError("Item ID must be an integer")
-        elif name is not None and not isinstance(name, str):
-            raise TypeError("Name must be a string")
-        elif value is not None and not isinstance(value, float):
-            raise TypeError("Value must be a float")
-        elif name == '':
-            raise ValueError("Name must not be empty")
-        elif value is not None and len(str(value).split('.')[1]) > 2:
-            raise ValueError("Value must have no more than 2 decimal places")
-        else:
-            method = 'patch' if None in [name, value] else 'put'
-            try:
-                response = self.request(method, self.api_url + '/items/' + str(id_item), data={
-                    **({} if name is None else {'name': name}),
-                    **({} if value is None else {'value': value})
-                })
-                if response.status_code == 404:
-                    raise LookupError("Item with such ID doesn't exist")
-                else:
-                    return response.json()
-            except requests.RequestException:
-                raise ConnectionError("Can't " + method + " item in database")
+        shop_validation.check_item_patch(id_item, name, value)
+        method = 'patch' if None in [name, value] else 'put'
+        try:
+            response = self.__send('items', method, self.api_url + '/items/' + str(id_item), data={
+                **({} if name is None else {'name': name}),
+                **({} if value is None else {'value': value})
+            })
+            if response.status_code == 404:
+                raise LookupError("Item with such ID doesn't exist")
+            else:
+                return self.__decode(response)
+        except requests.RequestException:
+            raise ConnectionError("Can't " + method + " item in database")
+        finally:
+            self.__invalidate('items', id_item)
 
     def order_post(self, id_client, ids_items):
-        if not isinstance(id_client, int):
-            raise TypeError("Client ID must be an integer")
-        elif not isinstance(ids_items, list):
-            raise TypeError("Items IDs must be a list")
-        elif len(ids_items) < 1:
-            raise ValueError("Items IDs must not be empty")
-        else:
-            try:
-                for i in ids_items:
-                    if not isinstance(i, int):
-                        raise TypeError("Items IDs must all be integers")
-                response = self.request('post', self.api_url + '/orders/', data={
-                    'id_client': id_client,
-                    'ids_items': ids_items
-                })
-                if response.status_code == 404:
-                    raise LookupError("Referenced entities don't exist")
-                else:
-                    return response.json()
-            except requests.RequestException:
-                raise ConnectionError("Can't post order to database")
+        shop_validation.check_order(id_client, ids_items)
+        try:
+            response = self.__send('orders', 'post', self.api_url + '/orders/', data={
+                'id_client': id_client,
+                'ids_items': ids_items
+            })
+            if response.status_code == 404:
+                raise LookupError("Referenced entities don't exist")
+            else:
+                return self.__decode(response)
+        except requests.RequestException:
+            raise ConnectionError("Can't post order to database")
+        finally:
+            self.__invalidate('orders')
+
+    def order_post_many(self, orders, max_concurrency=10):
+        return self.__entity_post_many(self.order_post, shop_validation.validate_orders, orders, max_concurrency)
 
     def order_get(self, id_order=None):
-        return self.__entity_get(self.request, self.api_url, 'orders', 'order', id_order)
+        return self.__entity_get('orders', 'order', id_order)
+
+    def order_iter(self, page_size=100):
+        return self.__entity_iter('orders', 'order', page_size)
 
     def order_delete(self, id_order):
-        return self.__entity_delete(self.request, self.api_url, 'orders', 'order', id_order)
+        return self.__entity_delete('orders', 'order', id_order)
 
     def order_put_patch(self, id_order, id_client=None, ids_items=None):
-        if id_client == ids_items is None:
-            raise AttributeError("Patch must have at least one attribute")
-        elif not isinstance(id_order, int) or (id_client is not None and not isinstance(id_client, int)):
-            raise TypeError("Both order and client IDs must be integers")
-        elif ids_items is not None and not isinstance(ids_items, list):
-            raise TypeError("Items IDs must be a list")
-        elif ids_items is not None and len(ids_items) < 1:
-            raise ValueError("Items IDs must not be empty")
-        else:
-            if ids_items is not None:
-                for i in ids_items:
-                    if not isinstance(i, int):
-                        raise TypeError("Items IDs must all be integers")
-            method = 'patch' if None in [id_client, ids_items] else 'put'
-            try:
-                response = self.request(method, self.api_url + '/orders/' + str(id_order), data={
-                    **({} if id_client is None else {'id_client': id_client}),
-                    **({} if ids_items is None else {'ids_items': ids_items})
-                })
-                if response.status_code == 404:
-                    raise LookupError("Referenced entities don't exist")
-                else:
-                    return response.json()
-            except requests.RequestException:
-                raise ConnectionError("Can't " + method + " order in database")
+        shop_validation.check_order_patch(id_order, id_client, ids_items)
+        method = 'patch' if None in [id_client, ids_items] else 'put'
+        try:
+            response = self.__send('orders', method, self.api_url + '/orders/' + str(id_order), data={
+                **({} if id_client is None else {'id_client': id_client}),
+                **({} if ids_items is None else {'ids_items': ids_items})
+            })
+            if response.status_code == 404:
+                raise LookupError("Referenced entities don't exist")
+            else:
+                return self.__decode(response)
+        except requests.RequestException:
+            raise ConnectionError("Can't " + method + " order in database")
+        finally:
+            self.__invalidate('orders', id_order)
@@ -0,0 +1,182 @@
+import asyncio
+from urllib.parse import urlencode
+import aiohttp
+from . import shop_json
+from . import shop_validation
+
+
+class AsyncResponse:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    def json(self):
+        try:
+            return shop_json.loads(self.content)
+        except ValueError as error:
+            raise aiohttp.ClientPayloadError(str(error))
+
+
+class AsyncShopDatabase:
+    def __init__(self, api_url, pool_size=100):
+        shop_validation.check_api_url(api_url)
+        self.api_url = api_url
+        self.pool_size = pool_size
+        self.session = None
+        self.request = self.__request
+
+    async def __request(self, method, url, data=None):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.pool_size))
+        kwargs = {} if data is None else {
+            'data': urlencode(data, doseq=True),
+            'headers': {'Content-Type': 'application/x-www-form-urlencoded'}
+        }
+        try:
+            async with self.session.request(method, url, **kwargs) as response:
+                return AsyncResponse(response.status, await response.read())
+        except asyncio.TimeoutError:
+            raise aiohttp.ServerTimeoutError()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @staticmethod
+    async def __entity_get(request, api_url, endpoint, word, id_entity):
+        if id_entity is not None:
+            shop_validation.check_id(word, id_entity)
+        try:
+            response = await request('get', api_url + '/' + endpoint + '/' + ('' if id_entity is None else str(id_entity)))
+            if response.status_code == 404:
+                raise LookupError(word.capitalize() + " with such ID doesn't exist")
+            else:
+                return response.json()
+        except aiohttp.ClientError:
+            suffix = id_entity is None and 's' or ''
+            raise ConnectionError("Can't get " + word + suffix + " from database")
+
+    @staticmethod
+    async def __entity_delete(request, api_url, endpoint, word, id_entity):
+        shop_validation.check_id(word, id_entity)
+        try:
+            response = await request('delete', api_url + '/' + endpoint + '/' + str(id_entity))
+            if response.status_code == 404:
+                raise LookupError(word.capitalize() + " with such ID doesn't exist")
+            else:
+                return response.json()
+        except aiohttp.ClientError:
+            raise ConnectionError("Can't delete " + word + " from database")
+
+    async def client_get(self, id_client=None):
+        return await self.__entity_get(self.request, self.api_url, 'clients', 'client', id_client)
+
+    async def client_post(self, name_first, name_last, email):
+        shop_validation.check_client(name_first, name_last, email)
+        try:
+            response = await self.request('post', self.api_url + '/clients/', data={
+                'name_first': name_first,
+                'name_last': name_last,
+                'email': email
+            })
+            if response.status_code == 409:
+                raise ValueError("Can't post this client (email must be unique)")
+            else:
+                return response.json()
+        except aiohttp.ClientError:
+            raise ConnectionError("Can't post client to database")
+
+    async def client_delete(self, id_client):
+        return await self.__entity_delete(self.request, self.api_url, 'clients', 'client', id_client)
+
+    async def client_put_patch(self, id_client, name_first=None, name_last=None, email=None):
+        shop_validation.check_client_patch(id_client, name_first, name_last, email)
+        method = 'patch' if None in [name_first, name_last, email] else 'put'
+        try:
+            response = await self.request(method, self.api_url + '/clients/' + str(id_client), data={
+                **({} if name_first is None else {'name_first': name_first}),
+                **({} if name_last is None else {'name_last': name_last}),
+                **({} if email is None else {'email': email})
+            })
+            if response.status_code == 404:
+                raise LookupError("Client with such ID doesn't exist")
+            elif response.status_code == 409:
+                raise ValueError("Can't " + method + " this client (email must be unique)")
+            else:
+                return response.json()
+        except aiohttp.ClientError:
+            raise ConnectionError("Can't " + method + " client in database")
+
+    async def item_get(self, id_item=None):
+        return await self.__entity_get(self.request, self.api_url, 'items', 'item', id_item)
+
+    async def item_post(self, name, value):
+        shop_validation.check_item(name, value)
+        try:
+            response = await self.request('post', self.api_url + '/items/', data={
+                'name': name,
+                'value': value
+            })
+            return response.json()
+        except aiohttp.ClientError:
+            raise ConnectionError("Can't post item to database")
+
+    async def item_delete(self, id_item):
+        return await self.__entity_delete(self.request, self.api_url, 'items', 'item', id_item)
+
+    async def item_put_patch(self, id_item, name=None, value=None):
+        shop_validation.check_item_patch(id_item, name, value)
+        method = 'patch' if None in [name, value] else 'put'
+        try:
+            response = await self.request(method, self.api_url + '/items/' + str(id_item), data={
+                **({} if name is None else {'name': name}),
+                **({} if value is None else {'value': value})
+            })
+            if response.status_code == 404:
+                raise LookupError("Item with such ID doesn't exist")
+            else:
+                return response.json()
+        except aiohttp.ClientError:
+            raise ConnectionError("Can't " + method + " item in database")
+
+    async def order_post(self, id_client, ids_items):
+        shop_validation.check_order(id_client, ids_items)
+        try:
+            response = await self.request('post', self.api_url + '/orders/', data={
+                'id_client': id_client,
+                'ids_items': ids_items
+            })
+            if response.status_code == 404:
+                raise LookupError("Referenced entities don't exist")
+            else:
+                return response.json()
+        except aiohttp.ClientError:
+            raise ConnectionError("Can't post order to database")
+
+    async def order_get(self, id_order=None):
+        return await self.__entity_get(self.request, self.api_url, 'orders', 'order', id_order)
+
+    async def order_delete(self, id_order):
+        return await self.__entity_delete(self.request, self.api_url, 'orders', 'order', id_order)
+
+    async def order_put_patch(self, id_order, id_client=None, ids_items=None):
+        shop_validation.check_order_patch(id_order, id_client, ids_items)
+        method = 'patch' if None in [id_client, ids_items] else 'put'
+        try:
+            response = await self.request(method, self.api_url + '/orders/' + str(id_order), data={
+                **({} if id_client is None else {'id_client': id_client}),
+                **({} if ids_items is None else {'ids_items': ids_items})
+            })
+            if response.status_code == 404:
+                raise LookupError("Referenced entities don't exist")
+            else:
+                return response.json()
+        except aiohttp.ClientError:
+            raise ConnectionError("Can't " + method + " order in database")
@@ -0,0 +1,31 @@
+import argparse
+import sys
+import time
+from .shop_app import ShopApp
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='shop-export', description="Export clients, items or orders to CSV/NDJSON")
+    parser.add_argument('kind', choices=['clients', 'items', 'orders'])
+    parser.add_argument('path', help="output file, or - for standard output")
+    parser.add_argument('--api-url', required=True)
+    parser.add_argument('--format', dest='file_format', choices=['csv', 'ndjson'])
+    parser.add_argument('--gzip', action='store_true', default=None, help="compress the output (default: when path ends in .gz)")
+    parser.add_argument('--totals', action='store_true', help="add each order's total from the item price index")
+    parser.add_argument('--page-size', type=int, default=1000)
+    arguments = parser.parse_args(argv)
+    path = arguments.path
+    if path == '-':
+        path = sys.stdout.buffer if arguments.gzip else sys.stdout
+    start = time.perf_counter()
+    with ShopApp(arguments.api_url) as shop_app:
+        count = shop_app.export(arguments.kind, path, arguments.file_format, arguments.gzip, arguments.totals, arguments.page_size)
+    elapsed = time.perf_counter() - start
+    sys.stderr.write('Exported {} rows in {:.2f} s ({:.1f} rows/s)\n'.format(
+        count, elapsed, count / elapsed if elapsed > 0 else 0.0
+    ))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+import argparse
+import csv
+import gzip
+from itertools import islice
+import json
+import os
+import re
+import sys
+import time
+from .shop_app import ShopApp, detect_format
+
+FIELDS = {
+    'clients': ('name_first', 'name_last', 'email'),
+    'items': ('name', 'value'),
+    'orders': ('id_client', 'ids_items')
+}
+
+_SEPARATORS = re.compile(r'[\s;,]+')
+
+
+def _open(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def read_rows(file, file_format):
+    if file_format == 'csv':
+        yield from csv.DictReader(file)
+    else:
+        for line in file:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield line.rstrip('\r\n')
+
+
+def _integer(value):
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError("ID must be an integer")
+    return int(value)
+
+
+def parse_row(kind, raw):
+    if isinstance(raw, str):
+        raise ValueError("Row is not valid JSON")
+    elif not isinstance(raw, dict):
+        raise ValueError("Row must be an object")
+    missing = [field for field in FIELDS[kind] if raw.get(field) in (None, '')]
+    if missing:
+        raise ValueError("Row is missing " + ', '.join(missing))
+    if kind == 'clients':
+        return raw['name_first'], raw['name_last'], raw['email']
+    elif kind == 'items':
+        value = raw['value']
+        return raw['name'], float(value) if isinstance(value, str) else value
+    else:
+        ids_items = raw['ids_items']
+        if isinstance(ids_items, str):
+            ids_items = [part for part in _SEPARATORS.split(ids_items.strip('[] ')) if part]
+        return _integer(raw['id_client']), [_integer(id_item) for id_item in ids_items]
+
+
+def _read_checkpoint(path):
+    try:
+        with open(path) as file:
+            return int(file.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def _write_checkpoint(path, consumed):
+    path_temporary = path + '.tmp'
+    with open(path_temporary, 'w') as file:
+        file.write(str(consumed))
+    os.replace(path_temporary, path)
+
+
+def import_file(shop_app, kind, path, file_format=None, batch_size=1000, checkpoint=None, rejected=None, progress=None):
+    if kind not in FIELDS:
+        raise ValueError("Kind must be 'clients', 'items' or 'orders'")
+    elif not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("Batch size must be a positive integer")
+    send = {'clients': shop_app.register_clients, 'items': shop_app.add_items, 'orders': shop_app.make_orders}[kind]
+    consumed = 0 if checkpoint is None else _read_checkpoint(checkpoint)
+    counts = {'skipped': consumed, 'imported': 0, 'rejected': 0}
+    start = time.perf_counter()
+    rejected_file = None if rejected is None else open(rejected, 'a' if consumed else 'w')
+    try:
+        with _open(path) as file:
+            raws = islice(read_rows(file, detect_format(path, file_format)), consumed, None)
+            batch = list(islice(raws, batch_size))
+            while batch:
+                rows, failures = [], []
+                for number, raw in enumerate(batch, consumed + 1):
+                    try:
+                        rows.append((number, raw, parse_row(kind, raw)))
+                    except ValueError as error:
+                        failures.append((number, raw, error))
+                results = send([row for _, _, row in rows]) if rows else []
+                for (number, raw, _), (_, error) in zip(rows, results):
+                    if error is None:
+                        counts['imported'] += 1
+                    else:
+                        failures.append((number, raw, error))
+                counts['rejected'] += len(failures)
+                if rejected_file is not None:
+                    for number, raw, error in sorted(failures, key=lambda failure: failure[0]):
+                        rejected_file.write(json.dumps({'row': number, 'data': raw, 'error': str(error)}) + '\n')
+                    rejected_file.flush()
+                consumed += len(batch)
+                if checkpoint is not None:
+                    _write_checkpoint(checkpoint, consumed)
+                if progress is not None:
+                    progress(counts, time.perf_counter() - start)
+                batch = list(islice(raws, batch_size))
+    finally:
+        if rejected_file is not None:
+            rejected_file.close()
+    counts['elapsed'] = time.perf_counter() - start
+    return counts
+
+
+def _report(counts, elapsed):
+    processed = counts['imported'] + counts['rejected']
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    sys.stderr.write('{} rows, {} imported, {} rejected, {:.1f} rows/s\r'.format(
+        processed, counts['imported'], counts['rejected'], rate
+    ))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='shop-import', description="Import clients, items or orders from CSV/NDJSON")
+    parser.add_argument('kind', choices=sorted(FIELDS))
+    parser.add_argument('path')
+    parser.add_argument('--api-url', required=True)
+    parser.add_argument('--format', dest='file_format', choices=['csv', 'ndjson'])
+    parser.add_argument('--workers', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--checkpoint', help="resume from and record progress in this file")
+    parser.add_argument('--rejected', help="write rejected rows to this file (default: <path>.rejected.ndjson)")
+    parser.add_argument('--quiet', action='store_true')
+    arguments = parser.parse_args(argv)
+    with ShopApp(arguments.api_url, arguments.workers, arguments.workers) as shop_app:
+        counts = import_file(
+            shop_app, arguments.kind, arguments.path, arguments.file_format, arguments.batch_size, arguments.checkpoint,
+            arguments.rejected or arguments.path + '.rejected.ndjson', None if arguments.quiet else _report
+        )
+    processed = counts['imported'] + counts['rejected']
+    sys.stderr.write('{}{}Imported {} rows, rejected {} in {:.2f} s ({:.1f} rows/s)\n'.format(
+        '' if arguments.quiet else '\n',
+        'Resumed after ' + str(counts['skipped']) + ' rows. ' if counts['skipped'] else '',
+        counts['imported'], counts['rejected'], counts['elapsed'],
+        processed / counts['elapsed'] if counts['elapsed'] > 0 else 0.0
+    ))
+    return 0 if counts['rejected'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
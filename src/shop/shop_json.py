@@ -0,0 +1,20 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+decoders = {'json': json.loads}
+if ujson is not None:
+    decoders['ujson'] = ujson.loads
+if orjson is not None:
+    decoders['orjson'] = orjson.loads
+
+backend = 'orjson' if orjson is not None else 'ujson' if ujson is not None else 'json'
+loads = decoders[backend]
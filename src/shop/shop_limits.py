@@ -0,0 +1,63 @@
+import threading
+import time
+import requests
+
+
+class LimitExceeded(requests.ConnectionError):
+    pass
+
+
+class RateLimiter:
+    def __init__(self, rate=None, burst=None, max_in_flight=None, block=True, timeout=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate must be positive")
+        elif max_in_flight is not None and (not isinstance(max_in_flight, int) or max_in_flight < 1):
+            raise ValueError("Max in flight must be a positive integer")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.block = block
+        self.timeout = timeout
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.burst
+        self.updated_at = clock()
+        self.__lock = threading.Lock()
+        self.__in_flight = None if max_in_flight is None else threading.BoundedSemaphore(max_in_flight)
+
+    def __take_token(self, deadline):
+        while True:
+            with self.__lock:
+                now = self.clock()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            if not self.block or (deadline is not None and now + wait > deadline):
+                raise LimitExceeded("Rate limit exceeded")
+            self.sleep(wait)
+
+    def acquire(self):
+        deadline = None if self.timeout is None else self.clock() + self.timeout
+        if self.__in_flight is not None:
+            if not self.__in_flight.acquire(self.block, None if not self.block else self.timeout):
+                raise LimitExceeded("Too many requests in flight")
+        if self.rate is not None:
+            try:
+                self.__take_token(deadline)
+            except LimitExceeded:
+                self.release()
+                raise
+
+    def release(self):
+        if self.__in_flight is not None:
+            self.__in_flight.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
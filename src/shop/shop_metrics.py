@@ -0,0 +1,48 @@
+import bisect
+import threading
+
+
+class ShopMetrics:
+    buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__series = {}
+
+    def record(self, endpoint, method, duration, size=0, status_code=None):
+        with self.__lock:
+            series = self.__series.get((endpoint, method))
+            if series is None:
+                series = self.__series[endpoint, method] = {
+                    'count': 0,
+                    'errors': 0,
+                    'latency_sum': 0.0,
+                    'latency_max': 0.0,
+                    'latency_buckets': [0] * len(self.buckets),
+                    'bytes': 0,
+                    'status_codes': {}
+                }
+            series['count'] += 1
+            series['latency_sum'] += duration
+            series['latency_max'] = max(series['latency_max'], duration)
+            series['latency_buckets'][bisect.bisect_left(self.buckets, duration)] += 1
+            series['bytes'] += size
+            if status_code is None:
+                series['errors'] += 1
+            else:
+                series['status_codes'][status_code] = series['status_codes'].get(status_code, 0) + 1
+
+    def snapshot(self):
+        with self.__lock:
+            snapshot = {}
+            for (endpoint, method), series in self.__series.items():
+                snapshot.setdefault(endpoint, {})[method] = {
+                    **series,
+                    'latency_buckets': dict(zip(self.buckets, series['latency_buckets'])),
+                    'status_codes': dict(series['status_codes'])
+                }
+            return snapshot
+
+    def reset(self):
+        with self.__lock:
+            self.__series = {}
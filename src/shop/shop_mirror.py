@@ -0,0 +1,267 @@
+from collections import Counter
+import threading
+import time
+from . import shop_validation
+from .shop_app import ShopApp
+from .shop_catalog import ItemCatalog
+
+
+class ShopMirror(ShopApp):
+    def __init__(self, api_url, max_staleness=60.0, refresh_interval=None, pool_size=10, max_concurrency=10,
+                 clock=time.monotonic, retry_interval=5.0, **options):
+        super().__init__(api_url, pool_size, max_concurrency, **options)
+        self.max_staleness = max_staleness
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.clock = clock
+        self.refreshed_at = None
+        self.__lock = threading.RLock()
+        self.__refresh_lock = threading.Lock()
+        self.__refreshing = 0
+        self.__journal = []
+        self.__failed_at = None
+        self.__failure = None
+        self.__clients = {}
+        self.__items = {}
+        self.__orders = {}
+        self.__orders_by_client = {}
+        self.__stop = threading.Event()
+        self.__thread = None
+        if refresh_interval is not None:
+            self.__thread = threading.Thread(target=self.__refresh_periodically, daemon=True)
+            self.__thread.start()
+
+    def close(self):
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        super().close()
+
+    def __refresh_periodically(self):
+        while not self.__stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except (ConnectionError, LookupError):
+                pass
+
+    def refresh(self):
+        with self.__lock:
+            started_at = self.clock()
+            self.__refreshing += 1
+            journal_start = len(self.__journal)
+        try:
+            clients = self.shop_database.client_get()
+            items = self.shop_database.item_get()
+            orders = self.shop_database.order_get()
+            with self.__lock:
+                self.__clients = {client['id']: client for client in clients}
+                self.__items = {item['id']: item for item in items}
+                self.__orders = {}
+                self.__orders_by_client = {}
+                for order in orders:
+                    self.__put_order(order)
+                for operation in self.__journal[journal_start:]:
+                    operation()
+                self.refreshed_at = started_at
+                self.__failed_at = self.__failure = None
+        finally:
+            with self.__lock:
+                self.__refreshing -= 1
+                if self.__refreshing == 0:
+                    self.__journal = []
+
+    def __apply(self, operation):
+        with self.__lock:
+            operation()
+            if self.__refreshing:
+                self.__journal.append(operation)
+
+    def __needs_refresh(self):
+        with self.__lock:
+            if self.refreshed_at is not None and self.clock() - self.refreshed_at <= self.max_staleness:
+                return False
+            elif self.__failed_at is not None and self.clock() - self.__failed_at < self.retry_interval:
+                if self.refreshed_at is None:
+                    raise ConnectionError(str(self.__failure))
+                return False
+            return True
+
+    def __ensure_fresh(self):
+        if not self.__needs_refresh() or not self.__refresh_lock.acquire(self.refreshed_at is None):
+            return
+        try:
+            if self.__needs_refresh():
+                self.refresh()
+        except ConnectionError as error:
+            with self.__lock:
+                self.__failed_at = self.clock()
+                self.__failure = error
+            if self.refreshed_at is None:
+                raise
+        finally:
+            self.__refresh_lock.release()
+
+    def __lookup(self, table, word, id_entity):
+        shop_validation.check_id(word, id_entity)
+        self.__ensure_fresh()
+        entity = table().get(id_entity)
+        if entity is None:
+            raise LookupError(word.capitalize() + " with such ID doesn't exist")
+        return entity
+
+    def __all(self, table):
+        self.__ensure_fresh()
+        return list(table().values())
+
+    def __put_order(self, order):
+        self.__orders[order['id']] = order
+        self.__orders_by_client.setdefault(order['id_client'], {})[order['id']] = order
+
+    def __replace_order(self, order):
+        self.__pop_order(order['id'])
+        self.__put_order(order)
+
+    def __pop_order(self, id_order):
+        order = self.__orders.pop(id_order, None)
+        if order is not None:
+            orders_client = self.__orders_by_client[order['id_client']]
+            del orders_client[id_order]
+            if not orders_client:
+                del self.__orders_by_client[order['id_client']]
+        return order
+
+    @staticmethod
+    def __merge(table, id_entity, fields):
+        entity = table.get(id_entity)
+        if entity is not None:
+            table[id_entity] = {**entity, **{key: value for key, value in fields.items() if value is not None}}
+
+    @staticmethod
+    def __created(rows, results, names):
+        for row, (id_entity, error) in zip(rows, results):
+            if error is None:
+                yield {'id': id_entity, **(dict(row) if isinstance(row, dict) else dict(zip(names, row)))}
+
+    def download_client(self, id_client):
+        return self.__lookup(lambda: self.__clients, 'client', id_client)
+
+    def download_all_clients(self):
+        return self.__all(lambda: self.__clients)
+
+    def iter_clients(self, page_size=100):
+        return iter(self.download_all_clients())
+
+    def register_client(self, name_first, name_last, email):
+        id_client = super().register_client(name_first, name_last, email)
+        client = {'id': id_client, 'name_first': name_first, 'name_last': name_last, 'email': email}
+        self.__apply(lambda: self.__clients.__setitem__(id_client, client))
+        return id_client
+
+    def register_clients(self, clients):
+        results = super().register_clients(clients)
+        created = {client['id']: client for client in self.__created(clients, results, ['name_first', 'name_last', 'email'])}
+        self.__apply(lambda: self.__clients.update(created))
+        return results
+
+    def remove_client(self, id_client):
+        super().remove_client(id_client)
+        self.__apply(lambda: self.__clients.pop(id_client, None))
+        return True
+
+    def modify_client(self, id_client, name_first=None, name_last=None, email=None):
+        super().modify_client(id_client, name_first, name_last, email)
+        fields = {'name_first': name_first, 'name_last': name_last, 'email': email}
+        self.__apply(lambda: self.__merge(self.__clients, id_client, fields))
+        return True
+
+    def download_item(self, id_item):
+        return self.__lookup(lambda: self.__items, 'item', id_item)
+
+    def download_all_items(self):
+        return self.__all(lambda: self.__items)
+
+    def iter_items(self, page_size=100):
+        return iter(self.download_all_items())
+
+    def download_catalog(self, page_size=1000):
+        return ItemCatalog(self.download_all_items())
+
+    def add_item(self, name, value):
+        id_item = super().add_item(name, value)
+        item = {'id': id_item, 'name': name, 'value': value}
+        self.__apply(lambda: self.__items.__setitem__(id_item, item))
+        return id_item
+
+    def add_items(self, items):
+        results = super().add_items(items)
+        created = {item['id']: item for item in self.__created(items, results, ['name', 'value'])}
+        self.__apply(lambda: self.__items.update(created))
+        return results
+
+    def remove_item(self, id_item):
+        super().remove_item(id_item)
+        self.__apply(lambda: self.__items.pop(id_item, None))
+        return True
+
+    def modify_item(self, id_item, name=None, value=None):
+        super().modify_item(id_item, name, value)
+        fields = {'name': name, 'value': value}
+        self.__apply(lambda: self.__merge(self.__items, id_item, fields))
+        return True
+
+    def download_order(self, id_order):
+        return self.__lookup(lambda: self.__orders, 'order', id_order)
+
+    def download_all_orders(self):
+        return self.__all(lambda: self.__orders)
+
+    def iter_orders(self, page_size=100):
+        return iter(self.download_all_orders())
+
+    def make_order(self, id_client, ids_items):
+        id_order = super().make_order(id_client, ids_items)
+        order = {'id': id_order, 'id_client': id_client, 'ids_items': list(ids_items)}
+        self.__apply(lambda: self.__replace_order(order))
+        return id_order
+
+    def make_orders(self, orders):
+        results = super().make_orders(orders)
+        created = list(self.__created(orders, results, ['id_client', 'ids_items']))
+
+        def put_orders():
+            for order in created:
+                self.__replace_order(order)
+        self.__apply(put_orders)
+        return results
+
+    def remove_order(self, id_order):
+        super().remove_order(id_order)
+        self.__apply(lambda: self.__pop_order(id_order))
+        return True
+
+    def modify_order(self, id_order, id_client=None, ids_items=None):
+        super().modify_order(id_order, id_client, ids_items)
+        fields = {
+            **({} if id_client is None else {'id_client': id_client}),
+            **({} if ids_items is None else {'ids_items': list(ids_items)})
+        }
+
+        def merge_order():
+            order = self.__orders.get(id_order)
+            if order is not None:
+                self.__replace_order({**order, **fields})
+        self.__apply(merge_order)
+        return True
+
+    def get_client_orders(self, id_client):
+        self.__ensure_fresh()
+        with self.__lock:
+            return list(self.__orders_by_client.get(id_client, {}).values())
+
+    def get_order_total(self, id_order):
+        order = self.download_order(id_order)
+        total = 0
+        for id_item, quantity in Counter(order['ids_items']).items():
+            total += self.download_item(id_item)['value'] * quantity
+        return total
@@ -0,0 +1,85 @@
+from urllib.parse import urlsplit
+import random
+import threading
+import time
+import requests
+
+
+class CircuitOpenError(requests.ConnectionError):
+    pass
+
+
+class RetryPolicy:
+    def __init__(self, retries=3, backoff=0.1, backoff_max=5.0, methods=('get', 'put', 'delete'),
+                 status_codes=(502, 503, 504), sleep=time.sleep, jitter=random.random):
+        if not isinstance(retries, int) or retries < 0:
+            raise ValueError("Retries must be a non-negative integer")
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.methods = methods
+        self.status_codes = status_codes
+        self.sleep = sleep
+        self.jitter = jitter
+
+    def attempts(self, method):
+        return 1 + (self.retries if method in self.methods else 0)
+
+    def wait(self, attempt):
+        self.sleep(self.jitter() * min(self.backoff_max, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker:
+    __shared = {}
+    __shared_lock = threading.Lock()
+
+    def __init__(self, threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        if not isinstance(threshold, int) or threshold < 1:
+            raise ValueError("Threshold must be a positive integer")
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, api_url, threshold=5, reset_timeout=30.0):
+        host = urlsplit(api_url).netloc
+        with cls.__shared_lock:
+            if host not in cls.__shared:
+                cls.__shared[host] = cls(threshold, reset_timeout)
+            return cls.__shared[host]
+
+    @property
+    def state(self):
+        with self.__lock:
+            if self.opened_at is None:
+                return 'closed'
+            elif self.probing or self.clock() - self.opened_at >= self.reset_timeout:
+                return 'half-open'
+            else:
+                return 'open'
+
+    def before(self):
+        with self.__lock:
+            if self.opened_at is None:
+                return
+            elif self.probing or self.clock() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError("Circuit breaker is open")
+            else:
+                self.probing = True
+
+    def success(self):
+        with self.__lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def failure(self):
+        with self.__lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.threshold:
+                self.opened_at = self.clock()
+            self.probing = False
@@ -0,0 +1,350 @@
+import argparse
+from bisect import bisect_left
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlsplit
+import json
+import sys
+import threading
+
+
+class BadRequest(Exception):
+    pass
+
+
+class ShopStore:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.tables = {'clients': {}, 'items': {}, 'orders': {}}
+        self.ids = {'clients': [], 'items': [], 'orders': []}
+        self.ids_next = {'clients': 0, 'items': 0, 'orders': 0}
+        self.versions = {'clients': 0, 'items': 0, 'orders': 0}
+        self.clients_by_email = {}
+        self.orders_by_client = {}
+        self.orders_items = {}
+        self.items_orders = {}
+        self.__bodies = {}
+
+    def seed(self, clients, items, orders_per_client, items_per_order):
+        for i in range(clients):
+            self.insert('clients', {'name_first': 'Name', 'name_last': 'Surname', 'email': 'client_' + str(i) + '@example.com'})
+        for i in range(items):
+            self.insert('items', {'name': 'Item ' + str(i), 'value': float(i % 10000) + 0.99})
+        if items:
+            for i in range(clients * orders_per_client):
+                self.insert('orders', {
+                    'id_client': i % clients,
+                    'ids_items': [(i * 7 + j * 13) % items for j in range(items_per_order)]
+                })
+
+    def __check_references(self, data):
+        if 'id_client' in data and data['id_client'] not in self.tables['clients']:
+            raise LookupError("Referenced entities don't exist")
+        elif any(id_item not in self.tables['items'] for id_item in data.get('ids_items', ())):
+            raise LookupError("Referenced entities don't exist")
+
+    def __check_email(self, data, id_entity=None):
+        if 'email' in data and self.clients_by_email.get(data['email'], id_entity) != id_entity:
+            raise ValueError("Email must be unique")
+
+    def __link_order(self, id_order, id_client, ids_items):
+        self.tables['orders'][id_order] = {'id': id_order, 'id_client': id_client}
+        self.orders_by_client.setdefault(id_client, set()).add(id_order)
+        self.orders_items[id_order] = list(ids_items)
+        for id_item in ids_items:
+            self.items_orders.setdefault(id_item, Counter())[id_order] += 1
+
+    def __unlink_order(self, id_order):
+        order = self.tables['orders'].pop(id_order)
+        orders_client = self.orders_by_client[order['id_client']]
+        orders_client.discard(id_order)
+        if not orders_client:
+            del self.orders_by_client[order['id_client']]
+        for id_item in self.orders_items.pop(id_order):
+            orders_item = self.items_orders[id_item]
+            del orders_item[id_order]
+            if not orders_item:
+                del self.items_orders[id_item]
+        return order
+
+    def __entity(self, endpoint, id_entity):
+        entity = self.tables[endpoint][id_entity]
+        if endpoint == 'orders':
+            return {**entity, 'ids_items': list(self.orders_items[id_entity])}
+        return dict(entity)
+
+    def __touch(self, endpoint):
+        self.versions[endpoint] += 1
+        self.__bodies.pop(endpoint, None)
+
+    def insert(self, endpoint, data):
+        with self.lock:
+            if endpoint == 'clients':
+                self.__check_email(data)
+            elif endpoint == 'orders':
+                self.__check_references(data)
+            id_entity = self.ids_next[endpoint]
+            self.ids_next[endpoint] += 1
+            if endpoint == 'orders':
+                self.__link_order(id_entity, data['id_client'], data['ids_items'])
+            else:
+                self.tables[endpoint][id_entity] = {'id': id_entity, **data}
+                if endpoint == 'clients':
+                    self.clients_by_email[data['email']] = id_entity
+            self.ids[endpoint].append(id_entity)
+            self.__touch(endpoint)
+            return self.__entity(endpoint, id_entity)
+
+    def get(self, endpoint, id_entity):
+        with self.lock:
+            if id_entity not in self.tables[endpoint]:
+                raise LookupError(endpoint[:-1].capitalize() + " with such ID doesn't exist")
+            return self.__entity(endpoint, id_entity)
+
+    def page(self, endpoint, offset=0, limit=None):
+        with self.lock:
+            ids = self.ids[endpoint][offset:None if limit is None else offset + limit]
+            return [self.__entity(endpoint, id_entity) for id_entity in ids]
+
+    def body(self, endpoint):
+        with self.lock:
+            version = self.versions[endpoint]
+            cached = self.__bodies.get(endpoint)
+            if cached is not None and cached[0] == version:
+                return cached
+            entities = self.page(endpoint)
+        body = json.dumps(entities).encode()
+        with self.lock:
+            if self.versions[endpoint] == version:
+                self.__bodies[endpoint] = version, body
+        return version, body
+
+    def update(self, endpoint, id_entity, data):
+        with self.lock:
+            if id_entity not in self.tables[endpoint]:
+                raise LookupError(endpoint[:-1].capitalize() + " with such ID doesn't exist")
+            elif endpoint == 'clients':
+                self.__check_email(data, id_entity)
+            elif endpoint == 'orders':
+                self.__check_references(data)
+            if endpoint == 'orders':
+                ids_items = self.orders_items[id_entity]
+                order = self.__unlink_order(id_entity)
+                self.__link_order(id_entity, data.get('id_client', order['id_client']), data.get('ids_items', ids_items))
+            else:
+                entity = self.tables[endpoint][id_entity]
+                if endpoint == 'clients' and 'email' in data:
+                    del self.clients_by_email[entity['email']]
+                    self.clients_by_email[data['email']] = id_entity
+                self.tables[endpoint][id_entity] = {**entity, **data}
+            self.__touch(endpoint)
+            return self.__entity(endpoint, id_entity)
+
+    def delete(self, endpoint, id_entity):
+        with self.lock:
+            if id_entity not in self.tables[endpoint]:
+                raise LookupError(endpoint[:-1].capitalize() + " with such ID doesn't exist")
+            entity = self.__entity(endpoint, id_entity)
+            if endpoint == 'orders':
+                self.__unlink_order(id_entity)
+            else:
+                del self.tables[endpoint][id_entity]
+                if endpoint == 'clients':
+                    del self.clients_by_email[entity['email']]
+            ids = self.ids[endpoint]
+            del ids[bisect_left(ids, id_entity)]
+            self.__touch(endpoint)
+            return entity
+
+    def client_orders(self, id_client):
+        with self.lock:
+            return [self.__entity('orders', id_order) for id_order in sorted(self.orders_by_client.get(id_client, ()))]
+
+    def item_orders(self, id_item):
+        with self.lock:
+            return sorted(self.items_orders.get(id_item, ()))
+
+
+def parse_form(endpoint, body, required=False):
+    try:
+        data = _parse_form(endpoint, parse_qs(body.decode(), keep_blank_values=True))
+    except ValueError:
+        raise BadRequest("Malformed fields")
+    if required and len(data) < {'clients': 3, 'items': 2, 'orders': 2}[endpoint]:
+        raise BadRequest("Missing fields")
+    return data
+
+
+def _parse_form(endpoint, form):
+    if endpoint == 'clients':
+        return {key: form[key][0] for key in ['name_first', 'name_last', 'email'] if key in form}
+    elif endpoint == 'items':
+        return {
+            **({'name': form['name'][0]} if 'name' in form else {}),
+            **({'value': float(form['value'][0])} if 'value' in form else {})
+        }
+    else:
+        return {
+            **({'id_client': int(form['id_client'][0])} if 'id_client' in form else {}),
+            **({'ids_items': list(map(int, form['ids_items']))} if 'ids_items' in form else {})
+        }
+
+
+class ShopHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    store = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def respond(self, value, status_code=200, body=None, etag=None):
+        body = json.dumps(value).encode() if body is None else body
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def route(self):
+        url = urlsplit(self.path)
+        path = url.path.split('/')
+        if len(path) != 3 or path[1] not in self.store.tables or not (path[2] == '' or path[2].isdigit()):
+            raise KeyError(url.path)
+        id_entity = None if path[2] == '' else int(path[2])
+        return path[1], id_entity, parse_qs(url.query)
+
+    def body(self):
+        return self.payload
+
+    def dispatch(self, handle):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            self.close_connection = True
+            self.respond({}, 400)
+            return
+        self.payload = self.rfile.read(length)
+        try:
+            handle()
+        except BadRequest:
+            self.respond({}, 400)
+        except LookupError:
+            self.respond({}, 404)
+        except ValueError:
+            self.respond({}, 409)
+
+    def handle_get(self):
+        endpoint, id_entity, query = self.route()
+        if id_entity is not None:
+            self.respond(self.store.get(endpoint, id_entity))
+        elif 'offset' in query or 'limit' in query:
+            try:
+                offset = int(query.get('offset', ['0'])[0])
+                limit = int(query['limit'][0]) if 'limit' in query else None
+            except ValueError:
+                raise BadRequest("Malformed page")
+            if offset < 0 or (limit is not None and limit < 0):
+                raise BadRequest("Malformed page")
+            self.respond(self.store.page(endpoint, offset, limit))
+        else:
+            version, body = self.store.body(endpoint)
+            etag = '"' + endpoint + '-' + str(version) + '"'
+            if self.headers.get('If-None-Match') == etag:
+                self.respond(None, 304, b'', etag)
+            else:
+                self.respond(None, 200, body, etag)
+
+    def handle_post(self):
+        endpoint, id_entity, _ = self.route()
+        if id_entity is not None:
+            raise KeyError(id_entity)
+        self.respond(self.store.insert(endpoint, parse_form(endpoint, self.body(), True)), 201)
+
+    def handle_put(self):
+        endpoint, id_entity, _ = self.route()
+        if id_entity is None:
+            raise KeyError(endpoint)
+        self.respond(self.store.update(endpoint, id_entity, parse_form(endpoint, self.body(), self.command == 'PUT')))
+
+    def handle_delete(self):
+        endpoint, id_entity, _ = self.route()
+        if id_entity is None:
+            raise KeyError(endpoint)
+        self.respond(self.store.delete(endpoint, id_entity))
+
+    def do_GET(self):
+        self.dispatch(self.handle_get)
+
+    def do_POST(self):
+        self.dispatch(self.handle_post)
+
+    def do_PUT(self):
+        self.dispatch(self.handle_put)
+
+    do_PATCH = do_PUT
+
+    def do_DELETE(self):
+        self.dispatch(self.handle_delete)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class ShopServer:
+    def __init__(self, store=None, host='127.0.0.1', port=0):
+        self.store = ShopStore() if store is None else store
+        handler = type('BoundShopHandler', (ShopHandler,), {'store': self.store})
+        self.server = _ThreadingHTTPServer((host, port), handler)
+        self.api_url = 'http://' + host + ':' + str(self.server.server_address[1])
+        self.__thread = None
+
+    def start(self):
+        self.__thread = threading.Thread(target=self.server.serve_forever, args=(0.1,), daemon=True)
+        self.__thread.start()
+        return self
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def stop(self):
+        if self.__thread is not None:
+            self.server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='shop-server', description="Run the reference shop API backend")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--clients', type=int, default=0)
+    parser.add_argument('--items', type=int, default=0)
+    parser.add_argument('--orders-per-client', type=int, default=0)
+    parser.add_argument('--items-per-order', type=int, default=3)
+    arguments = parser.parse_args(argv)
+    shop_server = ShopServer(host=arguments.host, port=arguments.port)
+    shop_server.store.seed(arguments.clients, arguments.items, arguments.orders_per_client, arguments.items_per_order)
+    sys.stderr.write('Serving on ' + shop_server.api_url + '\n')
+    try:
+        shop_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shop_server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
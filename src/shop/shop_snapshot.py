@@ -0,0 +1,160 @@
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+_HEADER = struct.Struct('=8s8sQQ')
+_MAGIC = b'SHOPSNAP'
+
+
+class CatalogSnapshot:
+    kinds = {
+        'clients': ('client', (), ('name_first', 'name_last', 'email')),
+        'items': ('item', ('value',), ('name',))
+    }
+
+    def __init__(self, path, check_interval=1.0, clock=time.monotonic):
+        self.path = path
+        self.check_interval = check_interval
+        self.clock = clock
+        self.checked_at = clock()
+        self.__lock = threading.Lock()
+        self.__state = self.__load()
+
+    @classmethod
+    def write(cls, path, kind, entities):
+        if kind not in cls.kinds:
+            raise ValueError("Snapshot kind must be 'clients' or 'items'")
+        _, numbers, strings = cls.kinds[kind]
+        rows = sorted({entity['id']: entity for entity in entities}.items())
+        ids = array('q', (id_entity for id_entity, _ in rows))
+        columns = [array('q', (int(round(entity[field] * 100)) for _, entity in rows)) for field in numbers]
+        offsets = array('Q', [0])
+        heap = bytearray()
+        for _, entity in rows:
+            for field in strings:
+                heap += entity[field].encode('utf-8')
+                offsets.append(len(heap))
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, path_temporary = tempfile.mkstemp(prefix='.snapshot-', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(_HEADER.pack(_MAGIC, kind.encode('ascii'), len(ids), len(heap)))
+                file.write(ids.tobytes())
+                for column in columns:
+                    file.write(column.tobytes())
+                file.write(offsets.tobytes())
+                file.write(heap)
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(path_temporary, 0o644)
+            os.replace(path_temporary, path)
+        except BaseException:
+            os.unlink(path_temporary)
+            raise
+
+    @classmethod
+    def dump(cls, shop_database, path, kind, page_size=1000):
+        if kind not in cls.kinds:
+            raise ValueError("Snapshot kind must be 'clients' or 'items'")
+        cls.write(path, kind, getattr(shop_database, cls.kinds[kind][0] + '_iter')(page_size))
+
+    def __load(self):
+        with open(self.path, 'rb') as file:
+            status = os.fstat(file.fileno())
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, kind, count, _ = _HEADER.unpack_from(buffer)
+        kind = kind.rstrip(b'\0').decode('ascii')
+        if magic != _MAGIC or kind not in self.kinds:
+            raise ValueError("File is not a catalog snapshot")
+        word, numbers, strings = self.kinds[kind]
+        view = memoryview(buffer)
+        position = _HEADER.size
+        ids = view[position:position + count * 8].cast('q')
+        position += count * 8
+        columns = {}
+        for field in numbers:
+            columns[field] = view[position:position + count * 8].cast('q')
+            position += count * 8
+        offsets = view[position:position + (count * len(strings) + 1) * 8].cast('Q')
+        position += len(offsets) * 8
+        return {
+            'signature': (status.st_ino, status.st_mtime_ns, status.st_size),
+            'kind': kind,
+            'word': word,
+            'ids': ids,
+            'columns': columns,
+            'strings': strings,
+            'offsets': offsets,
+            'heap': view[position:]
+        }
+
+    def reload(self):
+        with self.__lock:
+            self.checked_at = self.clock()
+            status = os.stat(self.path)
+            if (status.st_ino, status.st_mtime_ns, status.st_size) == self.__state['signature']:
+                return False
+            self.__state = self.__load()
+            return True
+
+    def __current(self):
+        if self.check_interval is not None and self.clock() - self.checked_at >= self.check_interval:
+            self.reload()
+        return self.__state
+
+    @staticmethod
+    def __row(state, id_entity):
+        ids = state['ids']
+        row = bisect_left(ids, id_entity)
+        if row == len(ids) or ids[row] != id_entity:
+            raise LookupError(state['word'].capitalize() + " with such ID doesn't exist")
+        return row
+
+    @staticmethod
+    def __entity(state, row):
+        entity = {'id': state['ids'][row]}
+        for field, column in state['columns'].items():
+            entity[field] = column[row] / 100
+        offsets, heap, strings = state['offsets'], state['heap'], state['strings']
+        for index, field in enumerate(strings, row * len(strings)):
+            entity[field] = str(heap[offsets[index]:offsets[index + 1]], 'utf-8')
+        return entity
+
+    @property
+    def kind(self):
+        return self.__current()['kind']
+
+    @property
+    def ids(self):
+        return self.__current()['ids']
+
+    def __len__(self):
+        return len(self.__current()['ids'])
+
+    def __contains__(self, id_entity):
+        state = self.__current()
+        ids = state['ids']
+        row = bisect_left(ids, id_entity)
+        return row < len(ids) and ids[row] == id_entity
+
+    def __iter__(self):
+        state = self.__current()
+        return (self.__entity(state, row) for row in range(len(state['ids'])))
+
+    def get(self, id_entity):
+        state = self.__current()
+        return self.__entity(state, self.__row(state, id_entity))
+
+    def price_cents(self, id_item):
+        state = self.__current()
+        if state['kind'] != 'items':
+            raise ValueError("Only item snapshots have prices")
+        return state['columns']['value'][self.__row(state, id_item)]
+
+    def price(self, id_item):
+        return self.price_cents(id_item) / 100
@@ -0,0 +1,146 @@
+import re
+
+API_URL_PATTERN = re.compile(r"(https?://(?:www\.|(?!www))[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]\.[^\s]{2,}|www\.[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]\.[^\s]{2,}|https?://(?:www\.|(?!www))[a-zA-Z0-9]+\.[^\s]{2,}|www\.[a-zA-Z0-9]+\.[^\s]{2,})")
+EMAIL_PATTERN = re.compile(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)")
+
+
+def check_api_url(api_url):
+    if not isinstance(api_url, str):
+        raise TypeError("Api URL must be a string")
+    elif not API_URL_PATTERN.match(api_url):
+        raise ValueError("Api URL must be a valid url")
+
+
+def email_invalid(email):
+    return not EMAIL_PATTERN.match(email)
+
+
+def value_invalid(value):
+    return round(value, 2) != value
+
+
+def check_id(word, id_entity):
+    if not isinstance(id_entity, int):
+        raise TypeError(word.capitalize() + " ID must be an integer")
+
+
+def check_client(name_first, name_last, email):
+    if not isinstance(name_first, str) or not isinstance(name_last, str) or not isinstance(email, str):
+        raise TypeError("Names and email must be strings")
+    elif name_first == '' or name_last == '':
+        raise ValueError("Both names must be non-empty")
+    elif email_invalid(email):
+        raise ValueError("Email must be valid")
+
+
+def check_client_patch(id_client, name_first=None, name_last=None, email=None):
+    if name_first == name_last == email is None:
+        raise AttributeError("Patch must have at least one attribute")
+    elif not isinstance(id_client, int):
+        raise TypeError("Client ID must be an integer")
+    elif (name_first is not None and not isinstance(name_first, str)) or (name_last is not None and not isinstance(name_last, str)) or (email is not None and not isinstance(email, str)):
+        raise TypeError("Names and email must be strings")
+    elif name_first == '' or name_last == '':
+        raise ValueError("Both names must be non-empty")
+    elif email is not None and email_invalid(email):
+        raise ValueError("Email must be valid")
+
+
+def check_item(name, value):
+    if not isinstance(name, str):
+        raise TypeError("Name must be a string")
+    elif not isinstance(value, float):
+        raise TypeError("Value must be a float")
+    elif name == '':
+        raise ValueError("Name must not be empty")
+    elif value_invalid(value):
+        raise ValueError("Value must have no more than 2 decimal places")
+
+
+def check_item_patch(id_item, name=None, value=None):
+    if name == value is None:
+        raise AttributeError("Patch must have at least one attribute")
+    elif not isinstance(id_item, int):
+        raise TypeError("Item ID must be an integer")
+    elif name is not None and not isinstance(name, str):
+        raise TypeError("Name must be a string")
+    elif value is not None and not isinstance(value, float):
+        raise TypeError("Value must be a float")
+    elif name == '':
+        raise ValueError("Name must not be empty")
+    elif value is not None and value_invalid(value):
+        raise ValueError("Value must have no more than 2 decimal places")
+
+
+def check_ids_items(ids_items):
+    if not all(isinstance(i, int) for i in ids_items):
+        raise TypeError("Items IDs must all be integers")
+
+
+def check_order(id_client, ids_items):
+    if not isinstance(id_client, int):
+        raise TypeError("Client ID must be an integer")
+    elif not isinstance(ids_items, list):
+        raise TypeError("Items IDs must be a list")
+    elif len(ids_items) < 1:
+        raise ValueError("Items IDs must not be empty")
+    else:
+        check_ids_items(ids_items)
+
+
+def check_order_patch(id_order, id_client=None, ids_items=None):
+    if id_client == ids_items is None:
+        raise AttributeError("Patch must have at least one attribute")
+    elif not isinstance(id_order, int) or (id_client is not None and not isinstance(id_client, int)):
+        raise TypeError("Both order and client IDs must be integers")
+    elif ids_items is not None and not isinstance(ids_items, list):
+        raise TypeError("Items IDs must be a list")
+    elif ids_items is not None and len(ids_items) < 1:
+        raise ValueError("Items IDs must not be empty")
+    elif ids_items is not None:
+        check_ids_items(ids_items)
+
+
+def _validate_rows(check, rows):
+    errors = []
+    for index, row in enumerate(rows):
+        try:
+            if isinstance(row, dict):
+                check(**row)
+            else:
+                check(*row)
+        except (TypeError, ValueError) as error:
+            errors.append((index, error))
+    return errors
+
+
+def validate_clients(rows):
+    errors = _validate_rows(check_client, rows)
+    invalid = {index for index, _ in errors}
+    emails = set()
+    for index, row in enumerate(rows):
+        if index not in invalid:
+            email = row['email'] if isinstance(row, dict) else row[2]
+            if email in emails:
+                errors.append((index, ValueError("Can't post this client (email must be unique)")))
+            emails.add(email)
+    return sorted(errors, key=lambda error: error[0])
+
+
+def validate_items(rows):
+    return _validate_rows(check_item, rows)
+
+
+def validate_orders(rows, ids_clients=None, ids_items=None):
+    errors = _validate_rows(check_order, rows)
+    if ids_clients is not None or ids_items is not None:
+        ids_items = None if ids_items is None else set(ids_items)
+        invalid = {index for index, _ in errors}
+        for index, row in enumerate(rows):
+            if index not in invalid:
+                id_client, ids_items_order = (row['id_client'], row['ids_items']) if isinstance(row, dict) else row
+                if (ids_clients is not None and id_client not in ids_clients) or \
+                        (ids_items is not None and not ids_items.issuperset(ids_items_order)):
+                    errors.append((index, LookupError("Referenced entities don't exist")))
+        errors.sort(key=lambda error: error[0])
+    return errors
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+import threading
+from . import shop_validation
+
+
+class WriteBuffer:
+    checks = {
+        'client': shop_validation.check_client_patch,
+        'item': shop_validation.check_item_patch,
+        'order': shop_validation.check_order_patch
+    }
+
+    def __init__(self, shop_database, window=0.5, on_error=None):
+        self.shop_database = shop_database
+        self.window = window
+        self.on_error = on_error
+        self.failures = []
+        self.hooks_failure = []
+        self.__pending = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__flush_lock = threading.Lock()
+        self.__timer = None
+
+    def put(self, kind, id_entity, fields):
+        fields = {key: value for key, value in fields.items() if value is not None}
+        self.checks[kind](id_entity, **fields)
+        with self.__lock:
+            key = kind, id_entity
+            self.__pending[key] = {**self.__pending.get(key, {}), **fields}
+            if self.__timer is None:
+                self.__timer = threading.Timer(self.window, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def discard(self, kind, id_entity):
+        with self.__lock:
+            self.__pending.pop((kind, id_entity), None)
+
+    def pending(self):
+        with self.__lock:
+            return len(self.__pending)
+
+    def flush(self):
+        with self.__flush_lock:
+            with self.__lock:
+                pending = self.__pending
+                self.__pending = OrderedDict()
+                if self.__timer is not None:
+                    self.__timer.cancel()
+                    self.__timer = None
+            failures = []
+            for (kind, id_entity), fields in pending.items():
+                try:
+                    getattr(self.shop_database, kind + '_put_patch')(id_entity, **fields)
+                except (LookupError, ValueError, ConnectionError) as error:
+                    failures.append((kind, id_entity, fields, error))
+                    for hook in self.hooks_failure:
+                        hook(kind, id_entity, fields, error)
+                    if self.on_error is None:
+                        self.failures.append(failures[-1])
+                    else:
+                        self.on_error(kind, id_entity, fields, error)
+            return failures
@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock
+from src.shop.analytics import SalesReport, sales_report
+from src.shop.shop_catalog import ItemCatalog
+
+
+class TestAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.item_catalog = ItemCatalog([
+            {
+                'id': 0,
+                'name': 'PlayStation 4 Slim',
+                'value': 1288.00
+            },
+            {
+                'id': 1,
+                'name': 'Xbox One S',
+                'value': 1049.99
+            },
+            {
+                'id': 2,
+                'name': 'Nintendo Switch',
+                'value': 1479.00
+            }
+        ])
+        self.orders = [
+            {
+                'id': 0,
+                'id_client': 0,
+                'ids_items': [2]
+            },
+            {
+                'id': 1,
+                'id_client': 1,
+                'ids_items': [1, 0]
+            },
+            {
+                'id': 2,
+                'id_client': 0,
+                'ids_items': [1, 1]
+            }
+        ]
+        self.shop_app = MagicMock()
+        self.shop_app.download_catalog.return_value = self.item_catalog
+        self.shop_app.iter_orders.side_effect = lambda page_size: iter(self.orders)
+
+    def assert_report(self, report):
+        self.assertEqual(report.orders, 3)
+        self.assertEqual(report.revenue(), 5916.97)
+        self.assertAlmostEqual(report.average_order_value(), 5916.97 / 3)
+        self.assertDictEqual(report.spend_per_client(), {0: 3578.98, 1: 2337.99})
+        self.assertDictEqual(report.orders_per_client(), {0: 2, 1: 1})
+        self.assertDictEqual(report.revenue_per_item(), {0: 1288.00, 1: 3149.97, 2: 1479.00})
+        self.assertListEqual(report.top_selling_items(1), [(1, 3)])
+        self.assertListEqual(report.top_grossing_items(2), [(1, 3149.97), (2, 1479.00)])
+        self.assertListEqual(report.top_clients(1), [(0, 3578.98)])
+
+    def test_sales_report(self):
+        self.assert_report(sales_report(self.shop_app, page_size=500))
+        self.shop_app.download_catalog.assert_called_once_with(500)
+        self.shop_app.iter_orders.assert_called_once_with(500)
+
+    def test_sales_report_processes(self):
+        self.assert_report(sales_report(self.shop_app, processes=2, chunk_size=1))
+
+    def test_sales_report_empty(self):
+        self.orders = []
+        report = sales_report(self.shop_app)
+        self.assertEqual(report.average_order_value(), 0.0)
+        self.assertListEqual(report.top_selling_items(), [])
+
+    def test_sales_report_missing_item(self):
+        self.orders.append({'id': 3, 'id_client': 1, 'ids_items': [999]})
+        with self.assertRaisesRegex(LookupError, "^Item with such ID doesn't exist$"):
+            sales_report(self.shop_app)
+
+    def test_merge(self):
+        report = SalesReport()
+        report.add(self.orders[0], self.item_catalog)
+        other = SalesReport()
+        other.add(self.orders[1], self.item_catalog)
+        other.add(self.orders[2], self.item_catalog)
+        self.assert_report(report.merge(other))
+
+    def tearDown(self):
+        self.shop_app = None
+        self.item_catalog = None
+
+
+if __name__ == '__main__':
+    unittest.main()
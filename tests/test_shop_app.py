@@ -1,6 +1,13 @@
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
 import unittest
-from unittest.mock import MagicMock, call
-from src.shop.shop_app import ShopApp
+from unittest.mock import MagicMock, Mock, call
+from src.shop.shop_app import ShopApp, detect_format
+from src.shop.shop_write_buffer import WriteBuffer
 
 
 class TestShopApp(unittest.TestCase):
@@ -84,6 +91,30 @@ class TestShopApp(unittest.TestCase):
         self.shop_app.register_client(*params)
         self.shop_app.shop_database.client_post.assert_called_once_with(*params)
 
+    def test_register_clients(self):
+        error = ValueError("Email must be valid")
+        self.shop_app.shop_database.client_post_many.return_value = [{'id': 2}, error]
+        self.assertListEqual(self.shop_app.register_clients([
+            ('Henry', 'Glenn', 'henry_glenn@example.com'),
+            ('Henry', 'Glenn', 'henry_glenn@examplecom')
+        ]), [(2, None), (None, error)])
+
+    def test_add_items_mock_check(self):
+        items = [('PlayStation 5', 2199.99)]
+        self.shop_app.shop_database.item_post_many.return_value = [{'id': 3}]
+        self.shop_app.add_items(items)
+        self.shop_app.shop_database.item_post_many.assert_called_once_with(items, self.shop_app.max_concurrency)
+
+    def test_make_orders_indexed(self):
+        error = LookupError("Referenced entities don't exist")
+        self.shop_app.shop_database.order_post_many.return_value = [{'id': 2}, error]
+        self.shop_app.get_client_orders(0)
+        self.assertListEqual(self.shop_app.make_orders([(0, [1]), (999, [1])]), [(2, None), (None, error)])
+        self.assertListEqual(self.shop_app.get_client_orders(0), [
+            self.database_simplified['orders'][0],
+            {'id': 2, 'id_client': 0, 'ids_items': [1]}
+        ])
+
     def test_download_client(self):
         client = self.database_simplified['clients'][1]
         self.assertDictEqual(self.shop_app.download_client(client['id']), client)
@@ -101,6 +132,10 @@ class TestShopApp(unittest.TestCase):
         self.shop_app.download_all_clients()
         self.shop_app.shop_database.client_get.assert_called_once_with()
 
+    def test_iter_clients_mock_check(self):
+        self.shop_app.iter_clients(page_size=50)
+        self.shop_app.shop_database.client_iter.assert_called_once_with(50)
+
     def test_remove_client(self):
         self.assertTrue(self.shop_app.remove_client(1))
 
@@ -144,6 +179,12 @@ class TestShopApp(unittest.TestCase):
         self.shop_app.download_all_items()
         self.shop_app.shop_database.item_get.assert_called_once_with()
 
+    def test_download_catalog(self):
+        self.shop_app.shop_database.item_iter.side_effect = lambda page_size: iter(self.database_simplified['items'])
+        item_catalog = self.shop_app.download_catalog()
+        self.shop_app.shop_database.item_iter.assert_called_once_with(1000)
+        self.assertEqual(item_catalog.price(1), 1049.99)
+
     def test_remove_item(self):
         self.assertTrue(self.shop_app.remove_item(1))
 
@@ -185,6 +226,10 @@ class TestShopApp(unittest.TestCase):
         self.shop_app.download_all_orders()
         self.shop_app.shop_database.order_get.assert_called_once_with()
 
+    def test_iter_orders_mock_check(self):
+        self.shop_app.iter_orders()
+        self.shop_app.shop_database.order_iter.assert_called_once_with(100)
+
     def test_remove_order(self):
         self.assertTrue(self.shop_app.remove_order(1))
 
@@ -202,12 +247,70 @@ class TestShopApp(unittest.TestCase):
         self.shop_app.get_client_orders(0)
         self.shop_app.shop_database.order_get.assert_called_once_with()
 
+    def test_get_client_orders_indexed(self):
+        self.shop_app.get_client_orders(0)
+        self.assertListEqual(self.shop_app.get_client_orders(1), [self.database_simplified['orders'][1]])
+        self.shop_app.shop_database.order_get.assert_called_once_with()
+
+    def test_get_client_orders_unknown_client(self):
+        self.assertListEqual(self.shop_app.get_client_orders(999), [])
+
+    def test_get_client_orders_after_make_order(self):
+        self.shop_app.get_client_orders(0)
+        self.shop_app.make_order(0, [1, 1])
+        self.assertListEqual(self.shop_app.get_client_orders(0), [
+            self.database_simplified['orders'][0],
+            {'id': 2, 'id_client': 0, 'ids_items': [1, 1]}
+        ])
+
+    def test_get_client_orders_after_modify_order(self):
+        self.shop_app.get_client_orders(0)
+        self.shop_app.modify_order(1, id_client=0)
+        self.assertListEqual(self.shop_app.get_client_orders(1), [])
+        self.assertListEqual(self.shop_app.get_client_orders(0), [
+            self.database_simplified['orders'][0],
+            {'id': 1, 'id_client': 0, 'ids_items': [1, 0]}
+        ])
+
+    def test_get_client_orders_after_modify_unknown_order(self):
+        self.shop_app.get_client_orders(0)
+        self.shop_app.modify_order(999, ids_items=[0])
+        self.shop_app.get_client_orders(0)
+        self.assertEqual(self.shop_app.shop_database.order_get.call_count, 2)
+
+    def test_get_client_orders_after_remove_order(self):
+        self.shop_app.get_client_orders(0)
+        self.shop_app.remove_order(0)
+        self.assertListEqual(self.shop_app.get_client_orders(0), [])
+
+    def test_refresh_orders_index(self):
+        self.shop_app.get_client_orders(0)
+        self.database_simplified['orders'].append({'id': 2, 'id_client': 0, 'ids_items': [0]})
+        self.shop_app.refresh_orders_index()
+        self.assertEqual(len(self.shop_app.get_client_orders(0)), 2)
+
     def test_get_order_total(self):
         order = self.database_simplified['orders'][0]
         total = sum(map(lambda id_item: self.database_simplified['items'][id_item]['value'], order['ids_items']))
         self.assertEqual(self.shop_app.get_order_total(order['id']), total)
 
     def test_get_order_total_mock_check_items(self):
+        order = self.database_simplified['orders'][1]
+        self.shop_app.get_order_total(order['id'])
+        self.shop_app.shop_database.item_get.assert_has_calls(map(lambda id_item: call(id_item), order['ids_items']), any_order=True)
+
+    def test_get_order_total_repeated_items(self):
+        self.database_simplified['orders'][1]['ids_items'] = [1, 0, 1, 1]
+        items = self.database_simplified['items']
+        self.assertAlmostEqual(self.shop_app.get_order_total(1), items[1]['value'] * 3 + items[0]['value'])
+
+    def test_get_order_total_mock_check_items_deduplicated(self):
+        self.database_simplified['orders'][1]['ids_items'] = [1, 0, 1, 1]
+        self.shop_app.get_order_total(1)
+        self.assertEqual(self.shop_app.shop_database.item_get.call_count, 2)
+
+    def test_get_order_total_sequential(self):
+        self.shop_app.max_concurrency = 1
         order = self.database_simplified['orders'][1]
         self.shop_app.get_order_total(order['id'])
         self.shop_app.shop_database.item_get.assert_has_calls(map(lambda id_item: call(id_item), order['ids_items']))
@@ -217,6 +320,27 @@ class TestShopApp(unittest.TestCase):
         self.shop_app.get_order_total(id_order)
         self.shop_app.shop_database.order_get.assert_called_once_with(id_order)
 
+    def test_get_orders_totals(self):
+        self.shop_app.shop_database.item_iter.side_effect = lambda page_size: iter(self.database_simplified['items'])
+        self.shop_app.shop_database.order_iter.side_effect = lambda page_size: iter(self.database_simplified['orders'])
+        self.assertDictEqual(self.shop_app.get_orders_totals(), {0: 1479.00, 1: 2337.99})
+        self.shop_app.shop_database.item_get.assert_not_called()
+
+    def test_get_orders_totals_selected(self):
+        self.shop_app.shop_database.item_iter.side_effect = lambda page_size: iter(self.database_simplified['items'])
+        self.shop_app.shop_database.order_iter.side_effect = lambda page_size: iter(self.database_simplified['orders'])
+        self.assertDictEqual(self.shop_app.get_orders_totals([1]), {1: 2337.99})
+
+    def test_get_orders_totals_missing(self):
+        self.shop_app.shop_database.item_iter.side_effect = lambda page_size: iter(self.database_simplified['items'])
+        self.shop_app.shop_database.order_iter.side_effect = lambda page_size: iter(self.database_simplified['orders'])
+        with self.assertRaisesRegex(LookupError, "^Order with such ID doesn't exist$"):
+            self.shop_app.get_orders_totals([1, 999])
+
+    def test_get_orders_totals_wrong_type(self):
+        with self.assertRaisesRegex(TypeError, "^Order ID must be an integer$"):
+            self.shop_app.get_orders_totals(['1'])
+
     def test_modify_order(self):
         self.assertTrue(self.shop_app.modify_order(1, 1, [0, 1, 2]))
 
@@ -226,6 +350,114 @@ class TestShopApp(unittest.TestCase):
         self.shop_app.modify_order(id_order, ids_items=ids_items)
         self.shop_app.shop_database.order_put_patch.assert_called_once_with(id_order, None, ids_items)
 
+    def test_modify_item_write_behind(self):
+        self.shop_app.write_buffer = WriteBuffer(self.shop_app.shop_database, window=60)
+        self.shop_app.modify_item(1, name='Xbox Series S')
+        self.shop_app.modify_item(1, value=1349.99)
+        self.shop_app.shop_database.item_put_patch.assert_not_called()
+        self.assertListEqual(self.shop_app.flush(), [])
+        self.shop_app.shop_database.item_put_patch.assert_called_once_with(1, name='Xbox Series S', value=1349.99)
+
+    def test_modify_order_write_behind_indexed(self):
+        self.shop_app.write_buffer = WriteBuffer(self.shop_app.shop_database, window=60)
+        self.shop_app.get_client_orders(0)
+        self.shop_app.modify_order(1, id_client=0)
+        self.assertEqual(len(self.shop_app.get_client_orders(0)), 2)
+        self.shop_app.shop_database.order_put_patch.assert_not_called()
+
+    def test_modify_order_write_behind_failure_drops_index(self):
+        shop_app = ShopApp('http://example.com', write_behind=60)
+        shop_app.shop_database = shop_app.write_buffer.shop_database = self.shop_app.shop_database
+        shop_app.shop_database.order_put_patch.side_effect = LookupError("Referenced entities don't exist")
+        shop_app.get_client_orders(0)
+        shop_app.modify_order(1, id_client=0)
+        self.assertEqual(len(shop_app.get_client_orders(0)), 2)
+        self.assertEqual(len(shop_app.flush()), 1)
+        self.assertEqual(len(shop_app.get_client_orders(0)), 1)
+        self.assertEqual(shop_app.shop_database.order_get.call_count, 2)
+
+    def test_remove_client_write_behind_discards(self):
+        self.shop_app.write_buffer = WriteBuffer(self.shop_app.shop_database, window=60)
+        self.shop_app.modify_client(1, name_last='Green')
+        self.shop_app.remove_client(1)
+        self.shop_app.flush()
+        self.shop_app.shop_database.client_put_patch.assert_not_called()
+
+    def test_close_flushes_write_behind(self):
+        self.shop_app.write_buffer = WriteBuffer(self.shop_app.shop_database, window=60)
+        self.shop_app.modify_client(1, name_last='Green')
+        self.shop_app.close()
+        self.shop_app.shop_database.client_put_patch.assert_called_once_with(1, name_last='Green')
+
+    def test_init_write_behind(self):
+        on_error = Mock()
+        shop_app = ShopApp('http://example.com', write_behind=0.1, on_write_error=on_error)
+        self.assertEqual(shop_app.write_buffer.window, 0.1)
+        self.assertIs(shop_app.write_buffer.on_error, on_error)
+        self.assertIsNone(self.shop_app.write_buffer)
+
+    def test_close_mock_check(self):
+        self.shop_app.close()
+        self.shop_app.shop_database.close.assert_called_once_with()
+
+    def test_close_after_get_order_total(self):
+        self.shop_app.get_order_total(1)
+        self.shop_app.close()
+        self.assertEqual(self.shop_app.get_order_total(1), 1049.99 + 1288.00)
+
+    def test_context_manager_mock_check(self):
+        with self.shop_app as shop_app:
+            self.assertIs(shop_app, self.shop_app)
+        self.shop_app.shop_database.close.assert_called_once_with()
+
+    def test_export_ndjson(self):
+        self.shop_app.shop_database.client_iter.side_effect = lambda page_size: iter(self.database_simplified['clients'])
+        file = io.StringIO()
+        self.assertEqual(self.shop_app.export('clients', file), 2)
+        self.assertListEqual([json.loads(line) for line in file.getvalue().splitlines()], self.database_simplified['clients'])
+        self.shop_app.shop_database.client_iter.assert_called_once_with(1000)
+
+    def test_export_csv_totals(self):
+        self.shop_app.shop_database.item_iter.side_effect = lambda page_size: iter(self.database_simplified['items'])
+        self.shop_app.shop_database.order_iter.side_effect = lambda page_size: iter(
+            self.database_simplified['orders'] + [{'id': 2, 'id_client': 0, 'ids_items': [9]}]
+        )
+        file = io.StringIO()
+        self.assertEqual(self.shop_app.export('orders', file, file_format='csv', totals=True), 3)
+        self.assertListEqual(file.getvalue().splitlines(), [
+            'id,id_client,ids_items,total',
+            '0,0,2,1479.0',
+            '1,1,1;0,2337.99',
+            '2,0,9,'
+        ])
+
+    def test_export_gzip_path(self):
+        self.shop_app.shop_database.item_iter.side_effect = lambda page_size: iter(self.database_simplified['items'])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'items.csv.gz')
+            self.assertEqual(self.shop_app.export('items', path, page_size=2), 3)
+            with gzip.open(path, 'rt', newline='') as file:
+                self.assertListEqual(list(csv.DictReader(file)), [
+                    {'id': str(item['id']), 'name': item['name'], 'value': str(item['value'])}
+                    for item in self.database_simplified['items']
+                ])
+        self.shop_app.shop_database.item_iter.assert_called_once_with(2)
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format('orders.csv'), 'csv')
+        self.assertEqual(detect_format('orders.csv.gz'), 'csv')
+        self.assertEqual(detect_format('orders.ndjson.gz'), 'ndjson')
+        self.assertEqual(detect_format('orders'), 'ndjson')
+        self.assertEqual(detect_format('orders.csv', 'ndjson'), 'ndjson')
+
+    def test_export_invalid(self):
+        with self.assertRaisesRegex(ValueError, "^Kind must be 'clients', 'items' or 'orders'$"):
+            self.shop_app.export('users', io.StringIO())
+        with self.assertRaisesRegex(ValueError, "^Totals can only be exported for orders$"):
+            self.shop_app.export('items', io.StringIO(), totals=True)
+        with self.assertRaisesRegex(ValueError, "^Format must be 'csv' or 'ndjson'$"):
+            self.shop_app.export('items', io.StringIO(), 'xml')
+
     def tearDown(self):
         self.shop_app = None
         self.database_simplified = None
@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, call
+from src.shop.shop_app_async import AsyncShopApp
+
+
+class TestAsyncShopApp(unittest.TestCase):
+    def setUp(self):
+        self.database_simplified = {
+            'clients': [
+                {
+                    'id': 0,
+                    'name_first': 'John',
+                    'name_last': 'Rose',
+                    'email': 'john_rose@example.com'
+                }
+            ],
+            'items': [
+                {
+                    'id': 0,
+                    'name': 'PlayStation 4 Slim',
+                    'value': 1288.00
+                },
+                {
+                    'id': 1,
+                    'name': 'Xbox One S',
+                    'value': 1049.99
+                }
+            ],
+            'orders': [
+                {
+                    'id': 0,
+                    'id_client': 0,
+                    'ids_items': [1, 0]
+                }
+            ]
+        }
+
+        def get_side_effect(endpoint, id_entity):
+            if id_entity is None:
+                return self.database_simplified[endpoint]
+            else:
+                return self.database_simplified[endpoint][id_entity]
+
+        self.mock_shop_database = MagicMock()
+        self.mock_shop_database.client_post.return_value = {'id': 1}
+        self.mock_shop_database.client_get.side_effect = lambda id_client=None: get_side_effect('clients', id_client)
+        self.mock_shop_database.item_get.side_effect = lambda id_item=None: get_side_effect('items', id_item)
+        self.mock_shop_database.item_put_patch.return_value = {}
+        self.mock_shop_database.order_get.side_effect = lambda id_order=None: get_side_effect('orders', id_order)
+
+        class AsyncShopDatabaseStub:
+            def __getattr__(stub, name):
+                async def method(*args, **kwargs):
+                    return getattr(self.mock_shop_database, name)(*args, **kwargs)
+                return method
+
+        self.shop_app = AsyncShopApp('http://example.com')
+        self.shop_app.shop_database = AsyncShopDatabaseStub()
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_register_client(self):
+        self.assertEqual(self.run_async(self.shop_app.register_client('Henry', 'Glenn', 'henry_glenn@example.com')), 1)
+
+    def test_download_client(self):
+        client = self.database_simplified['clients'][0]
+        self.assertDictEqual(self.run_async(self.shop_app.download_client(0)), client)
+
+    def test_modify_item_mock_check(self):
+        self.assertTrue(self.run_async(self.shop_app.modify_item(0, value=799.99)))
+        self.mock_shop_database.item_put_patch.assert_called_once_with(0, None, 799.99)
+
+    def test_get_client_orders(self):
+        self.assertListEqual(self.run_async(self.shop_app.get_client_orders(0)), self.database_simplified['orders'])
+
+    def test_get_order_total(self):
+        self.assertEqual(self.run_async(self.shop_app.get_order_total(0)), 1049.99 + 1288.00)
+
+    def test_get_order_total_mock_check_items(self):
+        self.run_async(self.shop_app.get_order_total(0))
+        self.mock_shop_database.item_get.assert_has_calls([call(1), call(0)], any_order=True)
+
+    def tearDown(self):
+        self.shop_app = None
+        self.database_simplified = None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from src.shop.shop_cache import ShopCache
+
+
+class TestShopCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.shop_cache = ShopCache({'clients': 10, 'items': 60}, max_size=2, clock=lambda: self.now)
+
+    def test_init_invalid_size(self):
+        with self.assertRaisesRegex(ValueError, "^Cache size must be a positive integer$"):
+            ShopCache(10, max_size=0)
+
+    def test_get_miss(self):
+        self.assertTupleEqual(self.shop_cache.get('items', 0), (False, None))
+        self.assertEqual(self.shop_cache.stats()['misses'], 1)
+
+    def test_get_hit(self):
+        item = {'id': 0, 'name': 'Xbox One S', 'value': 1049.99}
+        self.shop_cache.set('items', 0, item)
+        self.assertTupleEqual(self.shop_cache.get('items', 0), (True, item))
+        self.assertEqual(self.shop_cache.stats()['hits'], 1)
+
+    def test_get_expired(self):
+        self.shop_cache.set('clients', 0, {'id': 0})
+        self.now = 10
+        self.assertTupleEqual(self.shop_cache.get('clients', 0), (False, None))
+        self.assertDictEqual(self.shop_cache.stats(), {'hits': 0, 'misses': 1, 'evictions': 0, 'expirations': 1, 'size': 0})
+
+    def test_set_uncached_endpoint(self):
+        self.shop_cache.set('orders', 0, {'id': 0})
+        self.assertEqual(self.shop_cache.stats()['size'], 0)
+
+    def test_set_evicts_least_recently_used(self):
+        self.shop_cache.set('items', 0, {'id': 0})
+        self.shop_cache.set('items', 1, {'id': 1})
+        self.shop_cache.get('items', 0)
+        self.shop_cache.set('items', 2, {'id': 2})
+        self.assertTrue(self.shop_cache.get('items', 0)[0])
+        self.assertFalse(self.shop_cache.get('items', 1)[0])
+        self.assertEqual(self.shop_cache.stats()['evictions'], 1)
+
+    def test_invalidate_entity(self):
+        self.shop_cache.set('items', 0, {'id': 0})
+        self.shop_cache.set('items', None, [{'id': 0}])
+        self.shop_cache.invalidate('items', 0)
+        self.assertEqual(self.shop_cache.stats()['size'], 0)
+
+    def test_invalidate_collection(self):
+        self.shop_cache.set('items', 0, {'id': 0})
+        self.shop_cache.set('items', None, [{'id': 0}])
+        self.shop_cache.invalidate('items')
+        self.assertTrue(self.shop_cache.get('items', 0)[0])
+        self.assertFalse(self.shop_cache.get('items')[0])
+
+    def tearDown(self):
+        self.shop_cache = None
+
+
+if __name__ == '__main__':
+    unittest.main()
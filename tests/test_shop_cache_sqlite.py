@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.shop.shop_cache import STALE
+from src.shop.shop_cache_sqlite import SQLiteCache
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite3')
+        self.sqlite_cache = self.open(max_size=3, max_stale=100)
+
+    def tearDown(self):
+        self.sqlite_cache.close()
+        self.directory.cleanup()
+
+    def open(self, **options):
+        return SQLiteCache(self.path, {'clients': 10, 'items': 60}, clock=lambda: self.now, **options)
+
+    def test_init_invalid_size(self):
+        with self.assertRaisesRegex(ValueError, "^Cache size must be a positive integer$"):
+            SQLiteCache(self.path, 10, max_size=0)
+
+    def test_get_miss(self):
+        self.assertTupleEqual(self.sqlite_cache.get('items', 0), (False, None))
+        self.assertEqual(self.sqlite_cache.stats()['misses'], 1)
+
+    def test_get_hit(self):
+        item = {'id': 0, 'name': 'Xbox One S', 'value': 1049.99}
+        self.sqlite_cache.set('items', 0, item)
+        self.assertTupleEqual(self.sqlite_cache.get('items', 0), (True, item))
+        self.assertEqual(self.sqlite_cache.stats()['hits'], 1)
+
+    def test_get_collection(self):
+        items = [{'id': 0, 'name': 'Xbox One S', 'value': 1049.99}]
+        self.sqlite_cache.set('items', None, items)
+        self.assertTupleEqual(self.sqlite_cache.get('items'), (True, items))
+        self.assertTupleEqual(self.sqlite_cache.get('items', 0), (False, None))
+
+    def test_get_stale(self):
+        self.sqlite_cache.set('clients', 0, {'id': 0})
+        self.now += 50
+        found, client = self.sqlite_cache.get('clients', 0)
+        self.assertIs(found, STALE)
+        self.assertDictEqual(client, {'id': 0})
+        self.assertEqual(self.sqlite_cache.stats()['stale_hits'], 1)
+
+    def test_get_expired(self):
+        self.sqlite_cache.set('clients', 0, {'id': 0})
+        self.now += 110
+        self.assertTupleEqual(self.sqlite_cache.get('clients', 0), (False, None))
+        self.assertDictEqual(self.sqlite_cache.stats(), {
+            'hits': 0, 'stale_hits': 0, 'misses': 1, 'evictions': 0, 'expirations': 1, 'size': 0
+        })
+
+    def test_get_unbounded_stale(self):
+        self.sqlite_cache.close()
+        self.sqlite_cache = self.open()
+        self.sqlite_cache.set('clients', 0, {'id': 0})
+        self.now += 10 ** 6
+        self.assertIs(self.sqlite_cache.get('clients', 0)[0], STALE)
+
+    def test_set_uncached_endpoint(self):
+        self.sqlite_cache.set('orders', 0, {'id': 0})
+        self.assertEqual(self.sqlite_cache.stats()['size'], 0)
+
+    def test_set_replaces(self):
+        self.sqlite_cache.set('items', 0, {'id': 0, 'value': 1.0})
+        self.sqlite_cache.set('items', 0, {'id': 0, 'value': 2.0})
+        self.assertTupleEqual(self.sqlite_cache.get('items', 0), (True, {'id': 0, 'value': 2.0}))
+        self.assertEqual(self.sqlite_cache.stats()['size'], 1)
+
+    def test_set_evicts_oldest(self):
+        for id_item in range(4):
+            self.sqlite_cache.set('items', id_item, {'id': id_item})
+            self.now += 1
+        self.assertFalse(self.sqlite_cache.get('items', 0)[0])
+        self.assertTrue(self.sqlite_cache.get('items', 3)[0])
+        self.assertEqual(self.sqlite_cache.stats()['evictions'], 1)
+        self.assertEqual(self.sqlite_cache.stats()['size'], 3)
+
+    def test_invalidate(self):
+        self.sqlite_cache.set('items', None, [{'id': 0}, {'id': 1}])
+        self.sqlite_cache.set('items', 0, {'id': 0})
+        self.sqlite_cache.set('items', 1, {'id': 1})
+        self.sqlite_cache.invalidate('items', 0)
+        self.assertFalse(self.sqlite_cache.get('items')[0])
+        self.assertFalse(self.sqlite_cache.get('items', 0)[0])
+        self.assertTrue(self.sqlite_cache.get('items', 1)[0])
+
+    def test_clear(self):
+        self.sqlite_cache.set('items', 0, {'id': 0})
+        self.sqlite_cache.clear()
+        self.assertEqual(self.sqlite_cache.stats()['size'], 0)
+
+    def test_persists_across_instances(self):
+        self.sqlite_cache.set('items', 0, {'id': 0, 'name': 'Bread', 'value': 1.99})
+        self.sqlite_cache.close()
+        self.sqlite_cache = self.open(max_size=3, max_stale=100)
+        self.assertTupleEqual(self.sqlite_cache.get('items', 0), (True, {'id': 0, 'name': 'Bread', 'value': 1.99}))
+        self.assertEqual(self.sqlite_cache.stats()['size'], 1)
+
+    def test_reconnects_after_fork(self):
+        self.sqlite_cache.set('items', 0, {'id': 0})
+        with patch('src.shop.shop_cache_sqlite.os.getpid', return_value=-1):
+            self.assertTupleEqual(self.sqlite_cache.get('items', 0), (True, {'id': 0}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import MagicMock
+from src.shop.shop_catalog import ItemCatalog
+
+
+class TestItemCatalog(unittest.TestCase):
+    def setUp(self):
+        self.items = [
+            {
+                'id': 0,
+                'name': 'PlayStation 4 Slim',
+                'value': 1288.00
+            },
+            {
+                'id': 1,
+                'name': 'Xbox One S',
+                'value': 1049.99
+            },
+            {
+                'id': 5,
+                'name': 'Nintendo Switch',
+                'value': 1479.00
+            }
+        ]
+        self.item_catalog = ItemCatalog(self.items)
+
+    def test_columns(self):
+        self.assertListEqual(list(self.item_catalog.ids), [0, 1, 5])
+        self.assertListEqual(list(self.item_catalog.cents), [128800, 104999, 147900])
+        self.assertListEqual(self.item_catalog.names, ['PlayStation 4 Slim', 'Xbox One S', 'Nintendo Switch'])
+
+    def test_from_database(self):
+        shop_database = MagicMock()
+        shop_database.item_iter.return_value = iter(self.items)
+        item_catalog = ItemCatalog.from_database(shop_database, page_size=2)
+        shop_database.item_iter.assert_called_once_with(2)
+        self.assertEqual(len(item_catalog), 3)
+
+    def test_item(self):
+        self.assertDictEqual(self.item_catalog.item(1), self.items[1])
+
+    def test_row_missing(self):
+        with self.assertRaisesRegex(LookupError, "^Item with such ID doesn't exist$"):
+            self.item_catalog.row(2)
+
+    def test_contains(self):
+        self.assertIn(5, self.item_catalog)
+        self.assertNotIn(2, self.item_catalog)
+
+    def test_add_existing(self):
+        self.item_catalog.add({'id': 1, 'name': 'Xbox One S', 'value': 999.99})
+        self.assertEqual(len(self.item_catalog), 3)
+        self.assertEqual(self.item_catalog.price(1), 999.99)
+
+    def test_total(self):
+        self.assertEqual(self.item_catalog.total_cents(), 381699)
+        self.assertEqual(self.item_catalog.total([1, 1, 5]), 3578.98)
+
+    def test_total_missing(self):
+        with self.assertRaisesRegex(LookupError, "^Item with such ID doesn't exist$"):
+            self.item_catalog.total_cents([1, 2])
+
+    def test_prices_cents(self):
+        self.assertListEqual(list(self.item_catalog.prices_cents([5, 0])), [147900, 128800])
+
+    def test_select(self):
+        self.assertListEqual(list(self.item_catalog.select(min_cents=120000)), [0, 5])
+        self.assertListEqual(list(self.item_catalog.select(max_cents=128800)), [0, 1])
+        self.assertListEqual(list(self.item_catalog.select(110000, 130000)), [0])
+        self.assertListEqual(list(self.item_catalog.select()), [0, 1, 5])
+
+    def tearDown(self):
+        self.item_catalog = None
+
+
+if __name__ == '__main__':
+    unittest.main()
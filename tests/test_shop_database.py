@@ -1,6 +1,13 @@
+import json
+import threading
+import time
 import unittest
+from src.shop import shop_json
 from src.shop.shop_database import ShopDatabase
-from unittest.mock import Mock, MagicMock
+from src.shop.shop_cache import STALE, ShopCache
+from src.shop.shop_limits import RateLimiter
+from src.shop.shop_resilience import CircuitBreaker, RetryPolicy
+from unittest.mock import Mock, MagicMock, call
 import requests
 
 
@@ -72,13 +79,15 @@ class TestShopDatabase(unittest.TestCase):
                     new_id = entity['id']
             return new_id + 1
 
-        def request_custom(method, url, data=None):
+        def request_custom(method, url, data=None, params=None):
             url_split = url.split('/')
             endpoint = url_split[-2]
             id_param = None if url_split[-1] == '' else int(url_split[-1])
             if method == 'get' or method == 'delete':
                 if id_param is None:
                     test_response_data = self.database[endpoint]
+                    if params is not None:
+                        test_response_data = test_response_data[params['offset']:params['offset'] + params['limit']]
                     if endpoint == 'orders':
                         test_response_data = list(map(lambda x: {
                             **x,
@@ -172,6 +181,21 @@ class TestShopDatabase(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "^Api URL must be a valid url$"):
             ShopDatabase('http://examplecom')
 
+    def test_init_pool_size(self):
+        shop_database = ShopDatabase(self.api_url, pool_size=32)
+        self.assertEqual(shop_database.session.get_adapter(self.api_url)._pool_maxsize, 32)
+        shop_database.close()
+
+    def test_close(self):
+        self.shop_database.session = MagicMock()
+        self.shop_database.close()
+        self.shop_database.session.close.assert_called_once_with()
+
+    def test_context_manager(self):
+        with ShopDatabase(self.api_url) as shop_database:
+            shop_database.session = MagicMock()
+        shop_database.session.close.assert_called_once_with()
+
     def test_client_get(self):
         id_client = 1
         self.assertDictEqual(self.shop_database.client_get(id_client), self.database['clients'][id_client])
@@ -731,6 +755,457 @@ class TestShopDatabase(unittest.TestCase):
         with self.assertRaisesRegex(LookupError, "^Referenced entities don't exist$"):
             self.shop_database.order_put_patch(1, ids_items=[1, 999])
 
+    def test_item_get_cached(self):
+        self.shop_database.cache = ShopCache(60)
+        self.shop_database.item_get(1)
+        self.assertDictEqual(self.shop_database.item_get(1), self.database['items'][1])
+        self.shop_database.request.assert_called_once_with('get', self.api_url + '/items/1')
+        self.assertEqual(self.shop_database.cache.stats()['hits'], 1)
+
+    def test_item_put_invalidates_cache(self):
+        self.shop_database.cache = ShopCache(60)
+        self.shop_database.item_get(1)
+        self.shop_database.item_get()
+        self.shop_database.item_put_patch(1, 'Xbox Series S', 1349.99)
+        self.assertEqual(self.shop_database.cache.stats()['size'], 0)
+
+    def test_item_post_invalidates_cached_collection(self):
+        self.shop_database.cache = ShopCache(60)
+        self.shop_database.item_get(1)
+        self.shop_database.item_get()
+        self.shop_database.item_post('PlayStation 5', 2199.99)
+        self.assertTrue(self.shop_database.cache.get('items', 1)[0])
+        self.assertFalse(self.shop_database.cache.get('items')[0])
+
+    def test_client_delete_invalidates_cache_on_error(self):
+        self.shop_database.cache = ShopCache(60)
+        self.shop_database.client_get(1)
+        self.shop_database.request.side_effect = requests.ConnectionError
+        with self.assertRaises(ConnectionError):
+            self.shop_database.client_delete(1)
+        self.assertFalse(self.shop_database.cache.get('clients', 1)[0])
+
+    def test_item_get_stale_revalidates(self):
+        refreshed = threading.Event()
+        self.shop_database.cache = MagicMock()
+        self.shop_database.cache.get.return_value = (STALE, {'id': 1, 'name': 'Xbox', 'value': 999.99})
+        self.shop_database.cache.set.side_effect = lambda *args: refreshed.set()
+        self.assertDictEqual(self.shop_database.item_get(1), {'id': 1, 'name': 'Xbox', 'value': 999.99})
+        self.assertTrue(refreshed.wait(5))
+        self.shop_database.request.assert_called_once_with('get', self.api_url + '/items/1')
+        self.shop_database.cache.set.assert_called_once_with('items', 1, self.database['items'][1])
+
+    def test_item_get_stale_missing_invalidates(self):
+        invalidated = threading.Event()
+        self.shop_database.cache = MagicMock()
+        self.shop_database.cache.get.return_value = (STALE, {'id': 999, 'name': 'Xbox', 'value': 999.99})
+        self.shop_database.cache.invalidate.side_effect = lambda *args: invalidated.set()
+        self.assertDictEqual(self.shop_database.item_get(999), {'id': 999, 'name': 'Xbox', 'value': 999.99})
+        self.assertTrue(invalidated.wait(5))
+        self.shop_database.cache.invalidate.assert_called_once_with('items', 999)
+
+    def test_item_get_stale_revalidates_once(self):
+        called = threading.Event()
+        release = threading.Event()
+        response = TestResponse(self.database['items'][1], 200)
+        self.shop_database.request = Mock(side_effect=lambda *args, **kwargs: called.set() or release.wait(5) and response)
+        self.shop_database.cache = MagicMock()
+        self.shop_database.cache.get.return_value = (STALE, {'id': 1, 'name': 'Xbox', 'value': 999.99})
+        for _ in range(5):
+            self.shop_database.item_get(1)
+        self.assertTrue(called.wait(5))
+        release.set()
+        self.assertEqual(self.shop_database.request.call_count, 1)
+
+    def test_item_get_stale_revalidations_bounded(self):
+        shop_database = ShopDatabase(self.api_url, pool_size=2)
+        lock = threading.Lock()
+        running = []
+        peak = []
+        release = threading.Event()
+
+        def request_blocking(*args, **kwargs):
+            with lock:
+                running.append(None)
+                peak.append(len(running))
+            release.wait(0.1)
+            with lock:
+                running.pop()
+            return TestResponse(self.database['items'][1], 200)
+        shop_database.request = Mock(side_effect=request_blocking)
+        shop_database.cache = MagicMock()
+        shop_database.cache.get.return_value = (STALE, {'id': 1, 'name': 'Xbox', 'value': 999.99})
+        for id_item in range(6):
+            shop_database.item_get(id_item)
+        shop_database.close()
+        self.assertEqual(shop_database.request.call_count, 6)
+        self.assertLessEqual(max(peak), 2)
+
+    def test_item_get_stale_after_close(self):
+        self.shop_database.cache = MagicMock()
+        self.shop_database.cache.get.return_value = (STALE, {'id': 1, 'name': 'Xbox', 'value': 999.99})
+        self.shop_database.close()
+        self.assertDictEqual(self.shop_database.item_get(1), {'id': 1, 'name': 'Xbox', 'value': 999.99})
+        self.shop_database.request.assert_not_called()
+        self.shop_database.cache.get.return_value = (False, None)
+        self.assertDictEqual(self.shop_database.item_get(1), self.database['items'][1])
+
+    def test_item_get_in_flight_during_put_not_cached(self):
+        self.shop_database.cache = ShopCache(60)
+        fetching = threading.Event()
+        release = threading.Event()
+        request_custom = self.shop_database.request.side_effect
+
+        def request_blocking(method, url, **kwargs):
+            if method == 'get' and not fetching.is_set():
+                fetching.set()
+                release.wait(5)
+            return request_custom(method, url, **kwargs)
+
+        self.shop_database.request.side_effect = request_blocking
+        thread = threading.Thread(target=self.shop_database.item_get, args=(1,))
+        thread.start()
+        self.assertTrue(fetching.wait(5))
+        self.shop_database.item_put_patch(1, value=2.0)
+        release.set()
+        thread.join()
+        self.assertTupleEqual(self.shop_database.cache.get('items', 1), (False, None))
+
+    def test_item_get_in_flight_during_post_not_cached(self):
+        self.shop_database.cache = ShopCache(60)
+        fetching = threading.Event()
+        release = threading.Event()
+        request_custom = self.shop_database.request.side_effect
+
+        def request_blocking(method, url, **kwargs):
+            if method == 'get' and not fetching.is_set():
+                fetching.set()
+                release.wait(5)
+            return request_custom(method, url, **kwargs)
+
+        self.shop_database.request.side_effect = request_blocking
+        thread = threading.Thread(target=self.shop_database.item_get)
+        thread.start()
+        self.assertTrue(fetching.wait(5))
+        self.shop_database.item_post('PlayStation 5', 2199.99)
+        release.set()
+        thread.join()
+        self.assertFalse(self.shop_database.cache.get('items')[0])
+        self.shop_database.item_get(1)
+        self.assertTrue(self.shop_database.cache.get('items', 1)[0])
+
+    def test_item_get_after_put_does_not_join_older_flight(self):
+        fetching = threading.Event()
+        release = threading.Event()
+        request_custom = self.shop_database.request.side_effect
+
+        def request_blocking(method, url, **kwargs):
+            if method == 'get' and not fetching.is_set():
+                fetching.set()
+                release.wait(5)
+            return request_custom(method, url, **kwargs)
+
+        self.shop_database.request.side_effect = request_blocking
+        thread = threading.Thread(target=self.shop_database.item_get, args=(1,))
+        thread.start()
+        self.assertTrue(fetching.wait(5))
+        self.shop_database.item_put_patch(1, value=2.0)
+        self.shop_database.item_get(1)
+        gets = [args for args in self.shop_database.request.call_args_list if args[0][0] == 'get']
+        release.set()
+        thread.join()
+        self.assertEqual(len(gets), 2)
+
+    def test_order_get_missing_not_cached(self):
+        self.shop_database.cache = ShopCache(60)
+        with self.assertRaises(LookupError):
+            self.shop_database.order_get(999)
+        self.assertEqual(self.shop_database.cache.stats()['size'], 0)
+
+    def test_client_iter(self):
+        self.assertListEqual(list(self.shop_database.client_iter(page_size=1)), self.database['clients'])
+
+    def test_item_iter_mock_check(self):
+        list(self.shop_database.item_iter(page_size=2))
+        self.assertListEqual(self.shop_database.request.call_args_list, [
+            call('get', self.api_url + '/items/', params={'offset': 0, 'limit': 2}),
+            call('get', self.api_url + '/items/', params={'offset': 2, 'limit': 2})
+        ])
+
+    def test_order_iter(self):
+        orders = list(map(lambda x: {**x, 'ids_items': self.get_ids_items(x['id'])}, self.database['orders']))
+        self.assertListEqual(list(self.shop_database.order_iter(page_size=2)), orders)
+
+    def test_item_iter_unpaginated_backend(self):
+        self.shop_database.request.side_effect = lambda method, url, params: TestResponse(self.database['items'], 200)
+        self.assertListEqual(list(self.shop_database.item_iter(page_size=3)), self.database['items'])
+        self.assertListEqual(list(self.shop_database.item_iter(page_size=2)), self.database['items'])
+
+    def test_item_iter_invalid_page_size(self):
+        with self.assertRaisesRegex(ValueError, "^Page size must be a positive integer$"):
+            self.shop_database.item_iter(page_size=0)
+
+    def test_client_iter_connection_error(self):
+        self.shop_database.request.side_effect = requests.ConnectionError
+        with self.assertRaisesRegex(ConnectionError, "^Can't get clients from database$"):
+            next(self.shop_database.client_iter())
+
+    def test_client_post_many(self):
+        results = self.shop_database.client_post_many([
+            ('Harry', 'Red', 'harry_red@example.com'),
+            ('Harry', 'Red', 'harry_red@examplecom'),
+            ('Jane', 'Blue', 'jane_blue@example.com')
+        ])
+        self.assertDictEqual(results[0], {
+            'id': self.get_new_id('clients'),
+            'name_first': 'Harry',
+            'name_last': 'Red',
+            'email': 'harry_red@example.com'
+        })
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(str(results[1]), "Email must be valid")
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(str(results[2]), "Can't post this client (email must be unique)")
+
+    def test_item_post_many_validated_up_front(self):
+        results = self.shop_database.item_post_many([('PlayStation 5', 2199.99), ('', 1.0), ('Xbox Series X', 5)])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsInstance(results[2], TypeError)
+        self.shop_database.request.assert_called_once_with('post', self.api_url + '/items/', data={
+            'name': 'PlayStation 5',
+            'value': 2199.99
+        })
+
+    def test_order_post_many(self):
+        results = self.shop_database.order_post_many([(0, [1, 2]), (999, [1]), (1, [])], max_concurrency=2)
+        self.assertDictEqual(results[0], {'id': self.get_new_id('orders'), 'id_client': 0, 'ids_items': [1, 2]})
+        self.assertIsInstance(results[1], LookupError)
+        self.assertIsInstance(results[2], ValueError)
+
+    def test_client_post_many_duplicate_in_batch(self):
+        results = self.shop_database.client_post_many([
+            {'name_first': 'Harry', 'name_last': 'Red', 'email': 'harry_red@example.com'},
+            {'name_first': 'Henry', 'name_last': 'Red', 'email': 'harry_red@example.com'}
+        ])
+        self.assertEqual(results[0]['email'], 'harry_red@example.com')
+        self.assertEqual(str(results[1]), "Can't post this client (email must be unique)")
+        self.shop_database.request.assert_called_once()
+
+    def test_item_post_many_connection_error(self):
+        self.shop_database.request.side_effect = requests.ConnectionError
+        results = self.shop_database.item_post_many([('PlayStation 5', 2199.99)])
+        self.assertIsInstance(results[0], ConnectionError)
+
+    def test_metrics(self):
+        self.shop_database.item_get(1)
+        self.shop_database.item_put_patch(1, value=999.99)
+        with self.assertRaises(LookupError):
+            self.shop_database.item_get(999)
+        snapshot = self.shop_database.metrics.snapshot()
+        self.assertEqual(snapshot['items']['get']['count'], 2)
+        self.assertDictEqual(snapshot['items']['get']['status_codes'], {200: 1, 404: 1})
+        self.assertDictEqual(snapshot['items']['patch']['status_codes'], {200: 1})
+        self.assertGreater(snapshot['items']['patch']['bytes'], 0)
+
+    def test_metrics_connection_error(self):
+        self.shop_database.request.side_effect = requests.ConnectionError
+        with self.assertRaises(ConnectionError):
+            self.shop_database.order_post(0, [1])
+        self.assertEqual(self.shop_database.metrics.snapshot()['orders']['post']['errors'], 1)
+
+    def test_hooks(self):
+        hook_pre = Mock()
+        hook_post = Mock()
+        self.shop_database.hooks_pre_request.append(hook_pre)
+        self.shop_database.hooks_post_request.append(hook_post)
+        self.shop_database.client_post('Harry', 'Red', 'harry_red@example.com')
+        url = self.api_url + '/clients/'
+        data = {'name_first': 'Harry', 'name_last': 'Red', 'email': 'harry_red@example.com'}
+        hook_pre.assert_called_once_with('clients', 'post', url, {'data': data})
+        self.assertEqual(hook_post.call_args[0][:3], ('clients', 'post', url))
+        self.assertEqual(hook_post.call_args[0][3].status_code, 201)
+
+    def test_item_get_retried(self):
+        responses = [requests.ConnectionError(), TestResponse(self.database['items'][1], 200)]
+        self.shop_database.request.side_effect = responses
+        self.shop_database.retry = RetryPolicy(retries=2, sleep=Mock())
+        self.assertDictEqual(self.shop_database.item_get(1), self.database['items'][1])
+        self.assertEqual(self.shop_database.request.call_count, 2)
+
+    def test_item_get_retried_status_code(self):
+        self.shop_database.request.side_effect = [TestResponse({}, 503), TestResponse(self.database['items'][1], 200)]
+        self.shop_database.retry = RetryPolicy(retries=2, sleep=Mock())
+        self.assertDictEqual(self.shop_database.item_get(1), self.database['items'][1])
+
+    def test_item_get_retries_exhausted(self):
+        self.shop_database.request.side_effect = requests.ConnectionError
+        self.shop_database.retry = RetryPolicy(retries=2, sleep=Mock())
+        with self.assertRaisesRegex(ConnectionError, "^Can't get item from database$"):
+            self.shop_database.item_get(1)
+        self.assertEqual(self.shop_database.request.call_count, 3)
+
+    def test_item_post_not_retried(self):
+        self.shop_database.request.side_effect = requests.ConnectionError
+        self.shop_database.retry = RetryPolicy(retries=2, sleep=Mock())
+        with self.assertRaisesRegex(ConnectionError, "^Can't post item to database$"):
+            self.shop_database.item_post('PlayStation 5', 2199.99)
+        self.shop_database.request.assert_called_once()
+
+    def test_circuit_breaker_fails_fast(self):
+        self.shop_database.request.side_effect = requests.ConnectionError
+        self.shop_database.retry = RetryPolicy(retries=5, sleep=Mock())
+        self.shop_database.circuit_breaker = CircuitBreaker(threshold=2)
+        with self.assertRaisesRegex(ConnectionError, "^Can't get clients from database$"):
+            self.shop_database.client_get()
+        with self.assertRaisesRegex(ConnectionError, "^Can't get clients from database$"):
+            self.shop_database.client_get()
+        self.assertEqual(self.shop_database.request.call_count, 2)
+
+    def test_items_get_conditional(self):
+        response = TestResponse(self.database['items'], 200)
+        response.headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2026 07:28:00 GMT'}
+        not_modified = Mock(status_code=304, content=b'', headers={})
+        self.shop_database.request.side_effect = [response, not_modified]
+        items = self.shop_database.item_get()
+        self.assertListEqual(self.shop_database.item_get(), items)
+        self.shop_database.request.assert_called_with('get', self.api_url + '/items/', headers={
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Wed, 21 Oct 2026 07:28:00 GMT'
+        })
+        not_modified.json.assert_not_called()
+
+    def test_items_get_conditional_modified(self):
+        response = TestResponse(self.database['items'], 200)
+        response.headers = {'ETag': '"v1"'}
+        response_modified = TestResponse(self.database['items'][:1], 200)
+        self.shop_database.request.side_effect = [response, response_modified, response_modified]
+        self.shop_database.item_get()
+        self.assertListEqual(self.shop_database.item_get(), self.database['items'][:1])
+        self.shop_database.request.assert_called_with('get', self.api_url + '/items/', headers={'If-None-Match': '"v1"'})
+        self.shop_database.item_get()
+        self.shop_database.request.assert_called_with('get', self.api_url + '/items/')
+
+    def test_items_get_conditional_after_post(self):
+        response = TestResponse(self.database['items'][:1], 200)
+        response.headers = {'Last-Modified': 'Wed, 21 Oct 2026 07:28:00 GMT'}
+        posted = TestResponse({'id': 2, 'name': 'Bread', 'value': 1.99}, 201)
+        response_modified = TestResponse(self.database['items'][:1] + [{'id': 2, 'name': 'Bread', 'value': 1.99}], 200)
+        self.shop_database.request.side_effect = [response, posted, response_modified]
+        self.assertEqual(len(self.shop_database.item_get()), 1)
+        self.shop_database.item_post('Bread', 1.99)
+        self.assertEqual(len(self.shop_database.item_get()), 2)
+        self.shop_database.request.assert_called_with('get', self.api_url + '/items/')
+
+    def test_items_get_not_modified_returns_copy(self):
+        response = TestResponse(self.database['items'], 200)
+        response.headers = {'ETag': '"v1"'}
+        not_modified = Mock(status_code=304, content=b'', headers={})
+        self.shop_database.request.side_effect = [response, not_modified, not_modified]
+        self.shop_database.item_get().clear()
+        self.shop_database.item_get().clear()
+        self.assertListEqual(self.shop_database.item_get(), self.database['items'])
+
+    def test_item_get_not_conditional(self):
+        response = TestResponse(self.database['items'][1], 200)
+        response.headers = {'ETag': '"v1"'}
+        self.shop_database.request.side_effect = [response, response]
+        self.shop_database.item_get(1)
+        self.shop_database.item_get(1)
+        self.shop_database.request.assert_called_with('get', self.api_url + '/items/1')
+
+    def coalesced_calls(self, function, count=5):
+        release = threading.Event()
+        request_custom = self.shop_database.request.side_effect
+
+        def request_blocking(*args, **kwargs):
+            release.wait(5)
+            return request_custom(*args, **kwargs)
+
+        self.shop_database.request.side_effect = request_blocking
+        results = []
+
+        def call():
+            try:
+                results.append(function())
+            except Exception as error:
+                results.append(error)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_item_get_coalesced(self):
+        results = self.coalesced_calls(lambda: self.shop_database.item_get(1))
+        self.shop_database.request.assert_called_once_with('get', self.api_url + '/items/1')
+        for result in results:
+            self.assertIs(result, results[0])
+
+    def test_item_get_coalesced_error(self):
+        results = self.coalesced_calls(lambda: self.shop_database.item_get(999))
+        self.shop_database.request.assert_called_once()
+        for result in results:
+            self.assertIsInstance(result, LookupError)
+
+    def test_item_get_not_coalesced_sequentially(self):
+        self.shop_database.item_get(1)
+        self.shop_database.item_get(1)
+        self.assertEqual(self.shop_database.request.call_count, 2)
+
+    def test_limits_fail_fast(self):
+        rate_limiter = RateLimiter(rate=0.001, burst=1, block=False)
+        self.shop_database.limits = {'items': rate_limiter}
+        self.shop_database.retry = RetryPolicy(retries=3, sleep=Mock())
+        self.shop_database.item_get(1)
+        with self.assertRaisesRegex(ConnectionError, "^Can't get item from database$"):
+            self.shop_database.item_get(1)
+        self.shop_database.client_get(1)
+        self.assertEqual(self.shop_database.request.call_count, 2)
+
+    def test_limits_shared(self):
+        rate_limiter = RateLimiter(rate=0.001, burst=1, block=False)
+        shop_database = ShopDatabase(self.api_url, limits={'orders': rate_limiter})
+        shop_database.request = self.shop_database.request
+        self.shop_database.limits = {'orders': rate_limiter}
+        self.shop_database.order_get(1)
+        with self.assertRaisesRegex(ConnectionError, "^Can't get order from database$"):
+            shop_database.order_get(1)
+
+    def test_json_loads(self):
+        json_loads = Mock(return_value={'id': 0, 'name': 'Bread', 'value': 1.99})
+        self.shop_database = ShopDatabase(self.api_url, json_loads=json_loads)
+        self.shop_database.request = Mock(return_value=TestResponse({'id': 0, 'name': 'Bread', 'value': 1.99}, 200))
+        self.assertDictEqual(self.shop_database.item_get(0), {'id': 0, 'name': 'Bread', 'value': 1.99})
+        json_loads.assert_called_once_with(b'{"id": 0, "name": "Bread", "value": 1.99}')
+
+    def test_non_json_body_connection_error(self):
+        response = TestResponse(None, 200)
+        response.content = b'<html>Bad Gateway</html>'
+        self.shop_database.request = Mock(return_value=response)
+        with self.assertRaisesRegex(ConnectionError, "^Can't get item from database$"):
+            self.shop_database.item_get(0)
+        with self.assertRaisesRegex(ConnectionError, "^Can't get items from database$"):
+            list(self.shop_database.item_iter())
+        with self.assertRaisesRegex(ConnectionError, "^Can't post item to database$"):
+            self.shop_database.item_post('Bread', 1.99)
+        with self.assertRaisesRegex(ConnectionError, "^Can't patch item in database$"):
+            self.shop_database.item_put_patch(0, value=2.49)
+        with self.assertRaisesRegex(ConnectionError, "^Can't delete item from database$"):
+            self.shop_database.item_delete(0)
+
+    def test_non_json_body_custom_loads_connection_error(self):
+        self.shop_database = ShopDatabase(self.api_url, json_loads=Mock(side_effect=ValueError("unexpected character")))
+        self.shop_database.request = Mock(return_value=TestResponse({'id': 0}, 200))
+        with self.assertRaisesRegex(ConnectionError, "^Can't get order from database$"):
+            self.shop_database.order_get(0)
+
+    def test_json_loads_default(self):
+        self.assertIs(self.shop_database.json_loads, shop_json.loads)
+
     def tearDown(self):
         self.shop_database = None
         self.api_url = None
@@ -743,6 +1218,8 @@ class TestResponse:
     def __init__(self, value, status_code):
         self.value = value
         self.status_code = status_code
+        self.content = json.dumps(value).encode()
+        self.headers = {}
 
     def json(self):
         return self.value
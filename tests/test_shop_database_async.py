@@ -0,0 +1,162 @@
+import asyncio
+import unittest
+from unittest.mock import Mock, MagicMock
+import aiohttp
+from aiohttp import web
+from src.shop.shop_database_async import AsyncShopDatabase, AsyncResponse
+
+
+class TestAsyncShopDatabase(unittest.TestCase):
+    def setUp(self):
+        self.database = {
+            'clients': {
+                0: {
+                    'id': 0,
+                    'name_first': 'John',
+                    'name_last': 'Rose',
+                    'email': 'john_rose@example.com'
+                }
+            },
+            'items': {
+                0: {
+                    'id': 0,
+                    'name': 'PlayStation 4 Slim',
+                    'value': 1288.00
+                }
+            }
+        }
+
+        def request_custom(method, url, data=None):
+            url_split = url.split('/')
+            endpoint = url_split[-2]
+            id_param = None if url_split[-1] == '' else int(url_split[-1])
+            if method == 'get':
+                if id_param is None:
+                    return TestResponse(list(self.database[endpoint].values()), 200)
+                elif id_param in self.database[endpoint]:
+                    return TestResponse(self.database[endpoint][id_param], 200)
+                return TestResponse({}, 404)
+            elif method == 'post':
+                if endpoint == 'clients':
+                    for entity in self.database[endpoint].values():
+                        if entity['email'] == data['email']:
+                            return TestResponse({}, 409)
+                return TestResponse({'id': len(self.database[endpoint]), **data}, 201)
+            elif id_param in self.database[endpoint]:
+                return TestResponse({**self.database[endpoint][id_param], **(data or {})}, 200)
+            return TestResponse({}, 404)
+
+        async def request_async(*args, **kwargs):
+            return self.request(*args, **kwargs)
+
+        self.api_url = 'http://example.com'
+        self.request = Mock(side_effect=request_custom)
+        self.shop_database = AsyncShopDatabase(self.api_url)
+        self.shop_database.request = request_async
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_init_invalid(self):
+        with self.assertRaisesRegex(ValueError, "^Api URL must be a valid url$"):
+            AsyncShopDatabase('http://examplecom')
+
+    def test_client_get(self):
+        self.assertDictEqual(self.run_async(self.shop_database.client_get(0)), self.database['clients'][0])
+
+    def test_client_get_mock_check(self):
+        self.run_async(self.shop_database.client_get(0))
+        self.request.assert_called_once_with('get', self.api_url + '/clients/0')
+
+    def test_client_get_wrong_type(self):
+        with self.assertRaisesRegex(TypeError, "^Client ID must be an integer$"):
+            self.run_async(self.shop_database.client_get(MagicMock(spec=str)))
+
+    def test_client_get_missing(self):
+        with self.assertRaisesRegex(LookupError, "^Client with such ID doesn't exist$"):
+            self.run_async(self.shop_database.client_get(999))
+
+    def test_clients_get_connection_error(self):
+        self.request.side_effect = aiohttp.ClientConnectionError
+        with self.assertRaisesRegex(ConnectionError, "^Can't get clients from database$"):
+            self.run_async(self.shop_database.client_get())
+
+    def test_client_post_non_unique_email(self):
+        with self.assertRaisesRegex(ValueError, "^Can't post this client \\(email must be unique\\)$"):
+            self.run_async(self.shop_database.client_post('Harry', 'Red', 'john_rose@example.com'))
+
+    def test_client_post_invalid_email(self):
+        with self.assertRaisesRegex(ValueError, "^Email must be valid$"):
+            self.run_async(self.shop_database.client_post('Harry', 'Red', 'harry_red@examplecom'))
+        self.request.assert_not_called()
+
+    def test_item_patch_mock_check(self):
+        self.run_async(self.shop_database.item_put_patch(0, value=799.99))
+        self.request.assert_called_once_with('patch', self.api_url + '/items/0', data={'value': 799.99})
+
+    def test_item_put_missing(self):
+        with self.assertRaisesRegex(LookupError, "^Item with such ID doesn't exist$"):
+            self.run_async(self.shop_database.item_put_patch(999, 'PlayStation 5', 2199.99))
+
+    def test_item_delete_connection_error(self):
+        self.request.side_effect = aiohttp.ClientConnectionError
+        with self.assertRaisesRegex(ConnectionError, "^Can't delete item from database$"):
+            self.run_async(self.shop_database.item_delete(0))
+
+    def test_order_post_wrong_type_items_elements(self):
+        with self.assertRaisesRegex(TypeError, "^Items IDs must all be integers$"):
+            self.run_async(self.shop_database.order_post(0, [0, '1']))
+
+    def test_request_form_encoding(self):
+        received = []
+
+        async def handle(request):
+            received.append(await request.post())
+            return web.json_response({'id': 0}, status=201)
+
+        async def scenario():
+            app = web.Application()
+            app.router.add_post('/orders/', handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = runner.addresses[0][1]
+            async with AsyncShopDatabase('http://127.0.0.1:' + str(port)) as shop_database:
+                order = await shop_database.order_post(0, [1, 2])
+            await runner.cleanup()
+            return order
+
+        self.assertDictEqual(self.run_async(scenario()), {'id': 0})
+        self.assertListEqual(received[0].getall('ids_items'), ['1', '2'])
+        self.assertEqual(received[0]['id_client'], '0')
+
+    def test_response_json(self):
+        self.assertDictEqual(AsyncResponse(200, b'{"id": 0}').json(), {'id': 0})
+
+    def test_response_json_invalid(self):
+        self.request.side_effect = None
+        self.request.return_value = AsyncResponse(200, b'<html>Bad Gateway</html>')
+        with self.assertRaisesRegex(ConnectionError, "^Can't get item from database$"):
+            self.run_async(self.shop_database.item_get(0))
+        with self.assertRaisesRegex(ConnectionError, "^Can't post client to database$"):
+            self.run_async(self.shop_database.client_post('Harry', 'Red', 'harry_red@example.com'))
+        with self.assertRaisesRegex(ConnectionError, "^Can't delete item from database$"):
+            self.run_async(self.shop_database.item_delete(0))
+
+    def tearDown(self):
+        self.shop_database = None
+        self.database = None
+
+
+class TestResponse:
+    def __init__(self, value, status_code):
+        self.value = value
+        self.status_code = status_code
+
+    def json(self):
+        return self.value
+
+
+if __name__ == '__main__':
+    unittest.main()
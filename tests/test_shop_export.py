@@ -0,0 +1,23 @@
+import unittest
+from unittest.mock import patch
+from src.shop import shop_export
+
+
+class TestShopExport(unittest.TestCase):
+    def test_main(self):
+        with patch('src.shop.shop_export.ShopApp') as shop_app, patch('sys.stderr') as stderr:
+            shop_app.return_value.__enter__.return_value.export.return_value = 2
+            self.assertEqual(shop_export.main(['orders', 'orders.csv.gz', '--api-url', 'http://localhost:5000', '--totals']), 0)
+        shop_app.assert_called_once_with('http://localhost:5000')
+        shop_app.return_value.__enter__.return_value.export.assert_called_once_with('orders', 'orders.csv.gz', None, None, True, 1000)
+        self.assertTrue(stderr.write.call_args[0][0].startswith('Exported 2 rows in '))
+
+    def test_main_stdout(self):
+        with patch('src.shop.shop_export.ShopApp') as shop_app, patch('sys.stderr'), patch('sys.stdout') as stdout:
+            shop_app.return_value.__enter__.return_value.export.return_value = 0
+            shop_export.main(['items', '-', '--api-url', 'http://localhost:5000', '--format', 'csv', '--gzip'])
+        shop_app.return_value.__enter__.return_value.export.assert_called_once_with('items', stdout.buffer, 'csv', True, False, 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
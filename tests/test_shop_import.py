@@ -0,0 +1,115 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from src.shop import shop_import
+
+
+class TestShopImport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.shop_app = MagicMock()
+        self.shop_app.register_clients.side_effect = lambda rows: [(index, None) for index, _ in enumerate(rows)]
+        self.shop_app.add_items.side_effect = lambda rows: [(index, None) for index, _ in enumerate(rows)]
+        self.shop_app.make_orders.side_effect = lambda rows: [
+            (None, LookupError("Referenced entities don't exist")) if row[0] == 999 else (index, None)
+            for index, row in enumerate(rows)
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with (gzip.open if name.endswith('.gz') else open)(path, 'wt') as file:
+            file.write(content)
+        return path
+
+    def read_rejected(self, path):
+        with open(path) as file:
+            return [json.loads(line) for line in file]
+
+    def test_parse_row(self):
+        self.assertTupleEqual(shop_import.parse_row('items', {'name': 'Bread', 'value': '1.99'}), ('Bread', 1.99))
+        self.assertTupleEqual(shop_import.parse_row('orders', {'id_client': '1', 'ids_items': '1;2 3'}), (1, [1, 2, 3]))
+        self.assertTupleEqual(shop_import.parse_row('orders', {'id_client': 1, 'ids_items': [1, 2]}), (1, [1, 2]))
+        self.assertTupleEqual(
+            shop_import.parse_row('clients', {'name_first': 'Jan', 'name_last': 'Nowak', 'email': 'jan@example.com', 'extra': 1}),
+            ('Jan', 'Nowak', 'jan@example.com')
+        )
+
+    def test_parse_row_invalid(self):
+        with self.assertRaisesRegex(ValueError, "^Row is missing name_last, email$"):
+            shop_import.parse_row('clients', {'name_first': 'Jan', 'name_last': ''})
+        with self.assertRaisesRegex(ValueError, "^Row must be an object$"):
+            shop_import.parse_row('items', ['Bread', 1.99])
+        with self.assertRaisesRegex(ValueError, "^Row is not valid JSON$"):
+            shop_import.parse_row('items', '{"name": ')
+        with self.assertRaisesRegex(ValueError, "^ID must be an integer$"):
+            shop_import.parse_row('orders', {'id_client': True, 'ids_items': [1]})
+
+    def test_import_csv(self):
+        path = self.path('items.csv', 'name,value\nBread,1.99\nMilk,2.49\nJam,abc\n')
+        rejected = os.path.join(self.directory.name, 'rejected.ndjson')
+        counts = shop_import.import_file(self.shop_app, 'items', path, batch_size=2, rejected=rejected)
+        self.assertEqual(counts['imported'], 2)
+        self.assertEqual(counts['rejected'], 1)
+        self.assertListEqual([call[0][0] for call in self.shop_app.add_items.call_args_list], [[('Bread', 1.99), ('Milk', 2.49)]])
+        self.assertListEqual(self.read_rejected(rejected), [
+            {'row': 3, 'data': {'name': 'Jam', 'value': 'abc'}, 'error': "could not convert string to float: 'abc'"}
+        ])
+
+    def test_import_ndjson_gzip(self):
+        path = self.path('orders.ndjson.gz', '{"id_client": 1, "ids_items": [1, 2]}\n\n{"id_client": 999, "ids_items": [1]}\n{"id_cl\n')
+        rejected = os.path.join(self.directory.name, 'rejected.ndjson')
+        counts = shop_import.import_file(self.shop_app, 'orders', path, rejected=rejected)
+        self.assertEqual(counts['imported'], 1)
+        self.shop_app.make_orders.assert_called_once_with([(1, [1, 2]), (999, [1])])
+        self.assertListEqual(self.read_rejected(rejected), [
+            {'row': 2, 'data': {'id_client': 999, 'ids_items': [1]}, 'error': "Referenced entities don't exist"},
+            {'row': 3, 'data': '{"id_cl', 'error': "Row is not valid JSON"}
+        ])
+
+    def test_import_checkpoint_resume(self):
+        path = self.path('clients.csv', 'name_first,name_last,email\n' + ''.join(
+            'Name,Surname,client_' + str(index) + '@example.com\n' for index in range(5)
+        ))
+        checkpoint = os.path.join(self.directory.name, 'checkpoint')
+        self.shop_app.register_clients.side_effect = [[(0, None), (1, None)], ConnectionError("Can't post client to database")]
+        with self.assertRaises(ConnectionError):
+            shop_import.import_file(self.shop_app, 'clients', path, batch_size=2, checkpoint=checkpoint)
+        with open(checkpoint) as file:
+            self.assertEqual(file.read(), '2')
+        self.shop_app.register_clients.side_effect = lambda rows: [(index, None) for index, _ in enumerate(rows)]
+        counts = shop_import.import_file(self.shop_app, 'clients', path, batch_size=2, checkpoint=checkpoint)
+        self.assertEqual(counts['skipped'], 2)
+        self.assertEqual(counts['imported'], 3)
+        self.assertEqual(self.shop_app.register_clients.call_args_list[2][0][0][0], ('Name', 'Surname', 'client_2@example.com'))
+
+    def test_import_invalid_kind(self):
+        with self.assertRaisesRegex(ValueError, "^Kind must be 'clients', 'items' or 'orders'$"):
+            shop_import.import_file(self.shop_app, 'users', 'users.csv')
+
+    def test_import_invalid_batch_size(self):
+        with self.assertRaisesRegex(ValueError, "^Batch size must be a positive integer$"):
+            shop_import.import_file(self.shop_app, 'items', 'items.csv', batch_size=0)
+
+    def test_import_file_format(self):
+        path = self.path('items.txt', 'name,value\nBread,1.99\n')
+        counts = shop_import.import_file(self.shop_app, 'items', path, file_format='csv', rejected=os.path.join(self.directory.name, 'rejected.ndjson'))
+        self.assertEqual(counts['imported'], 1)
+        self.shop_app.add_items.assert_called_once_with([('Bread', 1.99)])
+
+    def test_main(self):
+        path = self.path('items.ndjson', '{"name": "Bread", "value": 1.99}\n{"name": "", "value": 1}\n')
+        with patch('src.shop.shop_import.ShopApp') as shop_app, patch('sys.stderr'):
+            shop_app.return_value.__enter__.return_value = self.shop_app
+            self.assertEqual(shop_import.main(['items', path, '--api-url', 'http://localhost:5000', '--workers', '4', '--quiet']), 1)
+        shop_app.assert_called_once_with('http://localhost:5000', 4, 4)
+        self.assertEqual(len(self.read_rejected(path + '.rejected.ndjson')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import json
+import unittest
+from src.shop import shop_json
+
+
+class TestShopJson(unittest.TestCase):
+    def test_backend(self):
+        self.assertIn(shop_json.backend, shop_json.decoders)
+        self.assertIs(shop_json.loads, shop_json.decoders[shop_json.backend])
+        self.assertIs(shop_json.decoders['json'], json.loads)
+
+    def test_loads_bytes(self):
+        content = json.dumps([{'id': 0, 'name': 'Bread', 'value': 1.99}, {'id': 1, 'name': 'Ćma', 'value': 0.5}]).encode('utf-8')
+        for loads in shop_json.decoders.values():
+            self.assertListEqual(loads(content), [
+                {'id': 0, 'name': 'Bread', 'value': 1.99},
+                {'id': 1, 'name': 'Ćma', 'value': 0.5}
+            ])
+
+    def test_loads_invalid(self):
+        for loads in shop_json.decoders.values():
+            with self.assertRaises(ValueError):
+                loads(b'{"id": ')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import threading
+import unittest
+from unittest.mock import Mock
+from src.shop.shop_limits import LimitExceeded, RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+
+        def sleep(seconds):
+            self.now += seconds
+
+        self.sleep = Mock(side_effect=sleep)
+        self.clock = lambda: self.now
+
+    def test_init_invalid_rate(self):
+        with self.assertRaisesRegex(ValueError, "^Rate must be positive$"):
+            RateLimiter(rate=0)
+
+    def test_init_invalid_max_in_flight(self):
+        with self.assertRaisesRegex(ValueError, "^Max in flight must be a positive integer$"):
+            RateLimiter(max_in_flight=0)
+
+    def test_burst_then_block(self):
+        rate_limiter = RateLimiter(rate=10, burst=2, clock=self.clock, sleep=self.sleep)
+        for _ in range(3):
+            with rate_limiter:
+                pass
+        self.sleep.assert_called_once()
+        self.assertAlmostEqual(self.now, 0.1)
+
+    def test_fail_fast_rate(self):
+        rate_limiter = RateLimiter(rate=10, burst=1, block=False, clock=self.clock, sleep=self.sleep)
+        rate_limiter.acquire()
+        with self.assertRaisesRegex(LimitExceeded, "^Rate limit exceeded$"):
+            rate_limiter.acquire()
+        self.now = 0.1
+        rate_limiter.acquire()
+
+    def test_timeout_rate(self):
+        rate_limiter = RateLimiter(rate=1, burst=1, timeout=0.5, clock=self.clock, sleep=self.sleep)
+        rate_limiter.acquire()
+        with self.assertRaises(LimitExceeded):
+            rate_limiter.acquire()
+        self.sleep.assert_not_called()
+
+    def test_fail_fast_in_flight(self):
+        rate_limiter = RateLimiter(max_in_flight=1, block=False)
+        rate_limiter.acquire()
+        with self.assertRaisesRegex(LimitExceeded, "^Too many requests in flight$"):
+            rate_limiter.acquire()
+        rate_limiter.release()
+        rate_limiter.acquire()
+
+    def test_in_flight_released_on_rate_failure(self):
+        rate_limiter = RateLimiter(rate=1, burst=1, max_in_flight=1, block=False, clock=self.clock)
+        with rate_limiter:
+            pass
+        with self.assertRaisesRegex(LimitExceeded, "^Rate limit exceeded$"):
+            rate_limiter.acquire()
+        self.now = 1.0
+        with rate_limiter:
+            pass
+
+    def test_in_flight_blocks(self):
+        rate_limiter = RateLimiter(max_in_flight=1)
+        rate_limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            with rate_limiter:
+                acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        rate_limiter.release()
+        thread.join()
+        self.assertTrue(acquired.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
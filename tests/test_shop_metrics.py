@@ -0,0 +1,48 @@
+import unittest
+from src.shop.shop_metrics import ShopMetrics
+
+
+class TestShopMetrics(unittest.TestCase):
+    def setUp(self):
+        self.shop_metrics = ShopMetrics()
+
+    def test_record(self):
+        self.shop_metrics.record('items', 'get', 0.003, 120, 200)
+        self.shop_metrics.record('items', 'get', 0.2, 80, 404)
+        series = self.shop_metrics.snapshot()['items']['get']
+        self.assertEqual(series['count'], 2)
+        self.assertEqual(series['bytes'], 200)
+        self.assertAlmostEqual(series['latency_sum'], 0.203)
+        self.assertEqual(series['latency_max'], 0.2)
+        self.assertDictEqual(series['status_codes'], {200: 1, 404: 1})
+        self.assertEqual(series['latency_buckets'][0.005], 1)
+        self.assertEqual(series['latency_buckets'][0.25], 1)
+
+    def test_record_error(self):
+        self.shop_metrics.record('orders', 'post', 0.5)
+        series = self.shop_metrics.snapshot()['orders']['post']
+        self.assertEqual(series['errors'], 1)
+        self.assertDictEqual(series['status_codes'], {})
+
+    def test_record_outlier(self):
+        self.shop_metrics.record('clients', 'put', 60.0, 0, 200)
+        self.assertEqual(self.shop_metrics.snapshot()['clients']['put']['latency_buckets'][float('inf')], 1)
+
+    def test_snapshot_detached(self):
+        self.shop_metrics.record('items', 'get', 0.003, 120, 200)
+        snapshot = self.shop_metrics.snapshot()
+        self.shop_metrics.record('items', 'get', 0.003, 120, 200)
+        self.assertEqual(snapshot['items']['get']['count'], 1)
+        self.assertEqual(snapshot['items']['get']['status_codes'][200], 1)
+
+    def test_reset(self):
+        self.shop_metrics.record('items', 'get', 0.003, 120, 200)
+        self.shop_metrics.reset()
+        self.assertDictEqual(self.shop_metrics.snapshot(), {})
+
+    def tearDown(self):
+        self.shop_metrics = None
+
+
+if __name__ == '__main__':
+    unittest.main()
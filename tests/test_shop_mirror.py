@@ -0,0 +1,218 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from src.shop.shop_mirror import ShopMirror
+
+
+class TestShopMirror(unittest.TestCase):
+    def setUp(self):
+        self.database_simplified = {
+            'clients': [
+                {
+                    'id': 0,
+                    'name_first': 'John',
+                    'name_last': 'Rose',
+                    'email': 'john_rose@example.com'
+                },
+                {
+                    'id': 1,
+                    'name_first': 'Jane',
+                    'name_last': 'Blue',
+                    'email': 'jane_blue@example.com'
+                }
+            ],
+            'items': [
+                {
+                    'id': 0,
+                    'name': 'PlayStation 4 Slim',
+                    'value': 1288.00
+                },
+                {
+                    'id': 1,
+                    'name': 'Xbox One S',
+                    'value': 1049.99
+                }
+            ],
+            'orders': [
+                {
+                    'id': 0,
+                    'id_client': 0,
+                    'ids_items': [1, 1]
+                },
+                {
+                    'id': 1,
+                    'id_client': 1,
+                    'ids_items': [1, 0]
+                }
+            ]
+        }
+        mock_shop_database = MagicMock()
+        mock_shop_database.client_get.side_effect = lambda: list(self.database_simplified['clients'])
+        mock_shop_database.client_post.return_value = {'id': 2}
+        mock_shop_database.client_post_many.return_value = [{'id': 2}, ValueError("Email must be valid")]
+        mock_shop_database.item_get.side_effect = lambda: list(self.database_simplified['items'])
+        mock_shop_database.item_post.return_value = {'id': 2}
+        mock_shop_database.order_get.side_effect = lambda: list(self.database_simplified['orders'])
+        mock_shop_database.order_post.return_value = {'id': 2}
+        self.now = 0
+        self.shop_mirror = ShopMirror('http://example.com', max_staleness=10, clock=lambda: self.now)
+        self.shop_mirror.shop_database = mock_shop_database
+
+    def test_download_client(self):
+        self.assertDictEqual(self.shop_mirror.download_client(1), self.database_simplified['clients'][1])
+
+    def test_download_client_missing(self):
+        with self.assertRaisesRegex(LookupError, "^Client with such ID doesn't exist$"):
+            self.shop_mirror.download_client(999)
+
+    def test_download_item_wrong_type(self):
+        with self.assertRaisesRegex(TypeError, "^Item ID must be an integer$"):
+            self.shop_mirror.download_item('0')
+
+    def test_reads_served_locally(self):
+        self.shop_mirror.download_item(0)
+        self.shop_mirror.download_all_orders()
+        self.shop_mirror.get_client_orders(0)
+        self.shop_mirror.get_order_total(1)
+        self.shop_mirror.shop_database.item_get.assert_called_once_with()
+        self.shop_mirror.shop_database.order_get.assert_called_once_with()
+
+    def test_refresh_when_stale(self):
+        self.shop_mirror.download_item(0)
+        self.database_simplified['items'].append({'id': 2, 'name': 'Nintendo Switch', 'value': 1479.00})
+        self.now = 10
+        self.assertEqual(len(self.shop_mirror.download_all_items()), 2)
+        self.now = 11
+        self.assertEqual(len(self.shop_mirror.download_all_items()), 3)
+
+    def test_get_client_orders(self):
+        self.assertListEqual(self.shop_mirror.get_client_orders(1), [self.database_simplified['orders'][1]])
+
+    def test_get_order_total(self):
+        self.assertAlmostEqual(self.shop_mirror.get_order_total(0), 1049.99 * 2)
+
+    def test_get_orders_totals(self):
+        self.assertDictEqual(self.shop_mirror.get_orders_totals(), {0: 2099.98, 1: 2337.99})
+        self.shop_mirror.shop_database.item_iter.assert_not_called()
+
+    def test_register_client_write_through(self):
+        self.shop_mirror.refresh()
+        self.assertEqual(self.shop_mirror.register_client('Henry', 'Glenn', 'henry_glenn@example.com'), 2)
+        self.shop_mirror.shop_database.client_post.assert_called_once_with('Henry', 'Glenn', 'henry_glenn@example.com')
+        self.assertEqual(self.shop_mirror.download_client(2)['email'], 'henry_glenn@example.com')
+
+    def test_register_clients_write_through(self):
+        self.shop_mirror.refresh()
+        self.shop_mirror.register_clients([
+            ('Henry', 'Glenn', 'henry_glenn@example.com'),
+            ('Henry', 'Glenn', 'henry_glenn@examplecom')
+        ])
+        self.assertEqual(len(self.shop_mirror.download_all_clients()), 3)
+
+    def test_modify_item_write_through(self):
+        self.shop_mirror.refresh()
+        self.shop_mirror.modify_item(1, value=999.99)
+        self.shop_mirror.shop_database.item_put_patch.assert_called_once_with(1, None, 999.99)
+        self.assertDictEqual(self.shop_mirror.download_item(1), {'id': 1, 'name': 'Xbox One S', 'value': 999.99})
+
+    def test_remove_item_write_through(self):
+        self.shop_mirror.refresh()
+        self.shop_mirror.remove_item(0)
+        with self.assertRaises(LookupError):
+            self.shop_mirror.download_item(0)
+
+    def test_make_order_write_through(self):
+        self.shop_mirror.refresh()
+        self.shop_mirror.make_order(1, [0])
+        self.assertEqual(len(self.shop_mirror.get_client_orders(1)), 2)
+
+    def test_modify_order_write_through(self):
+        self.shop_mirror.refresh()
+        self.shop_mirror.modify_order(0, id_client=1)
+        self.assertListEqual(self.shop_mirror.get_client_orders(0), [])
+        self.assertEqual(len(self.shop_mirror.get_client_orders(1)), 2)
+
+    def test_remove_order_write_through(self):
+        self.shop_mirror.refresh()
+        self.shop_mirror.remove_order(1)
+        self.assertListEqual(self.shop_mirror.get_client_orders(1), [])
+
+    def test_failed_write_not_applied(self):
+        self.shop_mirror.refresh()
+        self.shop_mirror.shop_database.client_delete.side_effect = ConnectionError("Can't delete client from database")
+        with self.assertRaises(ConnectionError):
+            self.shop_mirror.remove_client(0)
+        self.assertEqual(self.shop_mirror.download_client(0)['id'], 0)
+
+    def block_client_get(self):
+        fetching = threading.Event()
+        release = threading.Event()
+        clients = list(self.database_simplified['clients'])
+
+        def client_get():
+            fetching.set()
+            release.wait(5)
+            return clients
+        self.shop_mirror.shop_database.client_get.side_effect = client_get
+        return fetching, release
+
+    def test_write_during_refresh_kept(self):
+        fetching, release = self.block_client_get()
+        thread = threading.Thread(target=self.shop_mirror.refresh)
+        thread.start()
+        self.assertTrue(fetching.wait(5))
+        self.shop_mirror.register_client('Henry', 'Glenn', 'henry_glenn@example.com')
+        self.shop_mirror.remove_item(0)
+        release.set()
+        thread.join()
+        self.assertEqual(self.shop_mirror.download_client(2)['email'], 'henry_glenn@example.com')
+        with self.assertRaises(LookupError):
+            self.shop_mirror.download_item(0)
+
+    def test_reads_not_blocked_by_refresh(self):
+        self.shop_mirror.refresh()
+        self.now = 11
+        fetching, release = self.block_client_get()
+        thread = threading.Thread(target=self.shop_mirror.download_client, args=(0,))
+        thread.start()
+        self.assertTrue(fetching.wait(5))
+        self.assertEqual(self.shop_mirror.download_client(1)['id'], 1)
+        release.set()
+        thread.join()
+        self.assertEqual(self.shop_mirror.shop_database.client_get.call_count, 2)
+
+    def test_refresh_failure_serves_snapshot(self):
+        self.shop_mirror.refresh()
+        self.now = 11
+        self.shop_mirror.shop_database.client_get.side_effect = ConnectionError("Can't get clients from database")
+        self.assertEqual(self.shop_mirror.download_client(0)['id'], 0)
+        self.assertEqual(self.shop_mirror.download_client(1)['id'], 1)
+        self.assertEqual(self.shop_mirror.shop_database.client_get.call_count, 2)
+        self.now = 16
+        self.shop_mirror.download_client(0)
+        self.assertEqual(self.shop_mirror.shop_database.client_get.call_count, 3)
+
+    def test_initial_refresh_failure_rate_limited(self):
+        self.shop_mirror.shop_database.client_get.side_effect = ConnectionError("Can't get clients from database")
+        for _ in range(2):
+            with self.assertRaisesRegex(ConnectionError, "^Can't get clients from database$"):
+                self.shop_mirror.download_client(0)
+        self.shop_mirror.shop_database.client_get.assert_called_once_with()
+
+    def test_background_refresh(self):
+        with patch('src.shop.shop_app.ShopDatabase', return_value=self.shop_mirror.shop_database):
+            shop_mirror = ShopMirror('http://example.com', refresh_interval=0.01)
+        deadline = time.monotonic() + 5
+        while shop_mirror.refreshed_at is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        shop_mirror.close()
+        self.assertIsNotNone(shop_mirror.refreshed_at)
+
+    def tearDown(self):
+        self.shop_mirror = None
+        self.database_simplified = None
+
+
+if __name__ == '__main__':
+    unittest.main()
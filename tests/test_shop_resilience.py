@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import Mock
+from src.shop.shop_resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_init_invalid_retries(self):
+        with self.assertRaisesRegex(ValueError, "^Retries must be a non-negative integer$"):
+            RetryPolicy(retries=-1)
+
+    def test_attempts(self):
+        retry_policy = RetryPolicy(retries=2)
+        self.assertEqual(retry_policy.attempts('get'), 3)
+        self.assertEqual(retry_policy.attempts('patch'), 1)
+        self.assertEqual(retry_policy.attempts('post'), 1)
+
+    def test_wait(self):
+        sleep = Mock()
+        retry_policy = RetryPolicy(backoff=0.1, backoff_max=0.3, sleep=sleep, jitter=lambda: 0.5)
+        for attempt in range(3):
+            retry_policy.wait(attempt)
+        self.assertListEqual([args[0][0] for args in sleep.call_args_list], [0.05, 0.1, 0.15])
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.circuit_breaker = CircuitBreaker(threshold=2, reset_timeout=10, clock=lambda: self.now)
+
+    def test_init_invalid_threshold(self):
+        with self.assertRaisesRegex(ValueError, "^Threshold must be a positive integer$"):
+            CircuitBreaker(threshold=0)
+
+    def test_opens_after_threshold(self):
+        self.circuit_breaker.failure()
+        self.circuit_breaker.before()
+        self.circuit_breaker.failure()
+        self.assertEqual(self.circuit_breaker.state, 'open')
+        with self.assertRaises(CircuitOpenError):
+            self.circuit_breaker.before()
+
+    def test_success_resets_failures(self):
+        self.circuit_breaker.failure()
+        self.circuit_breaker.success()
+        self.circuit_breaker.failure()
+        self.assertEqual(self.circuit_breaker.state, 'closed')
+
+    def test_half_open_single_probe(self):
+        self.circuit_breaker.failure()
+        self.circuit_breaker.failure()
+        self.now = 10
+        self.assertEqual(self.circuit_breaker.state, 'half-open')
+        self.circuit_breaker.before()
+        with self.assertRaises(CircuitOpenError):
+            self.circuit_breaker.before()
+        self.circuit_breaker.success()
+        self.assertEqual(self.circuit_breaker.state, 'closed')
+
+    def test_half_open_probe_failure(self):
+        self.circuit_breaker.failure()
+        self.circuit_breaker.failure()
+        self.now = 10
+        self.circuit_breaker.before()
+        self.circuit_breaker.failure()
+        self.assertEqual(self.circuit_breaker.state, 'open')
+
+    def test_shared_per_host(self):
+        circuit_breaker = CircuitBreaker.shared('http://shared.example.com/api')
+        self.assertIs(CircuitBreaker.shared('http://shared.example.com'), circuit_breaker)
+        self.assertIsNot(CircuitBreaker.shared('http://other.example.com'), circuit_breaker)
+
+    def tearDown(self):
+        self.circuit_breaker = None
+
+
+if __name__ == '__main__':
+    unittest.main()
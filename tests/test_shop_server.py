@@ -0,0 +1,128 @@
+import unittest
+import requests
+from src.shop.shop_database import ShopDatabase
+from src.shop.shop_server import BadRequest, ShopServer, ShopStore, parse_form
+
+
+class TestShopStore(unittest.TestCase):
+    def setUp(self):
+        self.shop_store = ShopStore()
+        self.shop_store.seed(2, 3, 1, 2)
+
+    def test_seed(self):
+        self.assertEqual(len(self.shop_store.page('clients')), 2)
+        self.assertListEqual(self.shop_store.page('orders'), [
+            {'id': 0, 'id_client': 0, 'ids_items': [0, 1]},
+            {'id': 1, 'id_client': 1, 'ids_items': [1, 2]}
+        ])
+
+    def test_get_missing(self):
+        with self.assertRaisesRegex(LookupError, "^Item with such ID doesn't exist$"):
+            self.shop_store.get('items', 3)
+
+    def test_insert_email_taken(self):
+        with self.assertRaisesRegex(ValueError, "^Email must be unique$"):
+            self.shop_store.insert('clients', {'name_first': 'A', 'name_last': 'B', 'email': 'client_0@example.com'})
+
+    def test_insert_order_missing_references(self):
+        with self.assertRaisesRegex(LookupError, "^Referenced entities don't exist$"):
+            self.shop_store.insert('orders', {'id_client': 9, 'ids_items': [0]})
+        with self.assertRaisesRegex(LookupError, "^Referenced entities don't exist$"):
+            self.shop_store.insert('orders', {'id_client': 0, 'ids_items': [0, 9]})
+
+    def test_update_email(self):
+        self.shop_store.update('clients', 0, {'email': 'new@example.com'})
+        self.shop_store.insert('clients', {'name_first': 'A', 'name_last': 'B', 'email': 'client_0@example.com'})
+        with self.assertRaisesRegex(ValueError, "^Email must be unique$"):
+            self.shop_store.update('clients', 1, {'email': 'new@example.com'})
+        self.shop_store.update('clients', 0, {'email': 'new@example.com'})
+
+    def test_update_order_reindexes(self):
+        self.shop_store.update('orders', 0, {'id_client': 1, 'ids_items': [2, 2]})
+        self.assertListEqual([order['id'] for order in self.shop_store.client_orders(1)], [0, 1])
+        self.assertListEqual(self.shop_store.client_orders(0), [])
+        self.assertListEqual(self.shop_store.item_orders(0), [])
+        self.assertListEqual(self.shop_store.item_orders(2), [0, 1])
+
+    def test_delete(self):
+        self.assertDictEqual(self.shop_store.delete('orders', 0), {'id': 0, 'id_client': 0, 'ids_items': [0, 1]})
+        self.assertListEqual(self.shop_store.item_orders(0), [])
+        self.assertListEqual([order['id'] for order in self.shop_store.page('orders')], [1])
+        with self.assertRaisesRegex(LookupError, "^Order with such ID doesn't exist$"):
+            self.shop_store.delete('orders', 0)
+
+    def test_delete_client_frees_email(self):
+        self.shop_store.delete('clients', 0)
+        self.assertEqual(self.shop_store.insert('clients', {'name_first': 'A', 'name_last': 'B', 'email': 'client_0@example.com'})['id'], 2)
+
+    def test_page(self):
+        self.assertListEqual([item['id'] for item in self.shop_store.page('items', 1, 1)], [1])
+        self.assertListEqual(self.shop_store.page('items', 5, 10), [])
+
+    def test_body_cached_per_version(self):
+        version, body = self.shop_store.body('items')
+        self.assertIs(self.shop_store.body('items')[1], body)
+        self.shop_store.update('items', 0, {'value': 5.0})
+        self.assertGreater(self.shop_store.body('items')[0], version)
+
+    def test_parse_form(self):
+        self.assertDictEqual(parse_form('orders', b'id_client=1&ids_items=2&ids_items=3', True), {'id_client': 1, 'ids_items': [2, 3]})
+        with self.assertRaisesRegex(BadRequest, "^Missing fields$"):
+            parse_form('items', b'name=Bread', True)
+        with self.assertRaisesRegex(BadRequest, "^Malformed fields$"):
+            parse_form('items', b'value=abc')
+
+
+class TestShopServer(unittest.TestCase):
+    def setUp(self):
+        self.shop_server = ShopServer().start()
+        self.shop_server.store.seed(3, 4, 2, 2)
+        self.shop_database = ShopDatabase(self.shop_server.api_url)
+
+    def tearDown(self):
+        self.shop_database.close()
+        self.shop_server.stop()
+
+    def test_crud(self):
+        id_client = self.shop_database.client_post('Jan', 'Nowak', 'jan@example.com')['id']
+        id_item = self.shop_database.item_post('Bread', 1.99)['id']
+        id_order = self.shop_database.order_post(id_client, [id_item, 0])['id']
+        self.assertDictEqual(self.shop_database.order_get(id_order), {'id': id_order, 'id_client': id_client, 'ids_items': [id_item, 0]})
+        self.shop_database.item_put_patch(id_item, value=2.49)
+        self.assertEqual(self.shop_database.item_get(id_item)['value'], 2.49)
+        self.shop_database.order_delete(id_order)
+        with self.assertRaisesRegex(LookupError, "^Order with such ID doesn't exist$"):
+            self.shop_database.order_get(id_order)
+
+    def test_conflict_and_missing(self):
+        with self.assertRaisesRegex(ValueError, "^Can't post this client \\(email must be unique\\)$"):
+            self.shop_database.client_post('Jan', 'Nowak', 'client_0@example.com')
+        with self.assertRaisesRegex(LookupError, "^Referenced entities don't exist$"):
+            self.shop_database.order_post(0, [99])
+        with self.assertRaisesRegex(LookupError, "^Client with such ID doesn't exist$"):
+            self.shop_database.client_delete(99)
+
+    def test_iter(self):
+        self.assertListEqual(list(self.shop_database.order_iter(4)), self.shop_server.store.page('orders'))
+
+    def test_collection_not_modified(self):
+        self.assertEqual(len(self.shop_database.item_get()), 4)
+        self.assertEqual(len(self.shop_database.item_get()), 4)
+        self.assertDictEqual(self.shop_database.metrics.snapshot()['items']['get']['status_codes'], {200: 1, 304: 1})
+
+    def test_bad_requests(self):
+        self.assertEqual(requests.get(self.shop_server.api_url + '/users/').status_code, 404)
+        self.assertEqual(requests.get(self.shop_server.api_url + '/items/abc').status_code, 404)
+        self.assertEqual(requests.get(self.shop_server.api_url + '/items/', params={'offset': 'x', 'limit': 1}).status_code, 400)
+        self.assertEqual(requests.post(self.shop_server.api_url + '/items/', data={'name': 'Bread'}).status_code, 400)
+
+    def test_rejected_body_keeps_connection_usable(self):
+        with requests.Session() as session:
+            self.assertEqual(session.post(self.shop_server.api_url + '/clients/5', data={'name_first': 'Jan'}).status_code, 404)
+            self.assertEqual(session.put(self.shop_server.api_url + '/items/', data={'name': 'Bread'}).status_code, 404)
+            self.assertEqual(session.post(self.shop_server.api_url + '/users/', data={'name': 'Bread'}).status_code, 404)
+            self.assertEqual(len(session.get(self.shop_server.api_url + '/clients/').json()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
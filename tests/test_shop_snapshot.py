@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from src.shop.shop_snapshot import CatalogSnapshot
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'items.snapshot')
+        self.items = [
+            {'id': 7, 'name': 'PlayStation 5', 'value': 2199.99},
+            {'id': 0, 'name': 'Xbox One S', 'value': 1049.99},
+            {'id': 3, 'name': 'Żelazko', 'value': 89.5}
+        ]
+        CatalogSnapshot.write(self.path, 'items', self.items)
+        self.catalog_snapshot = CatalogSnapshot(self.path, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.catalog_snapshot = None
+        self.directory.cleanup()
+
+    def test_get(self):
+        self.assertEqual(self.catalog_snapshot.kind, 'items')
+        for item in self.items:
+            self.assertDictEqual(self.catalog_snapshot.get(item['id']), item)
+
+    def test_get_missing(self):
+        for id_item in [-1, 1, 8]:
+            with self.assertRaisesRegex(LookupError, "^Item with such ID doesn't exist$"):
+                self.catalog_snapshot.get(id_item)
+
+    def test_ids_sorted(self):
+        self.assertListEqual(self.catalog_snapshot.ids.tolist(), [0, 3, 7])
+        self.assertEqual(len(self.catalog_snapshot), 3)
+        self.assertIn(3, self.catalog_snapshot)
+        self.assertNotIn(4, self.catalog_snapshot)
+
+    def test_iter(self):
+        self.assertListEqual(list(self.catalog_snapshot), sorted(self.items, key=lambda item: item['id']))
+
+    def test_price(self):
+        self.assertEqual(self.catalog_snapshot.price_cents(7), 219999)
+        self.assertEqual(self.catalog_snapshot.price(3), 89.5)
+
+    def test_clients(self):
+        clients = [{'id': 1, 'name_first': 'Łukasz', 'name_last': 'Nowak', 'email': 'lukasz@example.com'}]
+        path = os.path.join(self.directory.name, 'clients.snapshot')
+        CatalogSnapshot.write(path, 'clients', clients)
+        catalog_snapshot = CatalogSnapshot(path)
+        self.assertDictEqual(catalog_snapshot.get(1), clients[0])
+        with self.assertRaisesRegex(LookupError, "^Client with such ID doesn't exist$"):
+            catalog_snapshot.get(2)
+        with self.assertRaisesRegex(ValueError, "^Only item snapshots have prices$"):
+            catalog_snapshot.price(1)
+
+    def test_empty(self):
+        CatalogSnapshot.write(self.path, 'items', [])
+        self.assertTrue(self.catalog_snapshot.reload())
+        self.assertEqual(len(self.catalog_snapshot), 0)
+        self.assertNotIn(0, self.catalog_snapshot)
+
+    def test_write_invalid_kind(self):
+        with self.assertRaisesRegex(ValueError, "^Snapshot kind must be 'clients' or 'items'$"):
+            CatalogSnapshot.write(self.path, 'orders', [])
+
+    def test_open_invalid_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'\0' * 64)
+        with self.assertRaisesRegex(ValueError, "^File is not a catalog snapshot$"):
+            CatalogSnapshot(self.path)
+
+    def test_write_leaves_no_temporary_files(self):
+        self.assertListEqual(os.listdir(self.directory.name), ['items.snapshot'])
+
+    def test_reload_unchanged(self):
+        self.assertFalse(self.catalog_snapshot.reload())
+
+    def test_swap(self):
+        ids = self.catalog_snapshot.ids
+        CatalogSnapshot.write(self.path, 'items', [{'id': 0, 'name': 'Xbox Series S', 'value': 1349.99}])
+        self.assertDictEqual(self.catalog_snapshot.get(0), {'id': 0, 'name': 'Xbox One S', 'value': 1049.99})
+        self.now = 1
+        self.assertDictEqual(self.catalog_snapshot.get(0), {'id': 0, 'name': 'Xbox Series S', 'value': 1349.99})
+        self.assertNotIn(7, self.catalog_snapshot)
+        self.assertListEqual(ids.tolist(), [0, 3, 7])
+
+    def test_dump(self):
+        shop_database = MagicMock()
+        shop_database.item_iter.return_value = iter(self.items[:1])
+        CatalogSnapshot.dump(shop_database, self.path, 'items', page_size=500)
+        shop_database.item_iter.assert_called_once_with(500)
+        self.catalog_snapshot.reload()
+        self.assertListEqual(list(self.catalog_snapshot), self.items[:1])
+
+
+if __name__ == '__main__':
+    unittest.main()
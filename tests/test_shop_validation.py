@@ -0,0 +1,53 @@
+import unittest
+from src.shop import shop_validation
+
+
+class TestShopValidation(unittest.TestCase):
+    def test_value_invalid(self):
+        self.assertFalse(shop_validation.value_invalid(1049.99))
+        self.assertFalse(shop_validation.value_invalid(0.1))
+        self.assertFalse(shop_validation.value_invalid(1e16))
+        self.assertTrue(shop_validation.value_invalid(2199.999))
+        self.assertTrue(shop_validation.value_invalid(0.001))
+
+    def test_validate_clients(self):
+        errors = shop_validation.validate_clients([
+            ('Harry', 'Red', 'harry_red@example.com'),
+            ('Harry', '', 'harry_red@example.com'),
+            {'name_first': 'Henry', 'name_last': 'Glenn', 'email': 'henry_glenn@examplecom'},
+            ('Jane', 'Blue', 'harry_red@example.com'),
+            ('Jane', 'Blue')
+        ])
+        self.assertListEqual([index for index, _ in errors], [1, 2, 3, 4])
+        self.assertEqual(str(errors[0][1]), "Both names must be non-empty")
+        self.assertEqual(str(errors[1][1]), "Email must be valid")
+        self.assertEqual(str(errors[2][1]), "Can't post this client (email must be unique)")
+        self.assertIsInstance(errors[3][1], TypeError)
+
+    def test_validate_items(self):
+        errors = shop_validation.validate_items([('PlayStation 5', 2199.99), ('Xbox Series X', 2199.999), ('', 1.0)])
+        self.assertListEqual([(index, str(error)) for index, error in errors], [
+            (1, "Value must have no more than 2 decimal places"),
+            (2, "Name must not be empty")
+        ])
+
+    def test_validate_orders(self):
+        errors = shop_validation.validate_orders([(0, [1, 2]), (0, []), (1, [1, '2'])])
+        self.assertListEqual([(index, type(error)) for index, error in errors], [(1, ValueError), (2, TypeError)])
+
+    def test_validate_orders_references(self):
+        errors = shop_validation.validate_orders([
+            (0, [1, 2]),
+            {'id_client': 5, 'ids_items': [1]},
+            (0, [3]),
+            (0, [])
+        ], ids_clients={0}, ids_items=[1, 2])
+        self.assertListEqual([(index, type(error)) for index, error in errors], [
+            (1, LookupError),
+            (2, LookupError),
+            (3, ValueError)
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
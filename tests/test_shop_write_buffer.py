@@ -0,0 +1,87 @@
+import time
+import unittest
+from unittest.mock import MagicMock, Mock, call
+from src.shop.shop_write_buffer import WriteBuffer
+
+
+class TestWriteBuffer(unittest.TestCase):
+    def setUp(self):
+        self.shop_database = MagicMock()
+        self.write_buffer = WriteBuffer(self.shop_database, window=60)
+
+    def test_put_merges_fields(self):
+        self.write_buffer.put('item', 1, {'name': 'Xbox Series S', 'value': None})
+        self.write_buffer.put('item', 1, {'name': None, 'value': 1349.99})
+        self.write_buffer.put('item', 1, {'name': None, 'value': 1299.99})
+        self.assertEqual(self.write_buffer.pending(), 1)
+        self.write_buffer.flush()
+        self.shop_database.item_put_patch.assert_called_once_with(1, name='Xbox Series S', value=1299.99)
+
+    def test_put_separate_entities(self):
+        self.write_buffer.put('client', 0, {'email': 'john_rose@example.org'})
+        self.write_buffer.put('order', 0, {'ids_items': [1]})
+        self.write_buffer.put('client', 1, {'name_last': 'Green'})
+        self.write_buffer.flush()
+        self.shop_database.client_put_patch.assert_has_calls([
+            call(0, email='john_rose@example.org'),
+            call(1, name_last='Green')
+        ])
+        self.shop_database.order_put_patch.assert_called_once_with(0, ids_items=[1])
+
+    def test_put_validates(self):
+        with self.assertRaisesRegex(ValueError, "^Email must be valid$"):
+            self.write_buffer.put('client', 0, {'email': 'john_rose@examplecom'})
+        with self.assertRaisesRegex(AttributeError, "^Patch must have at least one attribute$"):
+            self.write_buffer.put('item', 0, {'name': None, 'value': None})
+        self.assertEqual(self.write_buffer.pending(), 0)
+
+    def test_discard(self):
+        self.write_buffer.put('item', 1, {'value': 1349.99})
+        self.write_buffer.discard('item', 1)
+        self.write_buffer.flush()
+        self.shop_database.item_put_patch.assert_not_called()
+
+    def test_flush_failures(self):
+        error = LookupError("Item with such ID doesn't exist")
+        self.shop_database.item_put_patch.side_effect = [error, {}]
+        self.write_buffer.put('item', 999, {'value': 1.99})
+        self.write_buffer.put('item', 1, {'value': 2.99})
+        self.assertListEqual(self.write_buffer.flush(), [('item', 999, {'value': 1.99}, error)])
+        self.assertListEqual(self.write_buffer.failures, [('item', 999, {'value': 1.99}, error)])
+        self.assertEqual(self.shop_database.item_put_patch.call_count, 2)
+
+    def test_flush_on_error(self):
+        on_error = Mock()
+        error = ConnectionError("Can't patch item in database")
+        self.shop_database.item_put_patch.side_effect = error
+        self.write_buffer.on_error = on_error
+        self.write_buffer.put('item', 1, {'value': 1.99})
+        self.write_buffer.flush()
+        on_error.assert_called_once_with('item', 1, {'value': 1.99}, error)
+        self.assertListEqual(self.write_buffer.failures, [])
+
+    def test_flush_failure_hooks(self):
+        hook = Mock()
+        error = LookupError("Order with such ID doesn't exist")
+        self.shop_database.order_put_patch.side_effect = error
+        self.write_buffer.hooks_failure.append(hook)
+        self.write_buffer.on_error = Mock()
+        self.write_buffer.put('order', 1, {'id_client': 0})
+        self.write_buffer.flush()
+        hook.assert_called_once_with('order', 1, {'id_client': 0}, error)
+        self.write_buffer.on_error.assert_called_once_with('order', 1, {'id_client': 0}, error)
+
+    def test_flush_after_window(self):
+        write_buffer = WriteBuffer(self.shop_database, window=0.01)
+        write_buffer.put('item', 1, {'value': 1.99})
+        deadline = time.monotonic() + 5
+        while not self.shop_database.item_put_patch.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.shop_database.item_put_patch.assert_called_once_with(1, value=1.99)
+
+    def tearDown(self):
+        self.write_buffer = None
+
+
+if __name__ == '__main__':
+    unittest.main()